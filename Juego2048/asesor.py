@@ -0,0 +1,256 @@
+"""Asesor Monte Carlo: sugiere la columna donde colocar el próximo bloque
+
+Para cada columna libre coloca el próximo número en una copia del Tablero y
+juega desde ahí muchas partidas aleatorias cortas (rollouts): columnas al
+azar entre las libres y números 2, 4 u 8 al azar, hasta `profundidad` jugadas
+o hasta llenar el tablero. El puntaje de un rollout es la cantidad de
+jugadas que sobrevivió más las celdas libres que quedaron al final; la
+columna con mejor promedio es la sugerencia.
+
+Los rollouts se reparten entre los procesos de un ProcessPoolExecutor. Los
+resultados se acumulan en una tabla de transposición (cache LRU) indexada por
+el tablero resultante de cada jugada: si dos columnas llevan al mismo
+tablero, o se vuelve a pedir una sugerencia para el mismo estado, solo se
+simulan los rollouts que falten. La tabla es una sola por asesor y vive en el
+proceso principal; los procesos solo simulan y devuelven sumas.
+
+No usa pygame. Uso sin ventana (el asesor juega una partida solo):
+    python asesor.py [--rollouts 200] [--profundidad 30] [--procesos N]
+        [--jugadas 30] [--semilla 1] [--filas 6] [--columnas 7]
+"""
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from tablero import Tablero
+
+NUMEROS = (2, 4, 8)  # Los mismos que Juego.generar_numero
+
+
+def simular_rollouts(tarea: Tuple[Tablero, int, int, int]) -> Tuple[int, int, int]:
+    """
+    Juega rollouts aleatorios desde un tablero (se ejecuta en los procesos del pool)
+
+    Args:
+        tarea: (tablero, cantidad de rollouts, profundidad máxima, semilla)
+
+    Returns:
+        (suma de puntajes, cantidad de rollouts, colocaciones simuladas)
+    """
+    tablero, cantidad, profundidad, semilla = tarea
+    rng = random.Random(semilla)
+    elegir = rng.choice
+    suma = 0
+    colocaciones = 0
+    for _ in range(cantidad):
+        copia = tablero.copiar()
+        jugadas = 0
+        while jugadas < profundidad:
+            libres = copia.columnas_libres()
+            if not libres:
+                break
+            copia.colocar(elegir(libres), elegir(NUMEROS))
+            jugadas += 1
+        suma += jugadas + copia.celdas_libres()
+        colocaciones += jugadas
+    return suma, cantidad, colocaciones
+
+
+def tablero_desde_juego(juego) -> Tablero:
+    """Copia el estado de un Juego (o JuegoCompacto) a un Tablero con sus mismas reglas"""
+    tablero = getattr(juego, "tablero", None)
+    if tablero is not None:
+        return tablero.copiar()
+    tablero = Tablero(juego.filas, juego.columnas, juego.contexto_multiplicacion)
+    for fila, bloques in enumerate(juego.cuadricula):
+        for col, bloque in enumerate(bloques):
+            if bloque is not None:
+                tablero.poner(fila, col, bloque.valor)
+    return tablero
+
+
+class AsesorMonteCarlo:
+    """Evalúa cada columna con rollouts en paralelo y una tabla de transposición compartida"""
+
+    def __init__(self, rollouts: int = 200, profundidad: int = 30, procesos: Optional[int] = None,
+                 semilla: Optional[int] = None, max_entradas: int = 100_000):
+        """
+        Args:
+            rollouts: Rollouts por columna (los que ya estén en la tabla no se repiten)
+            profundidad: Jugadas máximas de cada rollout
+            procesos: Procesos del pool (1 = todo en este proceso; None = uno por núcleo).
+                Desde un programa con ventana usar 1: los procesos del pool pueden
+                reimportar el módulo principal y sus imports de pygame
+            semilla: Semilla de los rollouts (None = aleatoria)
+            max_entradas: Tableros guardados en la tabla de transposición
+        """
+        if rollouts < 1:
+            raise ValueError("rollouts debe ser al menos 1")
+        self.rollouts = rollouts
+        self.profundidad = profundidad
+        self.procesos = procesos or os.cpu_count() or 1
+        self.max_entradas = max_entradas
+        self._rng = random.Random(semilla)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # tablero empaquetado -> [suma de puntajes, rollouts]; LRU
+        self._tabla: "OrderedDict[bytes, List[int]]" = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def sugerir(self, juego) -> Dict:
+        """Evalúa el estado actual de un Juego con su proximo_numero (ver evaluar)"""
+        return self.evaluar(tablero_desde_juego(juego), juego.proximo_numero)
+
+    def evaluar(self, tablero: Tablero, proximo_numero: int) -> Dict:
+        """
+        Evalúa todas las columnas libres para colocar proximo_numero
+
+        Returns:
+            dict con columna (mejor columna, None si el tablero está lleno),
+            puntajes (columna -> puntaje promedio), rollouts (simulados en esta
+            llamada), rollouts_en_cache (reutilizados de la tabla),
+            colocaciones, segundos, rollouts_por_segundo y colocaciones_por_segundo
+        """
+        inicio = time.perf_counter()
+        claves: Dict[int, bytes] = {}
+        tareas: List[Tuple[bytes, Tuple[Tablero, int, int, int]]] = []
+        en_cache = 0
+        pedidos: Dict[bytes, int] = {}  # Rollouts ya pedidos por clave en esta llamada
+        for columna in tablero.columnas_libres():
+            resultado = tablero.copiar()
+            resultado.colocar(columna, proximo_numero)
+            clave = resultado.empaquetar()
+            claves[columna] = clave
+
+            entrada = self._tabla.get(clave)
+            if entrada is not None:
+                self._tabla.move_to_end(clave)
+                self.aciertos += 1
+            else:
+                self.fallos += 1
+            hechos = (entrada[1] if entrada is not None else 0) + pedidos.get(clave, 0)
+            faltan = max(0, self.rollouts - hechos)
+            en_cache += min(hechos, self.rollouts)
+            pedidos[clave] = pedidos.get(clave, 0) + faltan
+            # Un bloque por proceso para repartir los rollouts de la columna
+            bloques = min(self.procesos, faltan)
+            for i in range(bloques):
+                cantidad = faltan // bloques + (1 if i < faltan % bloques else 0)
+                tareas.append((clave, (resultado, cantidad, self.profundidad, self._rng.getrandbits(32))))
+
+        simulados = 0
+        colocaciones = 0
+        resultados = self._ejecutar([tarea for _, tarea in tareas])
+        for (clave, _), (suma, cantidad, colocadas) in zip(tareas, resultados):
+            entrada = self._tabla.get(clave)
+            if entrada is None:
+                entrada = self._tabla[clave] = [0, 0]
+            entrada[0] += suma
+            entrada[1] += cantidad
+            simulados += cantidad
+            colocaciones += colocadas
+
+        puntajes = {}
+        for columna, clave in claves.items():
+            suma, cantidad = self._tabla[clave]
+            puntajes[columna] = suma / cantidad if cantidad else 0.0
+        while len(self._tabla) > self.max_entradas:
+            self._tabla.popitem(last=False)
+
+        segundos = time.perf_counter() - inicio
+        return {
+            "columna": max(puntajes, key=puntajes.get) if puntajes else None,
+            "puntajes": puntajes,
+            "rollouts": simulados,
+            "rollouts_en_cache": en_cache,
+            "colocaciones": colocaciones,
+            "segundos": segundos,
+            "rollouts_por_segundo": simulados / segundos if segundos > 0 else 0.0,
+            "colocaciones_por_segundo": colocaciones / segundos if segundos > 0 else 0.0,
+        }
+
+    def _ejecutar(self, tareas: List[Tuple[Tablero, int, int, int]]) -> List[Tuple[int, int, int]]:
+        if self.procesos == 1 or len(tareas) <= 1:
+            return [simular_rollouts(tarea) for tarea in tareas]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.procesos)
+        return list(self._pool.map(simular_rollouts, tareas))
+
+    def estadisticas(self) -> Dict[str, float]:
+        """Retorna los contadores de uso de la tabla de transposición"""
+        total = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._tabla),
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+        }
+
+    def cerrar(self):
+        """Termina los procesos del pool"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def _opcion(argumentos: List[str], nombre: str, defecto: int) -> int:
+    if nombre in argumentos:
+        return int(argumentos[argumentos.index(nombre) + 1])
+    return defecto
+
+
+def main():
+    argumentos = sys.argv[1:]
+    semilla = _opcion(argumentos, "--semilla", 1)
+    asesor = AsesorMonteCarlo(
+        rollouts=_opcion(argumentos, "--rollouts", 200),
+        profundidad=_opcion(argumentos, "--profundidad", 30),
+        procesos=_opcion(argumentos, "--procesos", os.cpu_count() or 1),
+        semilla=semilla,
+    )
+    tablero = Tablero(_opcion(argumentos, "--filas", 6), _opcion(argumentos, "--columnas", 7))
+    rng = random.Random(semilla)
+    proximo = rng.choice(NUMEROS)
+
+    rollouts = colocaciones = 0
+    segundos = 0.0
+    jugadas = 0
+    try:
+        while jugadas < _opcion(argumentos, "--jugadas", 30):
+            sugerencia = asesor.evaluar(tablero, proximo)
+            if sugerencia["columna"] is None:
+                print("Tablero lleno")
+                break
+            tablero.colocar(sugerencia["columna"], proximo)
+            jugadas += 1
+            rollouts += sugerencia["rollouts"]
+            colocaciones += sugerencia["colocaciones"]
+            segundos += sugerencia["segundos"]
+            print(
+                f"jugada {jugadas:>3}: {proximo:>2} en columna {sugerencia['columna']} "
+                f"(puntaje {sugerencia['puntajes'][sugerencia['columna']]:.1f}, "
+                f"{sugerencia['rollouts_por_segundo']:,.0f} rollouts/s)"
+            )
+            proximo = rng.choice(NUMEROS)
+    finally:
+        asesor.cerrar()
+
+    maximo = max(tablero.celdas)
+    print(
+        f"{jugadas} jugadas, bloque máximo {1 << maximo if maximo else 0}, "
+        f"{tablero.celdas_libres()} celdas libres"
+    )
+    if segundos > 0:
+        print(
+            f"{rollouts} rollouts ({colocaciones} colocaciones) en {segundos:.2f} s con {asesor.procesos} "
+            f"proceso(s): {rollouts / segundos:,.0f} rollouts/s, {colocaciones / segundos:,.0f} colocaciones/s"
+        )
+    print(f"Tabla de transposición: {asesor.estadisticas()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Benchmarks de la lógica del juego sobre cuadrículas grandes (sin ventana visible)
+
+Uso:
+    python benchmark.py [filtro]
+
+Cada caso compara la implementación anterior con la actual y muestra la
+mediana de varias rondas. Solo se mide la operación: armar la cuadrícula de
+cada ronda queda fuera del tiempo.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from game import Juego  # noqa: E402  (constants abre la ventana al importarse)
+from memento import Memento  # noqa: E402
+from observer import Bloque_Observer  # noqa: E402
+
+RONDAS = 15
+TAMANOS = [(6, 7), (64, 64), (200, 200), (2000, 3)]
+
+
+class JuegoBarridos(Juego):
+    """Juego con la gravedad anterior: barridos completos hasta que nada se mueva"""
+
+    def aplicar_gravedad(self):
+        movimiento = True
+        while movimiento:
+            movimiento = False
+            for fila in range(self.filas - 2, -1, -1):
+                for col in range(self.columnas):
+                    if self.cuadricula[fila][col] is not None and self.cuadricula[fila + 1][col] is None:
+                        bloque = self.cuadricula[fila][col]
+                        self.cuadricula[fila + 1][col] = bloque
+                        self.cuadricula[fila][col] = None
+                        bloque.actualizar_posicion(fila + 1, col)
+                        movimiento = True
+        self.columnas_pendientes.clear()
+
+
+class JuegoRecursivo(Juego):
+    """Juego con la resolución de fusiones anterior: una llamada recursiva por fusión"""
+
+    def configurar_observers(self, nuevo_bloque: Bloque_Observer):
+        vecinos_iguales = [
+            vecino for vecino in self.obtener_bloques_contiguos(nuevo_bloque)
+            if nuevo_bloque.tiene_valor_igual(vecino)
+        ]
+        if vecinos_iguales:
+            nuevo_bloque.valor = self.contexto_multiplicacion.calcular_nuevo_valor(
+                nuevo_bloque.valor, len(vecinos_iguales)
+            )
+        for vecino in vecinos_iguales:
+            vecino.agregar_observer(nuevo_bloque)
+            nuevo_bloque.agregar_observer(vecino)
+            vecino.actualizar(nuevo_bloque, es_nuevo=False)
+        if vecinos_iguales:
+            self.aplicar_gravedad()
+            self.configurar_observers(nuevo_bloque)
+        else:
+            nuevo_bloque.notificar_observers(es_nuevo=True)
+
+
+class CaretakerLista:
+    """Caretaker anterior: lista que descarta el estado más viejo con pop(0)"""
+
+    def __init__(self, max_historial=20):
+        self._historial: List[Memento] = []
+        self._max_historial = max_historial
+
+    def guardar(self, memento: Memento):
+        self._historial.append(memento)
+        if len(self._historial) > self._max_historial:
+            self._historial.pop(0)
+
+    def deshacer(self):
+        return self._historial.pop() if self._historial else None
+
+    def tiene_historial(self) -> bool:
+        return len(self._historial) > 0
+
+
+class JuegoCopiaProfunda(Juego):
+    """Juego con el historial anterior: copia de todos los bloques por memento y CaretakerLista"""
+
+    def __init__(self, filas: int, columnas: int, max_historial: int = 20):
+        super().__init__(filas, columnas, max_historial)
+        self.caretaker = CaretakerLista(max_historial)
+
+    def crear_memento(self) -> Memento:
+        return Memento(
+            [[None if b is None else Bloque_Observer(b.valor, b.fila, b.columna, self, b.es_nuevo) for b in fila]
+             for fila in self.cuadricula],
+            self.proximo_numero,
+        )
+
+    def restaurar_memento(self, memento: Memento):
+        if memento is None:
+            return
+        self.cuadricula, self.proximo_numero = memento.obtener_estado()
+        for fila in self.cuadricula:
+            for bloque in fila:
+                if bloque is not None:
+                    bloque.juego = self
+
+
+def cuadricula_llena(clase, filas: int, columnas: int, semilla: int) -> Juego:
+    """Juego con todas las celdas ocupadas por bloques de valor aleatorio"""
+    rng = random.Random(semilla)
+    juego = clase(filas, columnas)
+    for fila in range(filas):
+        for col in range(columnas):
+            juego.cuadricula[fila][col] = Bloque_Observer(rng.choice((2, 4, 8)), fila, col, juego)
+    return juego
+
+
+def huecos_dispersos(clase, filas: int, columnas: int, semilla: int) -> Juego:
+    """Cuadrícula llena con un 10% de bloques eliminados en todas las columnas"""
+    juego = cuadricula_llena(clase, filas, columnas, semilla)
+    rng = random.Random(semilla + 1)
+    for _ in range(filas * columnas // 10):
+        bloque = juego.cuadricula[rng.randrange(filas)][rng.randrange(columnas)]
+        if bloque is not None:
+            juego.eliminar_bloque(bloque)
+    return juego
+
+
+def huecos_fusion(clase, filas: int, columnas: int, semilla: int) -> Juego:
+    """Cuadrícula llena tras una fusión: se eliminan los vecinos de un bloque en la mitad"""
+    juego = cuadricula_llena(clase, filas, columnas, semilla)
+    fila, col = filas // 2, columnas // 2
+    for vecino in juego.obtener_bloques_contiguos(juego.cuadricula[fila][col]):
+        juego.eliminar_bloque(vecino)
+    return juego
+
+
+def columna_en_cadena(clase, filas: int, columnas: int, semilla: int) -> Juego:
+    """Columna del medio con 2, 4, 8... de arriba hacia abajo: un 2 encima dispara filas - 1 fusiones"""
+    juego = clase(filas, columnas)
+    col = columnas // 2
+    for fila in range(1, filas):
+        juego.cuadricula[fila][col] = Bloque_Observer(2 ** fila, fila, col, juego)
+    return juego
+
+
+def soltar_dos(juego: Juego):
+    """Coloca un 2 arriba de la columna del medio y resuelve sus fusiones"""
+    col = juego.columnas // 2
+    bloque = Bloque_Observer(2, 0, col, juego, es_nuevo=True)
+    juego.cuadricula[0][col] = bloque
+    juego.configurar_observers(bloque)
+
+
+def media_cuadricula(clase, filas: int, columnas: int, semilla: int) -> Juego:
+    """Mitad de abajo llena de bloques, historial de 10.000 jugadas ya lleno"""
+    rng = random.Random(semilla)
+    juego = clase(filas, columnas, max_historial=10_000)
+    for fila in range(filas // 2, filas):
+        for col in range(columnas):
+            juego.cuadricula[fila][col] = Bloque_Observer(rng.choice((2, 4, 8)), fila, col, juego)
+    memento = juego.crear_memento()
+    for _ in range(10_000):
+        juego.caretaker.guardar(memento)
+    return juego
+
+
+def jugar_y_deshacer(juego: Juego):
+    """100 jugadas (cada una guarda un memento) y luego 100 deshacer"""
+    rng = random.Random(0)
+    for _ in range(100):
+        juego.colocar_bloque(rng.randrange(juego.columnas))
+    for _ in range(100):
+        juego.deshacer_jugada()
+
+
+# nombre -> (armar cuadrícula, operación medida, clase anterior, clase actual, tamaños)
+CASOS: Dict[str, Tuple[Callable[..., Juego], Callable[[Juego], None], type, type, List[Tuple[int, int]]]] = {
+    "gravedad_huecos_dispersos": (
+        huecos_dispersos, lambda juego: juego.aplicar_gravedad(), JuegoBarridos, Juego, TAMANOS,
+    ),
+    "gravedad_tras_fusion": (huecos_fusion, lambda juego: juego.aplicar_gravedad(), JuegoBarridos, Juego, TAMANOS),
+    "fusion_en_cadena": (columna_en_cadena, soltar_dos, JuegoRecursivo, Juego, TAMANOS),
+    # Copiar toda la cuadrícula en cada jugada no escala: sin 200x200 ni 2000x3
+    "historial_10000_jugadas": (
+        media_cuadricula, jugar_y_deshacer, JuegoCopiaProfunda, Juego, [(6, 7), (32, 32), (64, 64)],
+    ),
+}
+
+
+def medir(armar: Callable[..., Juego], clase, operacion: Callable[[Juego], None],
+          filas: int, columnas: int) -> float:
+    """Mediana en segundos de RONDAS ejecuciones de la operación sobre cuadrículas recién armadas"""
+    tiempos: List[float] = []
+    for ronda in range(RONDAS):
+        juego = armar(clase, filas, columnas, ronda)
+        inicio = time.perf_counter()
+        operacion(juego)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+
+def formatear(segundos: float) -> str:
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:.2f} ms"
+    return f"{segundos * 1e6:.1f} us"
+
+
+def main():
+    filtro = sys.argv[1] if len(sys.argv) > 1 else ""
+    print(f"{'caso':<42} {'anterior':>12} {'actual':>12} {'mejora':>8}")
+    for nombre, (armar, operacion, anterior, actual, tamanos) in CASOS.items():
+        if filtro not in nombre:
+            continue
+        for filas, columnas in tamanos:
+            t_actual = medir(armar, actual, operacion, filas, columnas)
+            try:
+                t_anterior = medir(armar, anterior, operacion, filas, columnas)
+            except RecursionError:
+                print(f"{nombre + f'[{filas}x{columnas}]':<42} {'RecursionError':>12} {formatear(t_actual):>12}")
+                continue
+            print(
+                f"{nombre + f'[{filas}x{columnas}]':<42} {formatear(t_anterior):>12} "
+                f"{formatear(t_actual):>12} {t_anterior / t_actual:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import pygame
+
+
+class CacheTextos:
+    """Cache LRU de superficies de texto con clave (fuente, texto, color, antialias)
+
+    Los números de los bloques y los textos fijos se repiten en cada frame,
+    así que se renderizan una sola vez. La cache se limita por cantidad de
+    entradas y por bytes de píxeles, y cuenta aciertos y fallos.
+    """
+
+    def __init__(self, max_entradas: int = 256, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Args:
+            max_entradas: Cantidad máxima de superficies guardadas
+            max_bytes: Memoria máxima (en bytes de píxeles) de las superficies
+        """
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self._superficies: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self) -> int:
+        return len(self._superficies)
+
+    @staticmethod
+    def _bytes_de(superficie: pygame.Surface) -> int:
+        return superficie.get_pitch() * superficie.get_height()
+
+    def render(self, fuente: pygame.font.Font, texto: str, color, antialias: bool = True) -> pygame.Surface:
+        """Equivalente a fuente.render(texto, antialias, color), usando la cache"""
+        clave = (fuente, texto, tuple(color), antialias)
+        superficie = self._superficies.get(clave)
+        if superficie is not None:
+            self._superficies.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+
+        self.fallos += 1
+        superficie = fuente.render(texto, antialias, color)
+        self._superficies[clave] = superficie
+        self.bytes_usados += self._bytes_de(superficie)
+        # Descartar las menos usadas recientemente (siempre queda la nueva)
+        while len(self._superficies) > 1 and (
+            len(self._superficies) > self.max_entradas or self.bytes_usados > self.max_bytes
+        ):
+            _, vieja = self._superficies.popitem(last=False)
+            self.bytes_usados -= self._bytes_de(vieja)
+        return superficie
+
+    def estadisticas(self) -> Dict[str, float]:
+        """Retorna los contadores de uso de la cache"""
+        total = self.aciertos + self.fallos
+        return {
+            "entradas": len(self._superficies),
+            "bytes": self.bytes_usados,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+        }
+
+    def limpiar(self):
+        """Vacía la cache y reinicia los contadores"""
+        self._superficies.clear()
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+
+# Cache compartida por todo el juego
+cache_textos = CacheTextos()
+
+
+def render_texto(fuente: pygame.font.Font, texto: str, color, antialias: bool = True) -> pygame.Surface:
+    """Renderiza texto usando la cache compartida"""
+    return cache_textos.render(fuente, texto, color, antialias)
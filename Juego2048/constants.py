@@ -17,6 +17,7 @@ NEGRO = (0, 0, 0)
 GRIS = (200, 200, 200)
 GRIS_OSCURO = (100, 100, 100)
 ROJO = (255, 0, 0)
+VERDE = (0, 170, 0)
 
 # Paleta de colores para bloques (estilo 2048)
 COLOR_2 = (238, 228, 218)
@@ -1,25 +1,42 @@
 import random
 import pygame
-from typing import List, Optional
+from collections import deque
+from typing import Dict, List, Optional, Tuple
 
 from constants import (
     FILAS, COLUMNAS, TAMANO_CELDA, ANCHO, ALTO,
-    BLANCO, NEGRO, GRIS, GRIS_OSCURO, ROJO,
+    BLANCO, NEGRO, GRIS, GRIS_OSCURO, ROJO, VERDE,
     COLOR_2, COLOR_4, COLOR_8, COLOR_16, COLOR_32, COLOR_64,
     COLOR_128, COLOR_256, COLOR_512, COLOR_1024, COLOR_2048,
     pantalla, fuente, fuente_pequena
 )
+from cache_textos import render_texto
 from memento import Memento, Caretaker
 from strategy import ContextoMultiplicacion
 from observer import Bloque_Observer
+from tablero import Tablero
 
 
 class Juego:
-    def __init__(self):
-        self.cuadricula: List[List[Optional[Bloque_Observer]]] = [[None for _ in range(COLUMNAS)] for _ in range(FILAS)]
+    def __init__(self, filas: int = FILAS, columnas: int = COLUMNAS, max_historial: int = 20):
+        """
+        Args:
+            filas: Cantidad de filas de la cuadrícula (la ventana se dibuja para FILAS)
+            columnas: Cantidad de columnas de la cuadrícula (la ventana se dibuja para COLUMNAS)
+            max_historial: Cantidad de jugadas que se pueden deshacer
+        """
+        self.filas = filas
+        self.columnas = columnas
+        # Columnas con huecos para aplicar_gravedad: columna -> (fila más baja, fila más alta)
+        self.columnas_pendientes: Dict[int, Tuple[int, int]] = {}
+        # Estado inmutable de cada columna (valores de abajo hacia arriba) para los mementos;
+        # las columnas de columnas_cambiadas se vuelven a armar en el próximo crear_memento
+        self._columnas_estado: List[Tuple[int, ...]] = [() for _ in range(columnas)]
+        self.columnas_cambiadas = set(range(columnas))
+        self.cuadricula: List[List[Optional[Bloque_Observer]]] = [[None for _ in range(columnas)] for _ in range(filas)]
         self.cayendo = False
         self.proximo_numero = self.generar_numero()  # Número que se colocará
-        self.caretaker = Caretaker()  # Maneja el historial de estados
+        self.caretaker = Caretaker(max_historial)  # Maneja el historial de estados
         self.contexto_multiplicacion = ContextoMultiplicacion()  # Patrón Estrategia para multiplicación
 
     def generar_numero(self):
@@ -27,21 +44,26 @@ class Juego:
         return random.choice([2, 4, 8])
 
     def crear_memento(self) -> Memento:
-        """Crea un memento con el estado actual del juego"""
-        # Hacer una copia profunda de la cuadrícula
-        cuadricula_copia = []
-        for fila in self.cuadricula:
-            fila_copia = []
-            for bloque in fila:
+        """Crea un memento con el estado actual del juego
+
+        El estado es una tupla con una tupla inmutable de valores por columna
+        (de abajo hacia arriba, las columnas están compactadas). Solo se
+        arman de nuevo las columnas que cambiaron desde el memento anterior;
+        las demás son las mismas tuplas, compartidas entre mementos, así que
+        cada entrada del historial ocupa poco más que las columnas tocadas.
+        """
+        cuadricula = self.cuadricula
+        for col in self.columnas_cambiadas:
+            valores = []
+            for fila in range(self.filas - 1, -1, -1):
+                bloque = cuadricula[fila][col]
                 if bloque is None:
-                    fila_copia.append(None)
-                else:
-                    # Crear una copia del bloque
-                    bloque_copia = Bloque_Observer(bloque.valor, bloque.fila, bloque.columna, self, bloque.es_nuevo)
-                    fila_copia.append(bloque_copia)
-            cuadricula_copia.append(fila_copia)
+                    break
+                valores.append(bloque.valor)
+            self._columnas_estado[col] = tuple(valores)
+        self.columnas_cambiadas.clear()
 
-        return Memento(cuadricula_copia, self.proximo_numero)
+        return Memento(tuple(self._columnas_estado), self.proximo_numero)
 
     def restaurar_memento(self, memento: Memento):
         """Restaura el estado del juego desde un memento"""
@@ -50,20 +72,24 @@ class Juego:
 
         cuadricula_estado, proximo_numero = memento.obtener_estado()
 
-        # Restaurar la cuadrícula
-        self.cuadricula = cuadricula_estado
-        # Actualizar la referencia al juego en todos los bloques
-        for fila in self.cuadricula:
-            for bloque in fila:
-                if bloque is not None:
-                    bloque.juego = self
+        # Restaurar solo las columnas que difieren (las compartidas son el mismo objeto)
+        for col, valores in enumerate(cuadricula_estado):
+            if valores is self._columnas_estado[col] and col not in self.columnas_cambiadas:
+                continue
+            for fila in range(self.filas):
+                altura = self.filas - 1 - fila
+                self.cuadricula[fila][col] = (
+                    Bloque_Observer(valores[altura], fila, col, self) if altura < len(valores) else None
+                )
+            self._columnas_estado[col] = valores
+            self.columnas_cambiadas.discard(col)
 
         # Restaurar el próximo número
         self.proximo_numero = proximo_numero
 
     def obtener_bloque(self, fila: int, columna: int) -> Optional[Bloque_Observer]:
         """Obtiene el bloque en la posición especificada"""
-        if 0 <= fila < FILAS and 0 <= columna < COLUMNAS:
+        if 0 <= fila < self.filas and 0 <= columna < self.columnas:
             return self.cuadricula[fila][columna]
         return None
 
@@ -86,8 +112,18 @@ class Juego:
 
     def eliminar_bloque(self, bloque: Bloque_Observer):
         """Elimina un bloque de la cuadrícula"""
-        if 0 <= bloque.fila < FILAS and 0 <= bloque.columna < COLUMNAS:
+        if 0 <= bloque.fila < self.filas and 0 <= bloque.columna < self.columnas:
             self.cuadricula[bloque.fila][bloque.columna] = None
+            self.marcar_hueco(bloque.columna, bloque.fila, bloque.fila)
+
+    def marcar_hueco(self, columna: int, fila_baja: int, fila_alta: int):
+        """Anota que entre fila_alta y fila_baja de la columna puede haber huecos"""
+        self.columnas_cambiadas.add(columna)
+        rango = self.columnas_pendientes.get(columna)
+        if rango is not None:
+            fila_baja = max(fila_baja, rango[0])
+            fila_alta = min(fila_alta, rango[1])
+        self.columnas_pendientes[columna] = (fila_baja, fila_alta)
 
     def configurar_observers(self, nuevo_bloque: Bloque_Observer):
         """
@@ -95,47 +131,51 @@ class Juego:
         Los bloques se observan mutuamente si tienen el mismo valor.
         Si el nuevo bloque tiene vecinos con el mismo valor, usa el patrón Estrategia para
         calcular su nuevo valor (×2 con 1 vecino, ×4 con 2 vecinos, ×8 con 3 vecinos).
-        Este proceso se repite recursivamente hasta que no haya más fusiones.
+        Este proceso se repite hasta que no haya más fusiones.
+
+        Las fusiones en cadena se resuelven con una cola de trabajo en lugar de
+        recursión, así que una cadena larga no choca con el límite de recursión
+        de Python. En la cola solo entran bloques cuyo vecindario cambió: el
+        bloque que acaba de fusionarse (cambió su valor, y sus vecinos se
+        eliminaron o cayeron). Los bloques que solo cayeron no se re-evalúan,
+        igual que antes: en este juego únicamente el bloque colocado se fusiona.
         """
-        bloques_contiguos = self.obtener_bloques_contiguos(nuevo_bloque)
-        vecinos_iguales = []
+        pendientes = deque([nuevo_bloque])
+        while pendientes:
+            bloque = pendientes.popleft()
+            vecinos_iguales = [
+                vecino for vecino in self.obtener_bloques_contiguos(bloque)
+                if bloque.tiene_valor_igual(vecino)
+            ]
+
+            if not vecinos_iguales:
+                # Solo notificar cuando ya no hay más fusiones posibles
+                # El nuevo bloque notifica que ha sido colocado
+                # Este bloque SÍ es nuevo (es_nuevo=True)
+                bloque.notificar_observers(es_nuevo=True)
+                continue
 
-        # Encontrar todos los vecinos con el mismo valor
-        for vecino in bloques_contiguos:
-            if nuevo_bloque.tiene_valor_igual(vecino):
-                vecinos_iguales.append(vecino)
-
-        # Si hay vecinos con el mismo valor, usar el patrón Estrategia para calcular el nuevo valor
-        if len(vecinos_iguales) > 0:
             # Usar el contexto de multiplicación con la estrategia apropiada
-            nuevo_bloque.valor = self.contexto_multiplicacion.calcular_nuevo_valor(
-                nuevo_bloque.valor,
+            bloque.valor = self.contexto_multiplicacion.calcular_nuevo_valor(
+                bloque.valor,
                 len(vecinos_iguales)
             )
 
-        # Ahora establecer las relaciones de observación
-        for vecino in vecinos_iguales:
-            # El nuevo bloque observa al vecino
-            vecino.agregar_observer(nuevo_bloque)
-            # El vecino observa al nuevo bloque
-            nuevo_bloque.agregar_observer(vecino)
+            # Ahora establecer las relaciones de observación
+            for vecino in vecinos_iguales:
+                # El nuevo bloque observa al vecino
+                vecino.agregar_observer(bloque)
+                # El vecino observa al nuevo bloque
+                bloque.agregar_observer(vecino)
 
-            # Notificar al vecino que hay un nuevo bloque contiguo con el mismo valor
-            # El vecino NO es nuevo (es_nuevo=False), por lo que se eliminará
-            vecino.actualizar(nuevo_bloque, es_nuevo=False)
+                # Notificar al vecino que hay un nuevo bloque contiguo con el mismo valor
+                # El vecino NO es nuevo (es_nuevo=False), por lo que se eliminará
+                vecino.actualizar(bloque, es_nuevo=False)
 
-        # Después de eliminar los bloques viejos, aplicar gravedad
-        if len(vecinos_iguales) > 0:
+            # Después de eliminar los bloques viejos, aplicar gravedad y volver a
+            # evaluar el bloque con su nuevo valor (fusiones en cadena)
             self.aplicar_gravedad()
-
-            # Re-evaluar si el bloque con su nuevo valor tiene más vecinos iguales
-            # Esto permite fusiones en cadena
-            self.configurar_observers(nuevo_bloque)
-        else:
-            # Solo notificar cuando ya no hay más fusiones posibles
-            # El nuevo bloque notifica que ha sido colocado
-            # Este bloque SÍ es nuevo (es_nuevo=True)
-            nuevo_bloque.notificar_observers(es_nuevo=True)
+            pendientes.append(bloque)
 
     def deshacer_jugada(self):
         """Deshace la última jugada restaurando el estado anterior"""
@@ -163,6 +203,7 @@ class Juego:
 
         # Colocar en la primera fila
         self.cuadricula[0][columna] = nuevo_bloque
+        self.marcar_hueco(columna, self.filas - 1, 0)
 
         # Aplicar gravedad
         self.aplicar_gravedad()
@@ -175,22 +216,33 @@ class Juego:
         self.proximo_numero = self.generar_numero()
 
     def aplicar_gravedad(self):
-        """Hace que los bloques caigan hacia abajo"""
-        movimiento = True
-        while movimiento:
-            movimiento = False
-            # Recorrer de abajo hacia arriba
-            for fila in range(FILAS - 2, -1, -1):
-                for col in range(COLUMNAS):
-                    # Si hay un bloque y el espacio debajo está vacío
-                    if self.cuadricula[fila][col] is not None and self.cuadricula[fila + 1][col] is None:
-                        # Mover el bloque hacia abajo
-                        bloque = self.cuadricula[fila][col]
-                        self.cuadricula[fila + 1][col] = bloque
-                        self.cuadricula[fila][col] = None
+        """Hace que los bloques caigan hacia abajo
+
+        Solo recorre las columnas que cambiaron desde la última llamada (las de
+        columnas_pendientes, que marcan colocar_bloque y eliminar_bloque), una
+        vez cada una de abajo hacia arriba: cada bloque baja directamente a la
+        primera celda libre. Debajo del hueco más bajo la columna ya está
+        compactada, y encima del más alto los bloques están apilados sin
+        huecos, así que el recorrido empieza en el primero y termina en la
+        primera celda vacía por encima del segundo. Quien modifique la
+        cuadrícula a mano debe llamar a marcar_hueco.
+        """
+        cuadricula = self.cuadricula
+        for col, (fila_baja, fila_alta) in self.columnas_pendientes.items():
+            destino = fila_baja  # Fila donde cae el próximo bloque
+            for fila in range(fila_baja, -1, -1):
+                bloque = cuadricula[fila][col]
+                if bloque is None:
+                    if fila < fila_alta:
+                        break  # Tope de la pila
+                else:
+                    if fila != destino:
+                        cuadricula[destino][col] = bloque
+                        cuadricula[fila][col] = None
                         # Actualizar la posición interna del bloque
-                        bloque.actualizar_posicion(fila + 1, col)
-                        movimiento = True
+                        bloque.actualizar_posicion(destino, col)
+                    destino -= 1
+        self.columnas_pendientes.clear()
 
     def obtener_color(self, numero):
         """Retorna el color según el número"""
@@ -209,23 +261,28 @@ class Juego:
         }
         return colores.get(numero, BLANCO)
 
-    def dibujar(self, columna_destacada=None):
+    def dibujar(self, columna_destacada=None, columna_sugerida=None):
         """Dibuja el juego en la pantalla
 
         Args:
             columna_destacada: Columna a resaltar con borde rojo (None si no hay)
+            columna_sugerida: Columna sugerida por el asesor, con borde verde (None si no hay)
         """
         pantalla.fill(BLANCO)
 
         # Dibujar cuadrícula
-        for fila in range(FILAS):
-            for col in range(COLUMNAS):
+        for fila in range(self.filas):
+            for col in range(self.columnas):
                 x = col * TAMANO_CELDA
                 y = fila * TAMANO_CELDA + 60
 
-                # Dibujar celda (con borde rojo si es la columna destacada)
-                color_borde = ROJO if col == columna_destacada else GRIS
-                grosor_borde = 3 if col == columna_destacada else 2
+                # Dibujar celda (con borde rojo si es la columna destacada, verde si es la sugerida)
+                if col == columna_destacada:
+                    color_borde, grosor_borde = ROJO, 3
+                elif col == columna_sugerida:
+                    color_borde, grosor_borde = VERDE, 3
+                else:
+                    color_borde, grosor_borde = GRIS, 2
                 pygame.draw.rect(pantalla, color_borde, (x, y, TAMANO_CELDA, TAMANO_CELDA), grosor_borde)
 
                 # Dibujar número si existe
@@ -236,16 +293,16 @@ class Juego:
 
                     # Dibujar número (con contraste según el valor)
                     color_texto = BLANCO if bloque.valor >= 8 else NEGRO
-                    texto = fuente.render(str(bloque.valor), True, color_texto)
+                    texto = render_texto(fuente, str(bloque.valor), color_texto)
                     texto_rect = texto.get_rect(center=(x + TAMANO_CELDA // 2, y + TAMANO_CELDA // 2))
                     pantalla.blit(texto, texto_rect)
 
         # Dibujar instrucciones
-        instrucciones = fuente_pequena.render("Haz clic en una columna para colocar un bloque", True, NEGRO)
+        instrucciones = render_texto(fuente_pequena, "Haz clic en una columna para colocar un bloque", NEGRO)
         pantalla.blit(instrucciones, (10, 10))
 
         # Dibujar vista previa del próximo bloque
-        texto_proximo = fuente_pequena.render("Próximo:", True, NEGRO)
+        texto_proximo = render_texto(fuente_pequena, "Próximo:", NEGRO)
         pantalla.blit(texto_proximo, (10, 30))
 
         # Dibujar el bloque próximo
@@ -258,7 +315,7 @@ class Juego:
 
         # Dibujar el número del próximo bloque (con contraste)
         color_texto_preview = BLANCO if self.proximo_numero >= 8 else NEGRO
-        texto_num = fuente_pequena.render(str(self.proximo_numero), True, color_texto_preview)
+        texto_num = render_texto(fuente_pequena, str(self.proximo_numero), color_texto_preview)
         texto_num_rect = texto_num.get_rect(center=(x_preview + tamano_preview // 2, y_preview + tamano_preview // 2))
         pantalla.blit(texto_num, texto_num_rect)
 
@@ -278,7 +335,7 @@ class Juego:
         pygame.draw.rect(pantalla, NEGRO, (boton_x, boton_y, boton_ancho, boton_alto), 2)
 
         # Texto del botón
-        texto_boton = fuente_pequena.render("Deshacer (Z)", True, NEGRO)
+        texto_boton = render_texto(fuente_pequena, "Deshacer (Z)", NEGRO)
         texto_boton_rect = texto_boton.get_rect(center=(boton_x + boton_ancho // 2, boton_y + boton_alto // 2))
         pantalla.blit(texto_boton, texto_boton_rect)
 
@@ -291,3 +348,84 @@ class Juego:
         boton_ancho = 110
         boton_alto = 50
         return pygame.Rect(boton_x, boton_y, boton_ancho, boton_alto)
+
+
+class JuegoCompacto(Juego):
+    """Juego con la misma API que usa la cuadrícula compacta de Tablero
+
+    El estado vive en `self.tablero` (un exponente por celda) en lugar de una
+    matriz de Bloque_Observer enlazados entre sí. `cuadricula` se sigue
+    pudiendo leer (por ejemplo desde dibujar): es una vista de Bloque_Observer
+    que se reconstruye solo cuando el tablero cambió. Los mementos guardan las
+    celdas empaquetadas en bytes.
+    """
+
+    def __init__(self, filas: int = FILAS, columnas: int = COLUMNAS, max_historial: int = 20):
+        self.tablero = Tablero(filas, columnas)
+        self._vista: List[List[Optional[Bloque_Observer]]] = []
+        self._vista_celdas = None
+        super().__init__(filas, columnas, max_historial)
+        self.tablero = Tablero(filas, columnas, self.contexto_multiplicacion)
+
+    @property
+    def cuadricula(self) -> List[List[Optional[Bloque_Observer]]]:
+        """Vista de solo lectura del tablero como matriz de Bloque_Observer"""
+        celdas = self.tablero.empaquetar()
+        if celdas != self._vista_celdas:
+            self._vista = []
+            for fila in range(self.filas):
+                fila_vista = []
+                for col in range(self.columnas):
+                    valor = self.tablero.valor(fila, col)
+                    fila_vista.append(Bloque_Observer(valor, fila, col, self) if valor else None)
+                self._vista.append(fila_vista)
+            self._vista_celdas = celdas
+        return self._vista
+
+    @cuadricula.setter
+    def cuadricula(self, cuadricula: List[List[Optional[Bloque_Observer]]]):
+        """Carga el tablero desde una matriz de Bloque_Observer (o None)"""
+        for fila in range(self.filas):
+            for col in range(self.columnas):
+                bloque = cuadricula[fila][col]
+                self.tablero.poner(fila, col, bloque.valor if bloque is not None else 0)
+
+    def crear_memento(self) -> Memento:
+        """Crea un memento con las celdas empaquetadas y el próximo número"""
+        return Memento(self.tablero.empaquetar(), self.proximo_numero)
+
+    def restaurar_memento(self, memento: Memento):
+        """Restaura el estado del juego desde un memento"""
+        if memento is None:
+            return
+
+        celdas, proximo_numero = memento.obtener_estado()
+        self.tablero.cargar(celdas)
+        self.proximo_numero = proximo_numero
+
+    def eliminar_bloque(self, bloque: Bloque_Observer):
+        """Elimina un bloque de la cuadrícula (sin gravedad, como en Juego)"""
+        if 0 <= bloque.fila < self.filas and 0 <= bloque.columna < self.columnas:
+            self.tablero.poner(bloque.fila, bloque.columna, 0)
+            self.marcar_hueco(bloque.columna, bloque.fila, bloque.fila)
+
+    def configurar_observers(self, nuevo_bloque: Bloque_Observer):
+        """Resuelve las fusiones en cadena del bloque con las reglas de Tablero"""
+        self.tablero.poner(nuevo_bloque.fila, nuevo_bloque.columna, nuevo_bloque.valor)
+        fila = self.tablero.fusionar(nuevo_bloque.fila, nuevo_bloque.columna)
+        nuevo_bloque.actualizar_posicion(fila, nuevo_bloque.columna)
+        nuevo_bloque.valor = self.tablero.valor(fila, nuevo_bloque.columna)
+
+    def colocar_bloque(self, columna):
+        """Coloca un bloque en la columna especificada"""
+        if self.cayendo or self.tablero.columna_llena(columna):
+            return
+
+        self.caretaker.guardar(self.crear_memento())
+        self.tablero.colocar(columna, self.proximo_numero)
+        self.proximo_numero = self.generar_numero()
+
+    def aplicar_gravedad(self):
+        """Hace que los bloques caigan hacia abajo"""
+        self.tablero.compactar(self.columnas_pendientes)
+        self.columnas_pendientes.clear()
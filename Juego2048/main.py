@@ -2,11 +2,15 @@ import pygame
 import sys
 
 from constants import ALTO, FILAS, COLUMNAS, TAMANO_CELDA, reloj, FPS
-from game import Juego
+from game import Juego, JuegoCompacto
+from asesor import AsesorMonteCarlo
 
 
 def main():
-    juego = Juego()
+    # --compacto: misma partida sobre la cuadrícula compacta de Tablero
+    juego = JuegoCompacto() if "--compacto" in sys.argv[1:] else Juego()
+    asesor = None  # Se crea al pedir la primera sugerencia (tecla H)
+    columna_sugerida = None
     ejecutando = True
 
     while ejecutando:
@@ -15,6 +19,7 @@ def main():
                 ejecutando = False
 
             if evento.type == pygame.MOUSEBUTTONDOWN:
+                columna_sugerida = None  # La sugerencia era para el estado anterior
                 # Obtener posición del mouse
                 x, y = pygame.mouse.get_pos()
 
@@ -35,6 +40,15 @@ def main():
                 if evento.key == pygame.K_z:
                     if juego.caretaker.tiene_historial():
                         juego.deshacer_jugada()
+                        columna_sugerida = None
+
+                # Tecla H: pedir sugerencia al asesor Monte Carlo
+                if evento.key == pygame.K_h:
+                    if asesor is None:
+                        # En este mismo proceso: con spawn, cada proceso del pool reimportaría
+                        # main.py y constants.py, y constants.py abre una ventana de pygame
+                        asesor = AsesorMonteCarlo(procesos=1)
+                    columna_sugerida = asesor.sugerir(juego)["columna"]
 
         # Detectar posición del mouse para resaltar columna
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -44,9 +58,11 @@ def main():
             if 0 <= columna < COLUMNAS:
                 columna_destacada = columna
 
-        juego.dibujar(columna_destacada)
+        juego.dibujar(columna_destacada, columna_sugerida)
         reloj.tick(FPS)
 
+    if asesor is not None:
+        asesor.cerrar()
     pygame.quit()
     sys.exit()
 
@@ -1,14 +1,17 @@
-from typing import List, Optional
+from collections import deque
+from typing import Deque, Optional
 
 
 # Patrón Memento - Para deshacer jugadas
 class Memento:
     """Guarda el estado del juego en un momento dado"""
 
+    __slots__ = ("_cuadricula_estado", "_proximo_numero")
+
     def __init__(self, cuadricula_estado, proximo_numero):
         """
         Args:
-            cuadricula_estado: Copia profunda de la cuadrícula del juego
+            cuadricula_estado: Estado inmutable de la cuadrícula del juego (lo arma el Juego)
             proximo_numero: El próximo número que se colocará
         """
         self._cuadricula_estado = cuadricula_estado
@@ -20,24 +23,28 @@ class Memento:
 
 
 class Caretaker:
-    """Maneja el historial de estados del juego"""
+    """Maneja el historial de estados del juego
+
+    El historial es un deque con largo máximo: guardar y deshacer son O(1)
+    aunque el historial tenga miles de estados, y al llenarse se descarta
+    solo el más viejo.
+    """
 
     def __init__(self, max_historial=20):
         """
         Args:
             max_historial: Cantidad máxima de estados a guardar
         """
-        self._historial: List[Memento] = []
+        self._historial: Deque[Memento] = deque(maxlen=max_historial)
         self._max_historial = max_historial
 
+    def __len__(self) -> int:
+        return len(self._historial)
+
     def guardar(self, memento: Memento):
-        """Guarda un estado en el historial"""
+        """Guarda un estado en el historial (si está lleno, descarta el más viejo)"""
         self._historial.append(memento)
 
-        # Limitar el tamaño del historial
-        if len(self._historial) > self._max_historial:
-            self._historial.pop(0)
-
     def deshacer(self) -> Optional[Memento]:
         """Retorna el último estado guardado y lo elimina del historial"""
         if len(self._historial) > 0:
@@ -0,0 +1,172 @@
+from typing import Iterable, List, Optional
+
+from strategy import ContextoMultiplicacion
+
+
+def exponente(valor: int) -> int:
+    """Retorna log2 de un valor de bloque (potencia de 2 mayor o igual a 2)"""
+    if valor < 2 or valor & (valor - 1):
+        raise ValueError(f"El valor {valor} no es una potencia de 2 mayor o igual a 2")
+    return valor.bit_length() - 1
+
+
+class Tablero:
+    """Cuadrícula compacta: un bytearray plano con el exponente de cada celda
+
+    La celda (fila, columna) está en el índice fila * columnas + columna, con
+    la fila 0 arriba como en Juego.cuadricula. Cada celda guarda log2 del valor
+    del bloque (0 = vacía), así que un 2 es 1, un 8 es 3 y un 2048 es 11.
+
+    Como la gravedad se aplica después de cada cambio, las columnas siempre
+    están compactadas hacia abajo: `alturas[columna]` es la cantidad de
+    bloques de la columna y la primera celda libre es la fila
+    filas - 1 - alturas[columna].
+
+    Las reglas son las de Juego: el bloque nuevo cae, multiplica su valor según
+    la cantidad de vecinos iguales (ContextoMultiplicacion), los vecinos se
+    eliminan, se aplica gravedad y se repite hasta que no haya más fusiones.
+    No usa pygame, así que sirve para simulaciones sin ventana.
+    """
+
+    __slots__ = ("filas", "columnas", "celdas", "alturas", "_saltos")
+
+    def __init__(self, filas: int, columnas: int, contexto: Optional[ContextoMultiplicacion] = None):
+        """
+        Args:
+            filas: Cantidad de filas de la cuadrícula
+            columnas: Cantidad de columnas de la cuadrícula
+            contexto: Contexto de multiplicación del que salen los multiplicadores
+        """
+        self.filas = filas
+        self.columnas = columnas
+        self.celdas = bytearray(filas * columnas)
+        self.alturas: List[int] = [0] * columnas
+        contexto = contexto or ContextoMultiplicacion()
+        # Multiplicar por 2^k es sumar k al exponente: un salto por cantidad de vecinos (0 a 4)
+        self._saltos = tuple(
+            exponente(contexto.calcular_nuevo_valor(2, n)) - 1 for n in range(5)
+        )
+
+    def copiar(self) -> "Tablero":
+        """Retorna una copia independiente del tablero"""
+        copia = Tablero.__new__(Tablero)
+        copia.filas = self.filas
+        copia.columnas = self.columnas
+        copia.celdas = self.celdas[:]
+        copia.alturas = self.alturas[:]
+        copia._saltos = self._saltos
+        return copia
+
+    def empaquetar(self) -> bytes:
+        """Retorna las celdas como bytes inmutables (una por celda)"""
+        return bytes(self.celdas)
+
+    def cargar(self, celdas: bytes):
+        """Reemplaza las celdas (columnas compactadas, como las de empaquetar) y recalcula alturas"""
+        if len(celdas) != self.filas * self.columnas:
+            raise ValueError("La cantidad de celdas no coincide con el tamaño del tablero")
+        self.celdas[:] = celdas
+        self.alturas = [
+            sum(1 for fila in range(self.filas) if celdas[fila * self.columnas + columna])
+            for columna in range(self.columnas)
+        ]
+
+    def valor(self, fila: int, columna: int) -> int:
+        """Retorna el valor del bloque en la celda (0 si está vacía)"""
+        e = self.celdas[fila * self.columnas + columna]
+        return 1 << e if e else 0
+
+    def poner(self, fila: int, columna: int, valor: int):
+        """Escribe un valor (0 = vaciar) en la celda, sin gravedad ni fusiones"""
+        indice = fila * self.columnas + columna
+        anterior = self.celdas[indice]
+        self.celdas[indice] = exponente(valor) if valor else 0
+        if bool(anterior) != bool(valor):
+            self.alturas[columna] += 1 if valor else -1
+
+    def columna_llena(self, columna: int) -> bool:
+        return self.alturas[columna] >= self.filas
+
+    def columnas_libres(self) -> List[int]:
+        """Columnas donde todavía se puede colocar un bloque"""
+        return [columna for columna, altura in enumerate(self.alturas) if altura < self.filas]
+
+    def celdas_libres(self) -> int:
+        return self.filas * self.columnas - sum(self.alturas)
+
+    def colocar(self, columna: int, valor: int) -> bool:
+        """
+        Deja caer un bloque en la columna y resuelve sus fusiones en cadena
+
+        Returns:
+            False si la columna está llena (el tablero no cambia), True si no
+        """
+        altura = self.alturas[columna]
+        if altura >= self.filas:
+            return False
+        fila = self.filas - 1 - altura
+        self.celdas[fila * self.columnas + columna] = exponente(valor)
+        self.alturas[columna] = altura + 1
+        self.fusionar(fila, columna)
+        return True
+
+    def fusionar(self, fila: int, columna: int) -> int:
+        """
+        Fusiona el bloque de (fila, columna) con sus vecinos iguales hasta que no queden
+
+        Returns:
+            La fila final del bloque (baja cuando se elimina el vecino de abajo)
+        """
+        celdas = self.celdas
+        filas = self.filas
+        ancho = self.columnas
+        saltos = self._saltos
+        while True:
+            i = fila * ancho + columna
+            e = celdas[i]
+            arriba = fila > 0 and celdas[i - ancho] == e
+            abajo = fila + 1 < filas and celdas[i + ancho] == e
+            izquierda = columna > 0 and celdas[i - 1] == e
+            derecha = columna + 1 < ancho and celdas[i + 1] == e
+            cantidad = arriba + abajo + izquierda + derecha
+            if not cantidad:
+                return fila
+
+            celdas[i] = e + saltos[cantidad]
+            # Quitar los vecinos viejos; cada columna se compacta al quitar
+            if izquierda:
+                self._quitar(fila, columna - 1)
+            if derecha:
+                self._quitar(fila, columna + 1)
+            if arriba:
+                self._quitar(fila - 1, columna)
+            if abajo:
+                self._quitar(fila + 1, columna)
+                fila += 1  # El bloque nuevo cae al lugar del vecino
+
+    def compactar(self, columnas: Optional[Iterable[int]] = None):
+        """Aplica gravedad a las columnas dadas, o a todas (solo hace falta después de poner)"""
+        celdas = self.celdas
+        ancho = self.columnas
+        for columna in range(ancho) if columnas is None else columnas:
+            destino = self.filas - 1
+            for fila in range(self.filas - 1, -1, -1):
+                e = celdas[fila * ancho + columna]
+                if e:
+                    if fila != destino:
+                        celdas[destino * ancho + columna] = e
+                        celdas[fila * ancho + columna] = 0
+                    destino -= 1
+
+    def _quitar(self, fila: int, columna: int):
+        """Vacía la celda y baja una fila los bloques que estaban encima"""
+        celdas = self.celdas
+        ancho = self.columnas
+        tope = self.filas - self.alturas[columna]
+        i = fila * ancho + columna
+        while fila > tope:
+            celdas[i] = celdas[i - ancho]
+            i -= ancho
+            fila -= 1
+        celdas[i] = 0
+        self.alturas[columna] -= 1
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Costo por tick de PlayState en niveles de distinto largo (misma densidad de
+enemigos y buffos), con la ventana de activacion y con todo despierto.
+
+Uso (desde JuegoProyectoFinal/):
+    python -m benchmarks.bench_activacion [frames] [plataformas_1 plataformas_2 ...]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from c.game_controller import GameController
+from c.game_state import PlayState
+from benchmarks.niveles_sinteticos import crear_nivel
+
+
+def medir(juego, nivel, frames, margen):
+    """Milisegundos por tick con el margen de activacion dado."""
+    margen_original = PlayState.MARGEN_ACTIVACION
+    PlayState.MARGEN_ACTIVACION = margen
+    try:
+        estado = PlayState(
+            juego.event_bus, juego.render, juego.sprite_loader, juego.input_handler, juego.jugador, nivel
+        )
+        estado.reset()
+        inicio = time.perf_counter()
+        for _ in range(frames):
+            estado.actualizar()
+        return (time.perf_counter() - inicio) * 1000 / frames, len(estado.activacion_enemigos.activas)
+    finally:
+        PlayState.MARGEN_ACTIVACION = margen_original
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    tamanos = [int(a) for a in sys.argv[2:]] or [500, 5000, 50000]
+    juego = GameController(headless=True)
+
+    print(f"{'plataformas':>11} {'enemigos':>9} | {'todos ms/tick':>13} | {'ventana ms/tick':>15} {'despiertos':>10}")
+    for num_plataformas in tamanos:
+        nivel = crear_nivel(num_plataformas, num_plataformas // 5, num_plataformas // 20, semilla=7)
+        t_todos, _ = medir(juego, nivel, frames, float("inf"))
+        t_ventana, despiertos = medir(juego, nivel, frames, PlayState.MARGEN_ACTIVACION)
+        print(
+            f"{num_plataformas:>11} {len(nivel.enemigos):>9} | {t_todos:>13.3f} | "
+            f"{t_ventana:>15.3f} {despiertos:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
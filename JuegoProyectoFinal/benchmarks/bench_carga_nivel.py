@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Compara la carga de niveles JSON contra el formato compilado (.nivb) para
+niveles de distintos anchos: tiempo y memoria pico al abrir el nivel y al
+materializar la primera ventana de camara. Verifica que materializar todos
+los trozos reproduzca exactamente las plataformas, enemigos y buffos del JSON.
+
+Uso (desde JuegoProyectoFinal/):
+    python -m benchmarks.bench_carga_nivel [plataformas_1 plataformas_2 ...]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from m.nivel import Nivel
+from m.nivel_binario import DEFECTO_BUFFO, DEFECTO_ENEMIGO, compilar_nivel
+from benchmarks.niveles_sinteticos import generar_datos_nivel
+
+# Ventana inicial que materializa PlayState (camara en 0 + MARGEN_CARGA)
+VENTANA_INICIAL = (-600, 800 + 600)
+
+
+def medir(funcion):
+    """Ejecuta funcion y devuelve (resultado, segundos, bytes pico asignados)."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def abrir_binario(ruta):
+    nivel = Nivel.desde_archivo(ruta)
+    nivel.cargar_plataformas(*VENTANA_INICIAL)
+    for numero in nivel.chunks_en_rango(*VENTANA_INICIAL):
+        nivel.entidades_de_chunk(numero)
+    return nivel
+
+
+def verificar(nivel_json, nivel_bin):
+    """Materializa todo el nivel compilado y lo compara con el JSON."""
+    nivel_bin.cargar_plataformas(-10**9, 10**9)
+    if nivel_bin.indice_plataformas.en_orden_nivel() != list(nivel_json.plataformas):
+        return False
+    enemigos = []
+    buffos = []
+    for numero in nivel_bin.chunks_en_rango(-10**9, 10**9):
+        e, b = nivel_bin.entidades_de_chunk(numero)
+        enemigos.extend(e)
+        buffos.extend(b)
+
+    def clave(d):
+        return sorted(d.items())
+
+    return (
+        sorted(map(clave, enemigos)) == sorted(clave(dict(DEFECTO_ENEMIGO, **d)) for d in nivel_json.enemigos)
+        and sorted(map(clave, buffos)) == sorted(clave(dict(DEFECTO_BUFFO, **d)) for d in nivel_json.buffos)
+    )
+
+
+def main():
+    tamanos = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f"{'plataformas':>11} {'ancho px':>10} | {'JSON ms':>9} {'JSON MB':>8} | {'nivb ms':>8} {'nivb MB':>8}")
+    ok = True
+    with tempfile.TemporaryDirectory() as carpeta:
+        for num_plataformas in tamanos:
+            datos = generar_datos_nivel(num_plataformas, num_plataformas // 20, num_plataformas // 50)
+            ruta_json = os.path.join(carpeta, f"nivel_{num_plataformas}.json")
+            with open(ruta_json, "w", encoding="utf-8") as archivo:
+                json.dump(datos, archivo)
+            ruta_bin = compilar_nivel(Nivel.desde_archivo(ruta_json), ruta_json[:-5] + ".nivb")
+
+            nivel_json, t_json, m_json = medir(lambda: Nivel.desde_archivo(ruta_json))
+            nivel_bin, t_bin, m_bin = medir(lambda: abrir_binario(ruta_bin))
+            print(
+                f"{num_plataformas:>11} {datos['ancho_mundo']:>10} | "
+                f"{t_json * 1000:>9.1f} {m_json / 1e6:>8.2f} | {t_bin * 1000:>8.2f} {m_bin / 1e6:>8.3f}"
+            )
+            ok = ok and verificar(nivel_json, nivel_bin)
+            nivel_bin.cargador.cerrar()
+
+    if not ok:
+        print("ERROR: el nivel compilado no coincide con el JSON")
+        sys.exit(1)
+    print("Niveles compilados identicos al JSON")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Compara la resolucion de colisiones con recorrido lineal de plataformas contra
+el IndiceEspacial del nivel. Verifica que las trayectorias sean identicas.
+
+Uso (desde JuegoProyectoFinal/):
+    python -m benchmarks.bench_colisiones [num_plataformas] [num_enemigos] [frames]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from m.enemigo_factory import EnemigoFactory
+from m.jugador import Jugador
+from benchmarks.niveles_sinteticos import crear_nivel
+
+
+def simular(nivel, plataformas, frames):
+    """Simula jugador y enemigos; devuelve trayectorias y tiempo empleado."""
+    jugador = Jugador(*nivel.spawn, 600)
+    enemigos = [EnemigoFactory.crear(d.get("tipo"), d) for d in nivel.enemigos]
+    trayectoria = []
+
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        # Entrada guionada: avanza a la derecha y salta periodicamente
+        if frame % 180 < 150:
+            jugador.mover_derecha()
+        else:
+            jugador.mover_izquierda()
+        if frame % 45 == 0:
+            jugador.saltar()
+        jugador.update(nivel.ancho_mundo, plataformas)
+        if jugador.rect.top > 800:
+            jugador.rect.topleft = nivel.spawn
+            jugador.velocidad_y = 0
+
+        posicion = jugador.rect.center
+        for enemigo in enemigos:
+            enemigo.update(plataformas, posicion)
+
+        trayectoria.append((tuple(jugador.rect), tuple(tuple(e.rect) for e in enemigos)))
+    return trayectoria, time.perf_counter() - inicio
+
+
+def main():
+    num_plataformas = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    num_enemigos = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    frames = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+
+    nivel = crear_nivel(num_plataformas, num_enemigos)
+    lineal, t_lineal = simular(nivel, nivel.plataformas, frames)
+    indexado, t_indice = simular(nivel, nivel.indice_plataformas, frames)
+
+    print(f"Plataformas: {num_plataformas}  Enemigos: {num_enemigos}  Frames: {frames}")
+    print(f"Recorrido lineal : {t_lineal * 1000:9.1f} ms")
+    print(f"Indice espacial  : {t_indice * 1000:9.1f} ms  (x{t_lineal / max(t_indice, 1e-9):.1f})")
+    if lineal != indexado:
+        print("ERROR: las trayectorias difieren")
+        sys.exit(1)
+    print("Trayectorias identicas")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Compara Enemigo.update (un objeto a la vez) contra EnemigoBatch (NumPy) para
+distintas poblaciones. Verifica que las trayectorias sean identicas.
+
+Uso (desde JuegoProyectoFinal/):
+    python -m benchmarks.bench_enemigos [frames] [poblacion ...]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from m.enemigo_batch import EnemigoBatch
+from m.entidad_factory import EntidadFactory
+from benchmarks.niveles_sinteticos import crear_nivel
+
+
+def posicion_jugador(frame):
+    """Jugador guionado que recorre el nivel para forzar cambios de estrategia."""
+    return (120 + 6 * frame, 300)
+
+
+def simular_objetos(nivel, frames):
+    enemigos = EntidadFactory.crear_enemigos(nivel.enemigos)
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        posicion = posicion_jugador(frame)
+        for enemigo in enemigos:
+            enemigo.update(nivel.indice_plataformas, posicion)
+    tiempo = time.perf_counter() - inicio
+    return [(tuple(e.rect), e.en_suelo) for e in enemigos], tiempo
+
+
+def simular_batch(nivel, frames):
+    enemigos = EntidadFactory.crear_enemigos(nivel.enemigos)
+    motor = EnemigoBatch(enemigos, nivel.indice_plataformas)
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        motor.paso(posicion_jugador(frame)[0])
+    tiempo = time.perf_counter() - inicio
+    motor.sincronizar()
+    return [(tuple(e.rect), e.en_suelo) for e in enemigos], tiempo
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    poblaciones = [int(n) for n in sys.argv[2:]] or [10, 1000, 50000]
+
+    fallo = False
+    print(f"{'enemigos':>9} {'objetos ms':>11} {'batch ms':>9} {'speedup':>8}")
+    for cantidad in poblaciones:
+        nivel = crear_nivel(num_plataformas=3000, num_enemigos=cantidad, num_buffos=0)
+        objetos, t_objetos = simular_objetos(nivel, frames)
+        batch, t_batch = simular_batch(nivel, frames)
+        iguales = objetos == batch
+        fallo = fallo or not iguales
+        print(f"{cantidad:>9} {t_objetos * 1000:>11.1f} {t_batch * 1000:>9.1f} "
+              f"{t_objetos / max(t_batch, 1e-9):>7.1f}x {'' if iguales else ' DIFIEREN'}")
+    if fallo:
+        print("ERROR: las trayectorias difieren")
+        sys.exit(1)
+    print("Trayectorias identicas")
+
+
+if __name__ == "__main__":
+    main()
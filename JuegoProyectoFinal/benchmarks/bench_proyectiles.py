@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compara la lista de objetos Proyectil contra PoolProyectiles (NumPy) con
+muchos proyectiles simultaneos. Verifica que posiciones y vida coincidan.
+
+Uso (desde JuegoProyectoFinal/):
+    python -m benchmarks.bench_proyectiles [proyectiles] [frames]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from m.pool_proyectiles import PoolProyectiles
+from m.proyectil import Proyectil
+from m.reloj_simulacion import RelojSimulacion
+
+ANCHO_MUNDO = 20000
+
+
+def disparos(cantidad, frames, semilla=7):
+    """Lista de (frame, x, y, vx, vy) deterministas."""
+    rng = random.Random(semilla)
+    por_frame = max(1, cantidad // 60)
+    salida = []
+    for frame in range(frames):
+        for _ in range(por_frame):
+            salida.append((frame, rng.randrange(0, ANCHO_MUNDO), rng.randrange(0, 600),
+                           rng.choice((-6, -4, 4, 6)), rng.choice((0, 0, 1, -1))))
+    return salida
+
+
+def simular_lista(eventos, frames):
+    reloj = RelojSimulacion()
+    proyectiles = []
+    pos = 0
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        reloj.avanzar()
+        while pos < len(eventos) and eventos[pos][0] == frame:
+            _, x, y, vx, vy = eventos[pos]
+            proyectiles.append(Proyectil(x, y, vx, vy, reloj=reloj))
+            pos += 1
+        vivos = []
+        for proyectil in proyectiles:
+            proyectil.update()
+            if proyectil.vivo and -100 <= proyectil.rect.x <= ANCHO_MUNDO + 100:
+                vivos.append(proyectil)
+        proyectiles = vivos
+    tiempo = time.perf_counter() - inicio
+    return sorted(tuple(p.rect) for p in proyectiles), tiempo
+
+
+def simular_pool(eventos, frames):
+    reloj = RelojSimulacion()
+    pool = PoolProyectiles(reloj=reloj)
+    pos = 0
+    inicio = time.perf_counter()
+    for frame in range(frames):
+        reloj.avanzar()
+        while pos < len(eventos) and eventos[pos][0] == frame:
+            _, x, y, vx, vy = eventos[pos]
+            pool.emitir(x, y, vx, vy)
+            pos += 1
+        pool.actualizar(-100, ANCHO_MUNDO + 100)
+    tiempo = time.perf_counter() - inicio
+    return sorted(tuple(p.rect) for p in pool), tiempo
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    # Con TTL de 3 s a 60 FPS conviven ~cantidad proyectiles en regimen
+    eventos = disparos(cantidad * 60 // 180, frames)
+    lista, t_lista = simular_lista(eventos, frames)
+    pool, t_pool = simular_pool(eventos, frames)
+
+    print(f"Proyectiles vivos al final: {len(pool)}  Frames: {frames}")
+    print(f"Lista de objetos : {t_lista * 1000:9.1f} ms")
+    print(f"Pool NumPy       : {t_pool * 1000:9.1f} ms  (x{t_lista / max(t_pool, 1e-9):.1f})")
+    if lista != pool:
+        print("ERROR: los proyectiles difieren")
+        sys.exit(1)
+    print("Resultados identicos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Generadores de niveles sinteticos para benchmarks (deterministas por semilla)."""
+import json
+import random
+import pygame
+from m.nivel import Nivel
+
+
+def generar_datos_nivel(num_plataformas=2000, num_enemigos=50, num_buffos=20, semilla=1234, tile_size=64, alto=600):
+    """Devuelve un dict con el mismo formato que niveles/*.json."""
+    rng = random.Random(semilla)
+    suelo_y = alto - tile_size
+    plataformas = []
+    x = 0
+    # Suelo con pozos cada cierto tramo
+    while len(plataformas) < max(1, num_plataformas // 4):
+        ancho = rng.randrange(3, 10) * tile_size
+        plataformas.append({"x": x, "y": suelo_y, "w": ancho, "h": tile_size})
+        x += ancho + rng.choice((0, 0, tile_size, 2 * tile_size))
+    ancho_mundo = x + tile_size
+
+    # Plataformas flotantes repartidas por el mundo
+    while len(plataformas) < num_plataformas:
+        px = rng.randrange(0, ancho_mundo - tile_size)
+        py = rng.randrange(2, 8) * tile_size // 2 + 120
+        pw = rng.randrange(2, 6) * tile_size // 2
+        plataformas.append({"x": px, "y": py, "w": pw, "h": 32})
+
+    tipos = ("guerrero", "arquero", "mago")
+    enemigos = []
+    for _ in range(num_enemigos):
+        base = plataformas[rng.randrange(len(plataformas))]
+        limite_der = base["x"] + max(base["w"], 96)
+        enemigos.append({
+            "tipo": rng.choice(tipos),
+            "x": base["x"],
+            "y": base["y"] - 48,
+            "limite_izq": base["x"],
+            "limite_der": limite_der,
+            "velocidad": rng.choice((1.5, 2, 2.5)),
+        })
+
+    buffos = []
+    for _ in range(num_buffos):
+        buffos.append({
+            "tipo": rng.choice(("velocidad", "salto", "invencible")),
+            "x": rng.randrange(0, ancho_mundo - 32),
+            "y": rng.randrange(150, suelo_y - 32),
+        })
+
+    return {
+        "nombre": f"sintetico_{num_plataformas}",
+        "tile_size": tile_size,
+        "altura_suelo": tile_size,
+        "ancho_mundo": ancho_mundo,
+        "meta_x": ancho_mundo - 50,
+        "spawn": {"x": 120, "y": 300},
+        "plataformas": plataformas,
+        "enemigos": enemigos,
+        "buffos": buffos,
+    }
+
+
+def crear_nivel(num_plataformas=2000, num_enemigos=50, num_buffos=20, semilla=1234):
+    """Construye un Nivel en memoria a partir de datos sinteticos."""
+    data = generar_datos_nivel(num_plataformas, num_enemigos, num_buffos, semilla)
+    plataformas = [pygame.Rect(p["x"], p["y"], p["w"], p["h"]) for p in data["plataformas"]]
+    return Nivel(
+        nombre=data["nombre"],
+        plataformas=plataformas,
+        spawn=(data["spawn"]["x"], data["spawn"]["y"]),
+        altura_suelo=data["altura_suelo"],
+        tile_size=data["tile_size"],
+        ancho_mundo=data["ancho_mundo"],
+        enemigos=data["enemigos"],
+        buffos=data["buffos"],
+        meta_x=data["meta_x"],
+    )
+
+
+def escribir_nivel_json(ruta, num_plataformas=2000, num_enemigos=50, num_buffos=20, semilla=1234):
+    """Guarda un nivel sintetico como JSON (mismo formato que niveles/*.json) y devuelve la ruta."""
+    datos = generar_datos_nivel(num_plataformas, num_enemigos, num_buffos, semilla)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo)
+    return ruta
+
+
+def generar_entidades_en_vista(cantidad, ancho=800, alto=600, semilla=1234):
+    """
+    Datos de enemigos y buffos repartidos dentro de una ventana de ancho x alto
+    (camara en 0), para medir el costo de dibujar o simular cantidad entidades
+    visibles a la vez.
+    """
+    rng = random.Random(semilla)
+    tipos = ("guerrero", "arquero", "mago")
+    enemigos = []
+    buffos = []
+    for _ in range(cantidad):
+        x = rng.randrange(0, ancho - 48)
+        y = rng.randrange(100, alto - 112)
+        enemigos.append({
+            "tipo": rng.choice(tipos),
+            "x": x,
+            "y": y,
+            "limite_izq": max(0, x - 96),
+            "limite_der": min(ancho, x + 144),
+            "velocidad": rng.choice((1.5, 2, 2.5)),
+        })
+        buffos.append({
+            "tipo": rng.choice(("velocidad", "salto", "invencible")),
+            "x": rng.randrange(0, ancho - 32),
+            "y": rng.randrange(100, alto - 96),
+        })
+    return enemigos, buffos
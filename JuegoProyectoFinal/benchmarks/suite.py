@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks de los caminos calientes del juego, con referencias
+guardadas: cada caso se mide (mejor tiempo por llamada de varias rondas) junto
+con una carga de calibracion fija y se compara, en proporcion a esa carga, con
+benchmarks/referencia.json. Si algun caso queda mas lento que su referencia
+por encima de la tolerancia, la suite termina con codigo 1.
+
+Casos:
+    jugador_update          Jugador.update contra N plataformas (IndiceEspacial)
+    play_state_actualizar   PlayState.actualizar con N enemigos y N proyectiles despiertos
+    render_*                Render.dibujar_* con N entidades dentro de la camara
+    nivel_desde_archivo     Nivel.desde_archivo de un JSON (y un .nivb) de N plataformas
+    buff_manager_aplicar    BuffManager.aplicar con todos los buffos acumulados
+    event_bus_*             N eventos por tick con emitir contra encolar + despachar
+
+Uso (desde JuegoProyectoFinal/):
+    python -m benchmarks.suite                  # mide y compara con la referencia
+    python -m benchmarks.suite --guardar        # mide y reemplaza la referencia
+    python -m benchmarks.suite --tolerancia 0.5 --filtro render
+
+Las referencias dependen de la maquina: regenerarlas con --guardar en el
+equipo donde se quiere vigilar el rendimiento (p.ej. el kiosco).
+"""
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from c.event_bus import EventBus
+from c.game_controller import GameController
+from c.game_state import PlayState
+from m.buff_decorators import InvencibleBuff, SaltoBuff, VelocidadBuff
+from m.buff_manager import BuffManager
+from m.entidad_factory import EntidadFactory
+from m.jugador import Jugador
+from m.nivel import Nivel
+from m.nivel_binario import compilar_nivel
+from m.pool_proyectiles import PoolProyectiles
+from m.reloj_simulacion import RelojSimulacion
+from benchmarks.niveles_sinteticos import crear_nivel, escribir_nivel_json, generar_entidades_en_vista
+
+RUTA_REFERENCIA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "referencia.json")
+TOLERANCIA = 0.40  # 40% mas lento que la referencia (en unidades de calibracion) = regresion
+RONDAS = 5
+SEGUNDOS_POR_RONDA = 0.05
+REINTENTOS = 4  # mediciones extra de un caso que parece regresion; decide la mediana
+
+CASOS = []  # (nombre, preparar); preparar() devuelve la funcion a medir
+
+
+def caso(nombre, tamanos=(None,)):
+    """Registra preparar(n) una vez por tamano, como nombre[n]."""
+    def registrar(preparar):
+        for n in tamanos:
+            etiqueta = nombre if n is None else f"{nombre}[{n}]"
+            CASOS.append((etiqueta, (lambda n=n: preparar(n)) if n is not None else preparar))
+        return preparar
+    return registrar
+
+
+_juego = None
+_temporal = None
+
+
+def juego():
+    """GameController headless compartido por los casos que lo necesitan."""
+    global _juego
+    if _juego is None:
+        _juego = GameController(headless=True)
+    return _juego
+
+
+def carpeta_temporal():
+    global _temporal
+    if _temporal is None:
+        _temporal = tempfile.TemporaryDirectory()
+    return _temporal.name
+
+
+@caso("jugador_update", (1000, 10000, 100000))
+def preparar_jugador_update(num_plataformas):
+    nivel = crear_nivel(num_plataformas, 0, 0)
+    jugador = Jugador(*nivel.spawn, 600)
+    indice = nivel.indice_plataformas
+    frame = [0]
+
+    def paso():
+        # Entrada guionada: corre a la derecha, vuelve, salta periodicamente
+        if frame[0] % 180 < 150:
+            jugador.mover_derecha()
+        else:
+            jugador.mover_izquierda()
+        if frame[0] % 45 == 0:
+            jugador.saltar()
+        jugador.update(nivel.ancho_mundo, indice)
+        if jugador.rect.top > 800:
+            jugador.rect.topleft = nivel.spawn
+            jugador.velocidad_y = 0
+        frame[0] += 1
+
+    return paso
+
+
+@caso("play_state_actualizar", (50, 500, 2000))
+def preparar_play_state(cantidad):
+    base = juego()
+    nivel = crear_nivel(2000, cantidad, 20, semilla=7)
+    # Todo despierto: se mide el costo de N entidades activas, no la ventana de activacion
+    margen = PlayState.MARGEN_ACTIVACION
+    PlayState.MARGEN_ACTIVACION = float("inf")
+    try:
+        estado = PlayState(
+            base.event_bus, base.render, base.sprite_loader, base.input_handler, base.jugador, nivel
+        )
+        estado.reset()
+    finally:
+        PlayState.MARGEN_ACTIVACION = margen
+    pool = estado.proyectiles
+    paso_x = max(1, nivel.ancho_mundo // cantidad)
+
+    def paso():
+        # Mantiene N proyectiles vivos (los que salen del mundo se reponen)
+        i = 0
+        while pool.num_vivos < cantidad:
+            pool.emitir((i * paso_x) % nivel.ancho_mundo, 100 + (i * 37) % 400, 4 if i % 2 else -4, 0,
+                        ttl_ms=10 ** 9)
+            i += 1
+        estado.actualizar()
+
+    return paso
+
+
+def _render_con_entidades(cantidad):
+    base = juego()
+    render = base.render
+    render.set_camara(0)
+    datos_enemigos, datos_buffos = generar_entidades_en_vista(cantidad, render.ancho, render.alto)
+    return render, EntidadFactory.crear_enemigos(datos_enemigos), EntidadFactory.crear_buffos(datos_buffos)
+
+
+@caso("render_plataformas", (1000, 100000))
+def preparar_render_plataformas(num_plataformas):
+    render = juego().render
+    nivel = crear_nivel(num_plataformas, 0, 0)
+    render.preparar_nivel(nivel)
+    camaras = range(0, max(1, nivel.ancho_mundo - render.ancho), 97)
+    frame = [0]
+
+    def paso():
+        render.set_camara(camaras[frame[0] % len(camaras)])
+        render.dibujar_plataformas(nivel.indice_plataformas)
+        frame[0] += 1
+
+    return paso
+
+
+@caso("render_enemigos", (50, 500))
+def preparar_render_enemigos(cantidad):
+    render, enemigos, _ = _render_con_entidades(cantidad)
+    return lambda: render.dibujar_enemigos(enemigos)
+
+
+@caso("render_buffos", (50, 500))
+def preparar_render_buffos(cantidad):
+    render, _, buffos = _render_con_entidades(cantidad)
+    return lambda: render.dibujar_buffos(buffos)
+
+
+@caso("render_proyectiles", (50, 500))
+def preparar_render_proyectiles(cantidad):
+    render = juego().render
+    render.set_camara(0)
+    pool = PoolProyectiles(reloj=RelojSimulacion())
+    for i in range(cantidad):
+        pool.emitir((i * 13) % render.ancho, 80 + (i * 29) % 420, 4 if i % 2 else -4, 0)
+    return lambda: render.dibujar_proyectiles(pool)
+
+
+@caso("render_jugador_buffos")
+def preparar_render_jugador():
+    base = juego()
+    render = base.render
+    render.set_camara(0)
+    jugador = Jugador(300, 300, render.alto)
+    buffos = preparar_buff_manager()
+    buffos()  # deja escala y auras como con los tres buffos activos
+    jugador.set_visual(escala=base.jugador.escala_visual, auras=base.jugador.auras)
+    sprite = base.sprite_loader.get_sprite(True, False, 0)
+    return lambda: render.dibujar_jugador(jugador, sprite)
+
+
+@caso("nivel_desde_archivo_json", (5000, 50000))
+def preparar_nivel_json(num_plataformas):
+    ruta = os.path.join(carpeta_temporal(), f"nivel_{num_plataformas}.json")
+    escribir_nivel_json(ruta, num_plataformas, num_plataformas // 20, num_plataformas // 50)
+    return lambda: Nivel.desde_archivo(ruta)
+
+
+@caso("nivel_desde_archivo_nivb", (5000, 50000))
+def preparar_nivel_nivb(num_plataformas):
+    ruta = os.path.join(carpeta_temporal(), f"nivel_{num_plataformas}.json")
+    if not os.path.exists(ruta):
+        escribir_nivel_json(ruta, num_plataformas, num_plataformas // 20, num_plataformas // 50)
+    ruta_bin = compilar_nivel(Nivel.desde_archivo(ruta), ruta[:-5] + ".nivb")
+
+    def abrir():
+        Nivel.desde_archivo(ruta_bin).cargador.cerrar()
+
+    return abrir
+
+
+@caso("buff_manager_aplicar")
+def preparar_buff_manager():
+    jugador = juego().jugador
+    reloj = RelojSimulacion()
+    manager = BuffManager({"velocidad": VelocidadBuff, "salto": SaltoBuff, "invencible": InvencibleBuff}, reloj)
+    for tipo in ("velocidad", "salto", "invencible"):
+        for _ in range(3):  # tres stacks de cada buffo
+            manager.activar(tipo, 0)
+    return lambda: manager.aplicar(jugador, 1)
+
+
+@caso("event_bus_emitir", (100,))
+def preparar_event_bus_emitir(cantidad):
+    """N eventos por tick publicados con emitir (una cadena de llamadas por evento)."""
+    bus = EventBus()
+    contador = [0]
+    bus.suscribir("enemigo_eliminado", lambda _enemigo: contador.__setitem__(0, contador[0] + 1))
+    payloads = list(range(cantidad))
+
+    def tick():
+        for payload in payloads:
+            bus.emitir("enemigo_eliminado", payload)
+
+    return tick
+
+
+@caso("event_bus_encolar_despachar", (100,))
+def preparar_event_bus_lote(cantidad):
+    """Los mismos N eventos encolados y entregados en un lote con despachar."""
+    bus = EventBus()
+    evento = bus.registrar("enemigo_eliminado")
+    contador = [0]
+    bus.suscribir(evento, lambda lote: contador.__setitem__(0, contador[0] + len(lote)), lote=True)
+    payloads = list(range(cantidad))
+    encolar = bus.encolar
+
+    def tick():
+        for payload in payloads:
+            encolar(evento, payload)
+        bus.despachar()
+
+    return tick
+
+
+def medir(funcion, rondas=RONDAS, segundos_por_ronda=SEGUNDOS_POR_RONDA):
+    """Mejor tiempo por llamada (s) entre varias rondas; cada ronda dura ~segundos_por_ronda."""
+    inicio = time.perf_counter()
+    funcion()
+    una = max(time.perf_counter() - inicio, 1e-7)
+    repeticiones = max(1, int(segundos_por_ronda / una))
+    mejor = float("inf")
+    for _ in range(rondas):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            funcion()
+        mejor = min(mejor, (time.perf_counter() - inicio) / repeticiones)
+    return mejor
+
+
+def preparar_calibracion():
+    """
+    Carga fija (Python puro + blits) ajena al codigo del juego. Se mide junto a
+    cada caso y el caso se compara en proporcion a ella, asi que una maquina
+    momentaneamente mas lenta (otros procesos, frecuencia de CPU) no se confunde
+    con una regresion.
+    """
+    sprite = pygame.Surface((64, 64))
+    destino = pygame.Surface((800, 600))
+
+    def carga():
+        total = 0
+        for i in range(2000):
+            total += i * i % 7
+        for i in range(40):
+            destino.blit(sprite, ((i * 37) % 736, (i * 23) % 536))
+        return total
+
+    return carga
+
+
+def medir_caso(funcion, calibracion):
+    """(segundos por llamada, segundos de la calibracion medida alrededor del caso)."""
+    antes = medir(calibracion)
+    segundos = medir(funcion)
+    despues = medir(calibracion)
+    return segundos, (antes + despues) / 2
+
+
+def descripcion_maquina():
+    return {
+        "plataforma": platform.platform(),
+        "procesador": platform.processor() or platform.machine(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+    }
+
+
+def formatear(segundos):
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:9.3f} ms"
+    return f"{segundos * 1e6:9.1f} us"
+
+
+def main():
+    argumentos = sys.argv[1:]
+    guardar = "--guardar" in argumentos
+    tolerancia = TOLERANCIA
+    filtro = None
+    if "--tolerancia" in argumentos:
+        tolerancia = float(argumentos[argumentos.index("--tolerancia") + 1])
+    if "--filtro" in argumentos:
+        filtro = argumentos[argumentos.index("--filtro") + 1]
+
+    referencia = {}
+    if os.path.exists(RUTA_REFERENCIA):
+        with open(RUTA_REFERENCIA, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        referencia = datos.get("casos", {})
+        if not guardar and datos.get("maquina") != descripcion_maquina():
+            print("Aviso: la referencia se midio en otra maquina/version; regenerarla con --guardar")
+
+    calibracion = preparar_calibracion()
+    resultados = {}
+    regresiones = []
+    print(f"{'caso':<34} {'actual':>12} {'referencia':>12} {'relacion':>9}")
+    for nombre, preparar in CASOS:
+        if filtro and filtro not in nombre:
+            continue
+        funcion = preparar()
+        segundos, unidad = medir_caso(funcion, calibracion)
+        previo = referencia.get(nombre)
+        if previo is None or guardar:
+            resultados[nombre] = {"segundos": segundos, "calibracion": unidad}
+            print(f"{nombre:<34} {formatear(segundos):>12} {'-':>12} {'-':>9}")
+            continue
+
+        # Relacion en unidades de calibracion: 1.0 = igual que la referencia en esa maquina
+        relacion = (segundos / unidad) / (previo["segundos"] / previo["calibracion"])
+        if relacion > 1 + tolerancia:
+            # Una medicion mala no alcanza: se repite y se usa la mediana de todas
+            relaciones = [relacion]
+            tiempos = [segundos]
+            for _ in range(REINTENTOS):
+                otro, otra_unidad = medir_caso(funcion, calibracion)
+                relaciones.append((otro / otra_unidad) / (previo["segundos"] / previo["calibracion"]))
+                tiempos.append(otro)
+            relacion = statistics.median(relaciones)
+            segundos = statistics.median(tiempos)
+        marca = ""
+        if relacion > 1 + tolerancia:
+            regresiones.append(nombre)
+            marca = "  REGRESION"
+        print(f"{nombre:<34} {formatear(segundos):>12} {formatear(previo['segundos']):>12} {relacion:>8.2f}x{marca}")
+
+    if guardar:
+        # Con --filtro solo se reemplazan los casos medidos
+        referencia.update(resultados)
+        with open(RUTA_REFERENCIA, "w", encoding="utf-8") as archivo:
+            json.dump({"maquina": descripcion_maquina(), "casos": referencia}, archivo, indent=2, sort_keys=True)
+            archivo.write("\n")
+        print(f"Referencia guardada en {RUTA_REFERENCIA}")
+        return
+
+    if regresiones:
+        print(f"ERROR: {len(regresiones)} caso(s) mas de {tolerancia:.0%} mas lentos que la referencia")
+        sys.exit(1)
+    print("Sin regresiones")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,118 @@
+import time
+from bisect import insort
+
+
 class EventBus:
-    """Bus de eventos simple para desacoplar productores y consumidores."""
+    """
+    Bus de eventos simple para desacoplar productores y consumidores.
+
+    Dos formas de publicar:
+    - emitir(evento, payload): llama a los suscriptores en el momento (cambios
+      de estado, game over, etc.).
+    - encolar(evento_id, payload): solo agrega el payload a la cola del evento;
+      despachar() (una vez al final del tick) entrega cada cola de una vez. Es
+      para eventos frecuentes de juego: publicar cuesta un append.
+
+    Los eventos se registran por nombre y reciben un id entero (registrar);
+    suscribir/emitir aceptan nombre o id. Los suscriptores se llaman por
+    prioridad descendente (a igual prioridad, en orden de suscripcion). Un
+    suscriptor con lote=True recibe la lista de payloads en vez de uno por vez;
+    esa lista se reutiliza, asi que hay que copiarla si se quiere guardar. Lo
+    que se encola mientras se despacha (del mismo evento o de otro) se entrega
+    en el proximo despachar().
+    """
 
     def __init__(self):
-        self._suscriptores = {}
+        self._ids = {}  # nombre -> id
+        self.nombres = []  # id -> nombre
+        self._suscriptores = []  # id -> [(-prioridad, orden, callback, lote)] ordenada
+        self._colas = []  # id -> payloads encolados en el tick (lista reutilizada)
+        self._colas_libres = []  # id -> lista vacia que toma el lugar de la cola al despacharla
+        self._pendientes = []  # ids con cola no vacia, en orden de primer encolado
+        self._pendientes_libres = []
+        self._orden = 0
+
+        # Contadores
+        self.eventos_frame = 0  # encolados desde el ultimo despacho
+        self.eventos_ultimo_frame = 0
+        self.eventos_total = 0
+        self.despachos = 0
+        self.tiempo_despacho = 0.0  # segundos del ultimo despacho
+        self.tiempo_despacho_total = 0.0
+
+    def registrar(self, nombre):
+        """Devuelve el id entero del evento, creandolo si no existe."""
+        evento_id = self._ids.get(nombre)
+        if evento_id is None:
+            evento_id = self._ids[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+            self._suscriptores.append([])
+            self._colas.append([])
+            self._colas_libres.append([])
+        return evento_id
 
-    def suscribir(self, evento, callback):
-        self._suscriptores.setdefault(evento, []).append(callback)
+    def _id(self, evento):
+        return evento if isinstance(evento, int) else self.registrar(evento)
+
+    def suscribir(self, evento, callback, prioridad=0, lote=False):
+        insort(self._suscriptores[self._id(evento)], (-prioridad, self._orden, callback, lote))
+        self._orden += 1
 
     def emitir(self, evento, payload=None):
-        for callback in self._suscriptores.get(evento, []):
-            callback(payload)
+        for _, _, callback, lote in self._suscriptores[self._id(evento)]:
+            if lote:
+                callback([payload])
+            else:
+                callback(payload)
+
+    def encolar(self, evento_id, payload=None):
+        """Agrega payload al lote del evento para el proximo despachar()."""
+        cola = self._colas[evento_id]
+        if not cola:
+            self._pendientes.append(evento_id)
+        cola.append(payload)
+        self.eventos_frame += 1
+
+    def despachar(self):
+        """Entrega los lotes encolados (una vez por tick) y actualiza los contadores."""
+        eventos = self.eventos_frame
+        self.eventos_frame = 0
+        tiempo = 0.0
+        pendientes = self._pendientes
+        if pendientes:
+            inicio = time.perf_counter()
+            # Cada cola se cambia por una vacia antes de entregarla: si un suscriptor
+            # encola durante el despacho, eso queda para el proximo tick
+            self._pendientes, self._pendientes_libres = self._pendientes_libres, pendientes
+            colas = self._colas
+            libres = self._colas_libres
+            for evento_id in pendientes:
+                cola = colas[evento_id]
+                colas[evento_id] = libres[evento_id]
+                for _, _, callback, lote in self._suscriptores[evento_id]:
+                    if lote:
+                        callback(cola)
+                    else:
+                        for payload in cola:
+                            callback(payload)
+                cola.clear()
+                libres[evento_id] = cola
+            pendientes.clear()
+            tiempo = time.perf_counter() - inicio
+
+        self.tiempo_despacho = tiempo
+        self.tiempo_despacho_total += tiempo
+        self.eventos_ultimo_frame = eventos
+        self.eventos_total += eventos
+        self.despachos += 1
+
+    def estadisticas(self):
+        return {
+            "eventos_ultimo_frame": self.eventos_ultimo_frame,
+            "eventos_total": self.eventos_total,
+            "despachos": self.despachos,
+            "tiempo_despacho_ms": self.tiempo_despacho * 1000,
+            "tiempo_despacho_medio_ms": (
+                self.tiempo_despacho_total * 1000 / self.despachos if self.despachos else 0.0
+            ),
+        }
@@ -3,8 +3,10 @@ import sys
 import pygame
 from m.jugador import Jugador
 from m.nivel import Nivel
+from m.nivel_binario import EXTENSION_NIVEL_BINARIO
 from v.sprite_loader import SpriteLoader
 from v.render import Render
+from v.overlay_perfilador import OverlayPerfilador
 from c.input_handler import InputHandler
 from c.event_bus import EventBus
 from c.state_factory import StateFactory
@@ -13,7 +15,17 @@ from c.state_factory import StateFactory
 class GameController:
     """Controlador principal del juego con maquina de estados"""
 
-    def __init__(self, ancho=800, alto=600, fps=60):
+    def __init__(self, ancho=800, alto=600, fps=60, headless=False, ruta_nivel=None, grabador=None, perfilador=None):
+        # Modo headless: driver de video/audio ficticio, sin ventana ni renderizado
+        self.headless = headless
+        # Nivel a cargar (None = niveles/nivel1) y GrabadorEntradas opcional
+        self.ruta_nivel = ruta_nivel
+        self.grabador = grabador
+        # Perfilador opcional de tiempos por fase (F3 muestra/oculta el overlay)
+        self.perfilador = perfilador
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
 
         # Configuracion de la ventana
@@ -35,12 +47,25 @@ class GameController:
         self.cargar_nivel_principal()
         self.inicializar_componentes()
         self.configurar_estados()
+        if self.perfilador is not None:
+            self.instrumentar_perfilador()
+
+        # Sin menu que mostrar, la simulacion headless arranca directamente en juego
+        if self.headless:
+            self.cambiar_estado("juego")
 
     def cargar_nivel_principal(self):
         """Carga el nivel base desde datos externos"""
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        proyecto_dir = os.path.dirname(base_dir)
-        nivel_path = os.path.join(proyecto_dir, "niveles", "nivel1.json")
+        if self.ruta_nivel is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            proyecto_dir = os.path.dirname(base_dir)
+            nivel_path = os.path.join(proyecto_dir, "niveles", "nivel1.json")
+            # Si existe una version compilada al dia, se usa (carga perezosa por trozos)
+            compilado = os.path.splitext(nivel_path)[0] + EXTENSION_NIVEL_BINARIO
+            if os.path.exists(compilado) and os.path.getmtime(compilado) >= os.path.getmtime(nivel_path):
+                nivel_path = compilado
+            self.ruta_nivel = nivel_path
+        nivel_path = self.ruta_nivel
         self.nivel_actual = Nivel.desde_archivo(nivel_path, ancho_ventana=self.ancho, alto_ventana=self.alto)
 
     def inicializar_componentes(self):
@@ -52,6 +77,8 @@ class GameController:
             altura_suelo=self.nivel_actual.altura_suelo,
             fondo=self.nivel_actual.fondo,
         )
+        if not self.headless:
+            self.render.preparar_nivel(self.nivel_actual)
         self.sprite_loader = SpriteLoader()
         self.sprite_loader.cargar_sprites()
 
@@ -70,6 +97,7 @@ class GameController:
             self.input_handler,
             self.jugador,
             self.nivel_actual,
+            fps=self.fps,
         )
 
         self.menu_state = factory.crear_menu_state()
@@ -82,6 +110,31 @@ class GameController:
         self.event_bus.suscribir("game_over", self.game_over)
         self.event_bus.suscribir("victoria", self.victoria)
 
+    def instrumentar_perfilador(self):
+        """Reparte actualizar y renderizar en subfases del perfilador y activa el overlay."""
+        perfilador = self.perfilador
+        subfases = {
+            "actualizar/jugador": (self.jugador, ["update", "actualizar_frame_animacion"]),
+            "actualizar/enemigos": (self.play_state, ["actualizar_enemigos"]),
+            "actualizar/proyectiles": (self.play_state, ["actualizar_proyectiles"]),
+            "actualizar/buffs": (self.play_state, ["actualizar_buffs"]),
+            "actualizar/colisiones": (
+                self.play_state,
+                ["actualizar_fase_amplia", "verificar_pisar_enemigos", "verificar_derrota", "verificar_victoria"],
+            ),
+            "actualizar/activacion": (self.play_state, ["materializar_cercanos", "actualizar_activacion"]),
+            "actualizar/eventos": (self.event_bus, ["despachar"]),
+        }
+        for fase, (objeto, metodos) in subfases.items():
+            for metodo in metodos:
+                perfilador.instrumentar(objeto, metodo, fase)
+        for metodo in dir(Render):
+            if metodo.startswith("dibujar_") or metodo in ("limpiar_pantalla", "actualizar_pantalla"):
+                perfilador.instrumentar(self.render, metodo, f"renderizar/{metodo}")
+
+        if not self.headless:
+            self.render.superposicion = OverlayPerfilador(perfilador, self.fps)
+
     def cambiar_estado(self, nuevo_estado):
         """Cambia el estado actual si es valido"""
         if nuevo_estado == "menu":
@@ -89,11 +142,14 @@ class GameController:
             self.render.set_camara(0)
         elif nuevo_estado == "juego":
             if self.estado_actual == self.menu_state:
+                if self.grabador is not None:
+                    self.grabador.iniciar(self)
                 self.play_state.reset()
             self.estado_actual = self.play_state
         elif nuevo_estado == "pausa":
             self.pause_state.capturar_snapshot()
             self.estado_actual = self.pause_state
+        self.estado_actual.al_entrar()
 
     def game_over(self, _payload=None):
         """Regresa al menu al perder"""
@@ -108,24 +164,94 @@ class GameController:
 
     def ejecutar(self):
         """Loop principal del juego"""
+        perfilador = self.perfilador
         while self.corriendo:
+            if perfilador is not None:
+                perfilador.iniciar_frame()
             eventos = pygame.event.get()
+            if perfilador is not None:
+                perfilador.marcar("eventos")
 
             # Eventos globales
             for evento in eventos:
                 if evento.type == pygame.QUIT:
                     self.corriendo = False
+                elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3:
+                    if self.render.superposicion is not None:
+                        self.render.superposicion.alternar()
 
             # Delegar en el estado actual
-            self.estado_actual.manejar_eventos(eventos)
+            estado = self.estado_actual
+            estado.manejar_eventos(eventos)
+            if perfilador is not None:
+                perfilador.marcar("manejar_eventos")
+            actualiza_juego = self.estado_actual is self.play_state
             self.estado_actual.actualizar()
+            if perfilador is not None:
+                perfilador.marcar("actualizar")
+            if self.grabador is not None and (estado is self.play_state or actualiza_juego):
+                self.grabador.registrar_frame(eventos, estado is self.play_state, actualiza_juego)
+                if self.estado_actual is self.menu_state:
+                    # La partida grabada termina al volver al menu (derrota, victoria o ESC)
+                    self.grabador.terminar()
+                if perfilador is not None:
+                    perfilador.marcar("grabacion")
             self.estado_actual.renderizar()
+            if perfilador is not None:
+                perfilador.marcar("renderizar")
 
             self.reloj.tick(self.fps)
+            if perfilador is not None:
+                # Tiempo ocioso esperando al reloj: lo que sobra del presupuesto del frame
+                perfilador.marcar("espera")
+                perfilador.cerrar_frame()
 
         self.cerrar()
 
+    def reiniciar(self):
+        """Reinicia la partida y deja el juego en PlayState."""
+        self.play_state.reset()
+        self.estado_actual = self.play_state
+
+    def step(self, n_ticks=1, inputs=None):
+        """
+        Avanza la simulacion n_ticks pasos fijos de PlayState sin renderizar ni
+        esperar al reloj (tan rapido como permita la CPU).
+
+        Args:
+            n_ticks: cantidad de ticks a simular
+            inputs: teclas presionadas. Un set/frozenset de codigos se aplica a
+                todos los ticks; una secuencia aporta un iterable de codigos por
+                tick (los ticks sin entrada no presionan nada).
+
+        Returns:
+            Ticks realmente simulados (se detiene si la partida termina).
+        """
+        constante = isinstance(inputs, (set, frozenset))
+        simulados = 0
+        try:
+            for tick in range(n_ticks):
+                if self.estado_actual is not self.play_state:
+                    break
+                if constante:
+                    teclas = inputs
+                elif inputs is not None and tick < len(inputs):
+                    teclas = inputs[tick]
+                else:
+                    teclas = ()
+                self.input_handler.establecer_teclas(teclas)
+                self.play_state.manejar_eventos([])
+                self.play_state.actualizar()
+                simulados += 1
+        finally:
+            self.input_handler.establecer_teclas(None)
+        return simulados
+
     def cerrar(self):
         """Cierra el juego correctamente"""
+        if self.grabador is not None:
+            self.grabador.terminar()
+        if self.perfilador is not None:
+            self.perfilador.exportar()
         pygame.quit()
         sys.exit()
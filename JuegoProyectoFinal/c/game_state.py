@@ -2,6 +2,12 @@ import pygame
 from m.entidad_factory import EntidadFactory
 from m.buff_decorators import InvencibleBuff, SaltoBuff, VelocidadBuff
 from m.buff_manager import BuffManager
+from m.enemigo_batch import EnemigoBatch
+from m.fase_amplia import FaseAmplia
+from m.pool_proyectiles import PoolProyectiles
+from m.reloj_simulacion import RelojSimulacion
+from m.ventana_activacion import VentanaActivacion
+from v.cache_textos import render_texto
 
 
 class GameState:
@@ -16,6 +22,14 @@ class GameState:
     def renderizar(self):
         raise NotImplementedError
 
+    def al_entrar(self):
+        """Se llama cuando el estado pasa a ser el actual (opcional)."""
+        pass
+
+
+# Eventos de ventana que obligan a redibujar las pantallas estaticas
+EVENTOS_EXPOSICION = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
 
 class MenuState(GameState):
     """Estado de menu simple para iniciar o salir del juego."""
@@ -26,9 +40,22 @@ class MenuState(GameState):
         self.fuente = pygame.font.SysFont("arial", 36)
         self.fuente_chica = pygame.font.SysFont("arial", 24)
 
+        # Textos constantes: se renderizan una sola vez
+        self.mensaje = render_texto(self.fuente, "Demo estilo Mario", (255, 255, 255))
+        self.subtitulo = render_texto(
+            self.fuente_chica, "ENTER para jugar  |  ESC para salir", (240, 240, 240)
+        )
+        # La pantalla del menu es estatica: solo se dibuja cuando algo cambia
+        self.sucio = True
+
+    def al_entrar(self):
+        self.sucio = True
+
     def manejar_eventos(self, eventos):
         for evento in eventos:
-            if evento.type == pygame.KEYDOWN:
+            if evento.type in EVENTOS_EXPOSICION:
+                self.sucio = True
+            elif evento.type == pygame.KEYDOWN:
                 if evento.key in (pygame.K_RETURN, pygame.K_SPACE):
                     self.event_bus.emitir("cambiar_estado", "juego")
                 elif evento.key == pygame.K_ESCAPE:
@@ -38,48 +65,67 @@ class MenuState(GameState):
         pass
 
     def renderizar(self):
+        if not self.sucio:
+            # Nada cambio desde el ultimo frame: no se dibuja ni se actualiza la pantalla
+            return
+
         self.render.limpiar_pantalla()
         self.render.dibujar_suelo()
 
-        mensaje = self.fuente.render("Demo estilo Mario", True, (255, 255, 255))
-        subtitulo = self.fuente_chica.render(
-            "ENTER para jugar  |  ESC para salir", True, (240, 240, 240)
-        )
-
         ventana = self.render.ventana
         ventana.blit(
-            mensaje, mensaje.get_rect(center=(self.render.ancho // 2, self.render.alto // 2 - 30))
+            self.mensaje, self.mensaje.get_rect(center=(self.render.ancho // 2, self.render.alto // 2 - 30))
         )
         ventana.blit(
-            subtitulo, subtitulo.get_rect(center=(self.render.ancho // 2, self.render.alto // 2 + 10))
+            self.subtitulo, self.subtitulo.get_rect(center=(self.render.ancho // 2, self.render.alto // 2 + 10))
         )
 
         self.render.actualizar_pantalla()
+        self.sucio = False
 
 
 class PlayState(GameState):
     """Estado principal de juego."""
 
-    def __init__(self, event_bus, render, sprite_loader, input_handler, jugador, nivel):
+    # Desde esta cantidad de enemigos se usa el motor vectorizado (EnemigoBatch)
+    UMBRAL_BATCH_ENEMIGOS = 100
+    # Niveles compilados: se materializan los trozos a esta distancia (px) de la camara
+    # (cubre el alcance de disparo de los enemigos)
+    MARGEN_CARGA = 600
+    # Enemigos y buffos a mas de esta distancia (px) de la camara duermen:
+    # sin fisica, IA ni disparos hasta que la camara se acerca
+    MARGEN_ACTIVACION = 400
+
+    def __init__(self, event_bus, render, sprite_loader, input_handler, jugador, nivel, fps=60):
         self.event_bus = event_bus
+        # Eventos frecuentes de juego: se encolan y se despachan al final de cada tick
+        self.evento_enemigo_eliminado = event_bus.registrar("enemigo_eliminado")
         self.render = render
         self.sprite_loader = sprite_loader
         self.input_handler = input_handler
         self.jugador = jugador
         self.nivel = nivel
+        self.chunks_entidades = set()  # trozos del nivel compilado con entidades ya creadas
         self.enemigos_data = list(self.nivel.enemigos)
         self.enemigos = EntidadFactory.crear_enemigos(self.enemigos_data)
+        self.motor_enemigos = self.crear_motor_enemigos()
         self.buffos_data = list(self.nivel.buffos)
         self.buffos = EntidadFactory.crear_buffos(self.buffos_data)
-        self.proyectiles = []
+        # Tiempo simulado: avanza un paso fijo por tick (no depende del reloj real)
+        self.reloj = RelojSimulacion(fps)
+        self.proyectiles = PoolProyectiles(reloj=self.reloj)
         self.buff_classes = {
             "velocidad": VelocidadBuff,
             "salto": SaltoBuff,
             "invencible": InvencibleBuff,
         }
-        self.buff_manager = BuffManager(self.buff_classes)
+        self.buff_manager = BuffManager(self.buff_classes, self.reloj)
         self.buff_timers = {}
         self.limite_caida = self.render.alto + 150
+        self.fase_amplia = FaseAmplia()
+        self.crear_ventanas_activacion()
+        self.materializar_cercanos()
+        self.actualizar_activacion()
 
     def reset(self):
         """Reinicia jugador, enemigos y camara."""
@@ -88,13 +134,24 @@ class PlayState(GameState):
         self.jugador.rect.y = spawn_y
         self.jugador.velocidad_x = 0
         self.jugador.velocidad_y = 0
+        self.jugador.en_suelo = False
         self.enemigos = EntidadFactory.crear_enemigos(self.enemigos_data)
+        self.motor_enemigos = self.crear_motor_enemigos()
         self.buffos = EntidadFactory.crear_buffos(self.buffos_data)
-        self.proyectiles = []
+        self.proyectiles.limpiar()
+        self.reloj.reset()
         self.buff_manager.reset()
         self.buff_timers = {}
         self.jugador.reset_estadisticas()
         self.render.set_camara(0)
+        if self.nivel.perezoso:
+            # Las entidades vuelven a crearse a medida que la camara se acerca
+            self.chunks_entidades.clear()
+            self.enemigos = []
+            self.buffos = []
+        self.crear_ventanas_activacion()
+        self.materializar_cercanos()
+        self.actualizar_activacion()
 
     def manejar_eventos(self, eventos):
         for evento in eventos:
@@ -108,24 +165,101 @@ class PlayState(GameState):
         self.input_handler.manejar_salto(self.jugador)
 
     def actualizar(self):
+        self.reloj.avanzar()
         self.jugador.actualizar_frame_animacion(self.sprite_loader.get_num_frames())
-        self.jugador.update(self.nivel.ancho_mundo, self.nivel.plataformas)
+        self.jugador.update(self.nivel.ancho_mundo, self.nivel.indice_plataformas)
 
         posicion_jugador = (self.jugador.rect.centerx, self.jugador.rect.centery)
-        for enemigo in self.enemigos:
-            enemigo.update(self.nivel.plataformas, posicion_jugador)
-            self.intentar_disparar(enemigo)
+        self.actualizar_enemigos(posicion_jugador)
 
         self.actualizar_proyectiles()
         objetivo_camara = self.jugador.rect.centerx - self.render.ancho // 2
         limite = max(0, self.nivel.ancho_mundo - self.render.ancho)
         objetivo_camara = max(0, min(objetivo_camara, limite))
         self.render.set_camara(objetivo_camara)
+        self.materializar_cercanos()
+        self.actualizar_activacion()
 
+        self.actualizar_fase_amplia()
         self.actualizar_buffs()
         self.verificar_pisar_enemigos()
         self.verificar_derrota()
         self.verificar_victoria()
+        self.event_bus.despachar()
+
+    def materializar_cercanos(self):
+        """
+        Con niveles compilados, crea plataformas, enemigos y buffos de los trozos
+        cercanos a la camara y al jugador. Sin efecto con niveles cargados enteros.
+        """
+        if not self.nivel.perezoso:
+            return
+        x_min = min(self.render.camara_x, self.jugador.rect.left) - self.MARGEN_CARGA
+        x_max = max(self.render.camara_x + self.render.ancho, self.jugador.rect.right) + self.MARGEN_CARGA
+        self.nivel.cargar_plataformas(x_min, x_max)
+
+        nuevos = []
+        for numero in self.nivel.chunks_en_rango(x_min, x_max):
+            if numero in self.chunks_entidades:
+                continue
+            self.chunks_entidades.add(numero)
+            enemigos_data, buffos_data = self.nivel.entidades_de_chunk(numero)
+            for data in enemigos_data:
+                # La patrulla puede salir de la ventana: sus plataformas se cargan igual
+                self.nivel.cargar_plataformas(
+                    min(data["x"], data["limite_izq"]),
+                    max(data["x"], data["limite_der"]) + data["ancho"],
+                )
+            nuevos.extend(EntidadFactory.crear_enemigos(enemigos_data))
+            buffos = EntidadFactory.crear_buffos(buffos_data)
+            self.buffos.extend(buffos)
+            self.activacion_buffos.agregar(buffos)
+        if nuevos:
+            self.enemigos.extend(nuevos)
+            self.activacion_enemigos.agregar(nuevos)
+            self.motor_enemigos = self.crear_motor_enemigos()
+
+    def crear_ventanas_activacion(self):
+        """Todas las entidades empiezan dormidas; actualizar_activacion despierta las cercanas."""
+        self.activacion_enemigos = VentanaActivacion(self.enemigos)
+        self.activacion_buffos = VentanaActivacion(self.buffos)
+        self._mascara_enemigos = None
+        self._clave_mascara = None
+
+    def actualizar_activacion(self):
+        """Despierta las entidades que entran en la ventana de la camara y duerme las que salen."""
+        x_min = self.render.camara_x - self.MARGEN_ACTIVACION
+        x_max = self.render.camara_x + self.render.ancho + self.MARGEN_ACTIVACION
+        self.activacion_enemigos.actualizar(x_min, x_max)
+        self.activacion_buffos.actualizar(x_min, x_max)
+
+    def mascara_enemigos_activos(self):
+        """Filas de EnemigoBatch con enemigos despiertos (se recalcula solo si algo cambio)."""
+        clave = (self.motor_enemigos, self.activacion_enemigos.version)
+        if self._clave_mascara != clave:
+            self._mascara_enemigos = self.motor_enemigos.mascara_de(self.activacion_enemigos.activas)
+            self._clave_mascara = clave
+        return self._mascara_enemigos
+
+    def crear_motor_enemigos(self):
+        """EnemigoBatch para poblaciones grandes; None usa Enemigo.update uno a uno."""
+        if len(self.enemigos) < self.UMBRAL_BATCH_ENEMIGOS:
+            return None
+        return EnemigoBatch(self.enemigos, self.nivel.indice_plataformas)
+
+    def actualizar_enemigos(self, posicion_jugador):
+        """Mueve los enemigos despiertos (uno a uno o vectorizado) y luego intenta disparar."""
+        activos = self.activacion_enemigos.activas
+        if self.motor_enemigos is not None:
+            mascara = self.mascara_enemigos_activos()
+            self.motor_enemigos.paso(posicion_jugador[0], mascara)
+            self.motor_enemigos.sincronizar(mascara)
+        else:
+            for enemigo in activos:
+                enemigo.update(self.nivel.indice_plataformas, posicion_jugador)
+
+        for enemigo in activos:
+            self.intentar_disparar(enemigo)
 
     def intentar_disparar(self, enemigo):
         """Dispara proyectil si arma lo permite y jugador en alcance horizontal."""
@@ -137,8 +271,8 @@ class PlayState(GameState):
         if not arma or arma.velocidad_proj == 0:
             return
 
-        ahora = pygame.time.get_ticks()
-        if ahora - enemigo.ultimo_disparo < arma.cooldown_ms:
+        ahora = self.reloj.ahora()
+        if enemigo.ultimo_disparo is not None and ahora - enemigo.ultimo_disparo < arma.cooldown_ms:
             return
 
         distancia_x = abs(enemigo.rect.centerx - self.jugador.rect.centerx)
@@ -146,30 +280,37 @@ class PlayState(GameState):
             return
 
         direccion = 1 if self.jugador.rect.centerx >= enemigo.rect.centerx else -1
-        proyectil = arma.crear_proyectil(enemigo.rect, direccion)
+        proyectil = arma.disparar(self.proyectiles, enemigo.rect, direccion)
         if proyectil:
             enemigo.ultimo_disparo = ahora
-            self.proyectiles.append(proyectil)
 
     def actualizar_proyectiles(self):
-        """Mueve y limpia proyectiles activos."""
-        vivos = []
-        for proyectil in self.proyectiles:
-            proyectil.update()
-            if proyectil.vivo and -100 <= proyectil.rect.x <= self.nivel.ancho_mundo + 100:
-                vivos.append(proyectil)
-        self.proyectiles = vivos
+        """Mueve y limpia proyectiles activos (vectorizado en el pool)."""
+        self.proyectiles.actualizar(-100, self.nivel.ancho_mundo + 100)
+
+    def actualizar_fase_amplia(self):
+        """Calcula una vez por tick los candidatos a colisionar con el jugador (solo entidades despiertas)."""
+        self.fase_amplia.actualizar(
+            self.jugador.rect,
+            {
+                "enemigos": self.activacion_enemigos.activas,
+                "proyectiles": self.proyectiles,
+                "buffos": self.activacion_buffos.activas,
+            },
+        )
 
     def actualizar_buffs(self):
         """Gestiona colision y expiracion de buffos."""
-        restantes = []
-        ahora = pygame.time.get_ticks()
-        for buffo in self.buffos:
+        recogidos = []
+        ahora = self.reloj.ahora()
+        for buffo in self.fase_amplia.obtener("buffos"):
             if self.jugador.rect.colliderect(buffo.rect):
                 self.buff_manager.activar(buffo.tipo, ahora)
-            else:
-                restantes.append(buffo)
-        self.buffos = restantes
+                recogidos.append(buffo)
+        if recogidos:
+            self.buffos = [buffo for buffo in self.buffos if buffo not in recogidos]
+            for buffo in recogidos:
+                self.activacion_buffos.descartar(buffo)
         self.buff_timers = self.buff_manager.aplicar(self.jugador, ahora)
 
     def verificar_pisar_enemigos(self):
@@ -179,7 +320,7 @@ class PlayState(GameState):
             return
 
         enemigos_eliminados = []
-        for enemigo in self.enemigos:
+        for enemigo in self.fase_amplia.obtener("enemigos"):
             if self.jugador.rect.colliderect(enemigo.rect):
                 # Verificar si el jugador viene desde arriba
                 # El jugador debe estar cayendo y su parte inferior debe estar cerca de la parte superior del enemigo
@@ -191,16 +332,20 @@ class PlayState(GameState):
                     # Hacer rebotar al jugador (como en Mario)
                     self.jugador.velocidad_y = -10  # Rebote al pisar enemigo
 
-                    # Emitir evento de enemigo eliminado (patrón Observer)
-                    self.event_bus.emitir("enemigo_eliminado", enemigo)
+                    # Evento de enemigo eliminado (patrón Observer), entregado en lote al final del tick
+                    self.event_bus.encolar(self.evento_enemigo_eliminado, enemigo)
 
         # Eliminar enemigos pisados de la lista
         for enemigo in enemigos_eliminados:
             self.enemigos.remove(enemigo)
+            self.activacion_enemigos.descartar(enemigo)
+            self.fase_amplia.descartar("enemigos", enemigo)
+            if self.motor_enemigos is not None:
+                self.motor_enemigos.descartar(enemigo)
 
     def verificar_derrota(self):
-        """Termina la partida si toca enemigo lateralmente o cae al vacio."""
-        for enemigo in self.enemigos:
+        """Termina la partida si toca enemigo lateralmente o cae al vacio (payload: causa)."""
+        for enemigo in self.fase_amplia.obtener("enemigos"):
             if self.jugador.rect.colliderect(enemigo.rect) and not self.jugador.invencible:
                 # Verificar si NO viene desde arriba (para no morir al pisar)
                 margen_pisada = 15
@@ -208,16 +353,16 @@ class PlayState(GameState):
                                      self.jugador.rect.bottom - margen_pisada <= enemigo.rect.centery)
 
                 if not viene_desde_arriba:
-                    self.event_bus.emitir("game_over")
+                    self.event_bus.emitir("game_over", "enemigo")
                     return
 
-        for proyectil in self.proyectiles:
+        for proyectil in self.fase_amplia.obtener("proyectiles"):
             if proyectil.vivo and self.jugador.rect.colliderect(proyectil.rect) and not self.jugador.invencible:
-                self.event_bus.emitir("game_over")
+                self.event_bus.emitir("game_over", "proyectil")
                 return
 
         if self.jugador.rect.top > self.limite_caida:
-            self.event_bus.emitir("game_over")
+            self.event_bus.emitir("game_over", "caida")
 
     def verificar_victoria(self):
         """Gana si llega a la meta."""
@@ -227,10 +372,11 @@ class PlayState(GameState):
     def renderizar(self):
         self.render.limpiar_pantalla()
         self.render.dibujar_suelo()
-        self.render.dibujar_plataformas(self.nivel.plataformas)
-        self.render.dibujar_enemigos(self.enemigos)
+        self.render.dibujar_plataformas(self.nivel.indice_plataformas)
+        # Las entidades dormidas quedan fuera de la camara: solo se dibujan las despiertas
+        self.render.dibujar_enemigos(self.activacion_enemigos)
         self.render.dibujar_proyectiles(self.proyectiles)
-        self.render.dibujar_buffos(self.buffos)
+        self.render.dibujar_buffos(self.activacion_buffos)
         self.render.dibujar_meta(self.nivel.meta_x)
         self.render.dibujar_buff_timers(self.buff_timers)
 
@@ -268,9 +414,40 @@ class PauseState(GameState):
             "saltar": "Saltar",
         }
 
+        # Superficies cacheadas: overlay semitransparente y textos constantes
+        self.overlay = pygame.Surface((self.render.ancho, self.render.alto))
+        self.overlay.set_alpha(180)
+        self.overlay.fill((20, 20, 40))
+        self.titulo = render_texto(self.fuente, "PAUSA - Configurar Controles", (255, 255, 255))
+        self.instruccion_espera = render_texto(self.fuente_chica, "Presiona una tecla...", (255, 255, 100))
+        self.instruccion_menu = render_texto(
+            self.fuente_mini, "UP/DOWN: Navegar  |  ENTER: Cambiar  |  ESC: Volver", (200, 200, 200)
+        )
+
+        # Dirty rects: fondo compuesto (snapshot + overlay) y zona del menu que cambia
+        self.fondo = None
+        self.area_menu = pygame.Rect(0, 110, self.render.ancho, 260)
+        self.sucio = True
+        self.redibujar_todo = True
+
     def capturar_snapshot(self):
         """Captura la pantalla actual para usarla como fondo."""
         self.snapshot = self.render.ventana.copy()
+        self.fondo = None
+        self.sucio = True
+        self.redibujar_todo = True
+
+    def componer_fondo(self):
+        """Snapshot (o color liso) con el overlay ya aplicado; se calcula una vez por pausa."""
+        if self.snapshot:
+            fondo = self.snapshot.copy()
+        else:
+            # Si no hay snapshot, solo un fondo oscuro
+            fondo = pygame.Surface((self.render.ancho, self.render.alto))
+            fondo.fill((20, 20, 40))
+        fondo.blit(self.overlay, (0, 0))
+        fondo.blit(self.titulo, self.titulo.get_rect(center=(self.render.ancho // 2, 80)))
+        return fondo
 
     def obtener_nombre_tecla(self, tecla):
         """Convierte el codigo de tecla pygame a nombre legible."""
@@ -290,10 +467,18 @@ class PauseState(GameState):
         self.accion_seleccionada = 0
         self.esperando_tecla = False
         self.snapshot = None
+        self.fondo = None
+        self.sucio = True
+        self.redibujar_todo = True
 
     def manejar_eventos(self, eventos):
         for evento in eventos:
-            if evento.type == pygame.KEYDOWN:
+            if evento.type in EVENTOS_EXPOSICION:
+                self.sucio = True
+                self.redibujar_todo = True
+            elif evento.type == pygame.KEYDOWN:
+                # Cualquier tecla puede cambiar seleccion o asignaciones
+                self.sucio = True
                 if self.esperando_tecla:
                     # Asignar nueva tecla (evitar teclas reservadas para el menu)
                     teclas_reservadas = [pygame.K_ESCAPE, pygame.K_UP, pygame.K_DOWN, pygame.K_RETURN, pygame.K_p]
@@ -320,34 +505,23 @@ class PauseState(GameState):
         pass
 
     def renderizar(self):
-        # Dibujar snapshot del juego de fondo (congelado)
-        if self.snapshot:
-            self.render.ventana.blit(self.snapshot, (0, 0))
-        else:
-            # Si no hay snapshot, solo dibujar un fondo oscuro
-            self.render.ventana.fill((20, 20, 40))
+        if not self.sucio:
+            # Pausa sin cambios: no se dibuja ni se actualiza la pantalla
+            return
 
-        # Overlay semitransparente
-        overlay = pygame.Surface((self.render.ancho, self.render.alto))
-        overlay.set_alpha(180)
-        overlay.fill((20, 20, 40))
-        self.render.ventana.blit(overlay, (0, 0))
+        if self.fondo is None:
+            self.fondo = self.componer_fondo()
 
-        # Titulo
-        titulo = self.fuente.render("PAUSA - Configurar Controles", True, (255, 255, 255))
-        self.render.ventana.blit(
-            titulo, titulo.get_rect(center=(self.render.ancho // 2, 80))
-        )
+        # Fondo congelado (snapshot + overlay + titulo): completo o solo la zona del menu
+        if self.redibujar_todo:
+            self.render.ventana.blit(self.fondo, (0, 0))
+            areas = [self.render.ventana.get_rect()]
+        else:
+            self.render.ventana.blit(self.fondo, self.area_menu, self.area_menu)
+            areas = [self.area_menu]
 
         # Instrucciones
-        if self.esperando_tecla:
-            instruccion = self.fuente_chica.render(
-                "Presiona una tecla...", True, (255, 255, 100)
-            )
-        else:
-            instruccion = self.fuente_mini.render(
-                "UP/DOWN: Navegar  |  ENTER: Cambiar  |  ESC: Volver", True, (200, 200, 200)
-            )
+        instruccion = self.instruccion_espera if self.esperando_tecla else self.instruccion_menu
         self.render.ventana.blit(
             instruccion, instruccion.get_rect(center=(self.render.ancho // 2, 130))
         )
@@ -362,15 +536,17 @@ class PauseState(GameState):
 
             # Indicador de seleccion
             if i == self.accion_seleccionada:
-                indicador = self.fuente_chica.render(">", True, (255, 255, 100))
+                indicador = render_texto(self.fuente_chica, ">", (255, 255, 100))
                 self.render.ventana.blit(indicador, (self.render.ancho // 2 - 200, y_inicial + i * 60))
 
             # Nombre de accion
-            texto_accion = self.fuente_chica.render(f"{nombre}:", True, color)
+            texto_accion = render_texto(self.fuente_chica, f"{nombre}:", color)
             self.render.ventana.blit(texto_accion, (self.render.ancho // 2 - 180, y_inicial + i * 60))
 
             # Teclas asignadas
-            texto_teclas = self.fuente_chica.render(teclas_str, True, (150, 255, 150))
+            texto_teclas = render_texto(self.fuente_chica, teclas_str, (150, 255, 150))
             self.render.ventana.blit(texto_teclas, (self.render.ancho // 2 + 50, y_inicial + i * 60))
 
-        self.render.actualizar_pantalla()
+        self.render.actualizar_pantalla(areas)
+        self.sucio = False
+        self.redibujar_todo = False
@@ -0,0 +1,304 @@
+"""
+Grabacion y reproduccion deterministas de partidas.
+
+Una grabacion guarda, por frame de juego, los comandos que ejecuto
+InputHandler (movimiento y salto), las teclas ESC/P que recibio
+PlayState.manejar_eventos y si PlayState.actualizar corrio, junto con la
+semilla de azar, el tamano de ventana, los fps y el nivel (ruta + SHA-1).
+Tambien guarda un hash del estado tras cada frame; al reproducir se compara
+frame a frame, asi que la reproduccion sirve de prueba de determinismo y de
+benchmark de ticks por segundo.
+
+Formato (little-endian):
+    cabecera   CABECERA (magic, version, fps, semilla, ancho, alto, frames, largo ruta, SHA-1 nivel)
+    ruta       utf-8, relativa a JuegoProyectoFinal/ si el nivel esta dentro
+    corridas   uint32 cantidad + uint8 banderas + uint16 repeticiones (RLE de los frames)
+    hashes     uint32 por frame (CRC-32 del estado)
+
+Grabar:      python main.py --grabar partida.grab
+Reproducir:  python -m c.grabacion partida.grab [--sin-hash]
+"""
+import hashlib
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+
+import numpy as np
+import pygame
+
+MAGIC = b"GRAB"
+VERSION = 1
+CABECERA = struct.Struct("<4sHHQHHII20s")
+
+# Banderas de cada frame
+MANEJO_EVENTOS = 1 << 0  # PlayState.manejar_eventos corrio en el frame
+ACTUALIZO = 1 << 1  # PlayState.actualizar corrio en el frame
+IZQUIERDA = 1 << 2
+DERECHA = 1 << 3
+SALTO = 1 << 4
+ESCAPE = 1 << 5
+PAUSA = 1 << 6
+
+MAX_REPETICIONES = 0xFFFF
+
+_PROYECTO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def sha1_archivo(ruta):
+    with open(ruta, "rb") as archivo:
+        return hashlib.sha1(archivo.read()).digest()
+
+
+def sembrar(semilla):
+    """Fija las fuentes de azar de la simulacion."""
+    random.seed(semilla)
+    np.random.seed(semilla & 0xFFFFFFFF)
+
+
+def hash_estado(play_state):
+    """
+    CRC-32 del estado simulado: jugador, reloj, enemigos despiertos, cantidades,
+    proyectiles vivos y buffos activos. Las entidades dormidas no cambian, por eso
+    solo se cuentan.
+    """
+    jugador = play_state.jugador
+    crc = zlib.crc32(struct.pack(
+        "<iiiiddBqii",
+        *jugador.rect,
+        jugador.velocidad_x,
+        jugador.velocidad_y,
+        bool(jugador.en_suelo),
+        play_state.reloj.ticks,
+        len(play_state.enemigos),
+        len(play_state.buffos),
+    ))
+    rects = [tuple(e.rect) for e in play_state.activacion_enemigos.activas]
+    crc = zlib.crc32(np.array(rects, dtype=np.int32).tobytes(), crc)
+    pool = play_state.proyectiles
+    vivos = pool.vivo
+    crc = zlib.crc32(pool.x[vivos].tobytes(), crc)
+    crc = zlib.crc32(pool.y[vivos].tobytes(), crc)
+    crc = zlib.crc32(",".join(sorted(play_state.buff_manager.activos)).encode("utf-8"), crc)
+    return crc
+
+
+class Grabacion:
+    """Datos de una partida grabada (banderas y hashes por frame)."""
+
+    def __init__(self, fps, semilla, ancho, alto, ruta_nivel, sha1_nivel, frames, hashes):
+        self.fps = fps
+        self.semilla = semilla
+        self.ancho = ancho
+        self.alto = alto
+        self.ruta_nivel = ruta_nivel
+        self.sha1_nivel = sha1_nivel
+        self.frames = np.asarray(frames, dtype=np.uint8)
+        self.hashes = np.asarray(hashes, dtype=np.uint32)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def ruta_nivel_absoluta(self):
+        if os.path.isabs(self.ruta_nivel):
+            return self.ruta_nivel
+        return os.path.join(_PROYECTO_DIR, self.ruta_nivel)
+
+    def guardar(self, ruta):
+        # Run-length de las banderas: las entradas suelen repetirse muchos frames seguidos
+        valores = []
+        repeticiones = []
+        for bandera in self.frames.tolist():
+            if valores and valores[-1] == bandera and repeticiones[-1] < MAX_REPETICIONES:
+                repeticiones[-1] += 1
+            else:
+                valores.append(bandera)
+                repeticiones.append(1)
+
+        ruta_nivel = self.ruta_nivel.encode("utf-8")
+        with open(ruta, "wb") as archivo:
+            archivo.write(CABECERA.pack(
+                MAGIC, VERSION, self.fps, self.semilla, self.ancho, self.alto,
+                len(self.frames), len(ruta_nivel), self.sha1_nivel,
+            ))
+            archivo.write(ruta_nivel)
+            archivo.write(struct.pack("<I", len(valores)))
+            archivo.write(np.array(valores, dtype=np.uint8).tobytes())
+            archivo.write(np.array(repeticiones, dtype="<u2").tobytes())
+            archivo.write(self.hashes.astype("<u4").tobytes())
+
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, "rb") as archivo:
+            datos = archivo.read()
+        (magic, version, fps, semilla, ancho, alto,
+         num_frames, largo_ruta, sha1_nivel) = CABECERA.unpack_from(datos, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{ruta} no es una grabacion compatible")
+
+        pos = CABECERA.size
+        ruta_nivel = datos[pos:pos + largo_ruta].decode("utf-8")
+        pos += largo_ruta
+        (num_corridas,) = struct.unpack_from("<I", datos, pos)
+        pos += 4
+        valores = np.frombuffer(datos, dtype=np.uint8, count=num_corridas, offset=pos)
+        pos += num_corridas
+        repeticiones = np.frombuffer(datos, dtype="<u2", count=num_corridas, offset=pos)
+        pos += 2 * num_corridas
+        hashes = np.frombuffer(datos, dtype="<u4", count=num_frames, offset=pos)
+        frames = np.repeat(valores, repeticiones)
+        return cls(fps, semilla, ancho, alto, ruta_nivel, sha1_nivel, frames, hashes)
+
+
+class GrabadorEntradas:
+    """
+    Graba la primera partida que se juegue (desde que se sale del menu hasta que
+    se vuelve a el) y la guarda en ruta al terminar.
+    """
+
+    def __init__(self, ruta, semilla=None):
+        self.ruta = ruta
+        self.semilla = semilla if semilla is not None else random.SystemRandom().getrandbits(63)
+        self.juego = None
+        self.frames = []
+        self.hashes = []
+        self.grabando = False
+        self.terminado = False
+
+    def iniciar(self, juego):
+        """Empieza a grabar; se llama justo antes de reiniciar PlayState."""
+        if self.grabando or self.terminado:
+            return
+        self.juego = juego
+        sembrar(self.semilla)
+        self.grabando = True
+
+    def registrar_frame(self, eventos, manejo_eventos, actualizo):
+        """Agrega un frame: comandos ejecutados, teclas de PlayState y hash del estado."""
+        if not self.grabando:
+            return
+        bandera = 0
+        if manejo_eventos:
+            bandera |= MANEJO_EVENTOS
+            entrada = self.juego.input_handler
+            if entrada.ultimo_movimiento is entrada.comando_izquierda:
+                bandera |= IZQUIERDA
+            elif entrada.ultimo_movimiento is entrada.comando_derecha:
+                bandera |= DERECHA
+            if entrada.ultimo_salto:
+                bandera |= SALTO
+            for evento in eventos:
+                if evento.type == pygame.KEYDOWN:
+                    if evento.key == pygame.K_ESCAPE:
+                        bandera |= ESCAPE
+                    elif evento.key == pygame.K_p:
+                        bandera |= PAUSA
+        if actualizo:
+            bandera |= ACTUALIZO
+        self.frames.append(bandera)
+        self.hashes.append(hash_estado(self.juego.play_state))
+
+    def terminar(self):
+        """Guarda la grabacion (si habia una en curso)."""
+        if not self.grabando:
+            return
+        self.grabando = False
+        self.terminado = True
+        ruta_nivel = os.path.abspath(self.juego.ruta_nivel)
+        relativa = os.path.relpath(ruta_nivel, _PROYECTO_DIR)
+        if not relativa.startswith(".."):
+            ruta_nivel = relativa
+        Grabacion(
+            self.juego.fps, self.semilla, self.juego.ancho, self.juego.alto,
+            ruta_nivel, sha1_archivo(self.juego.ruta_nivel), self.frames, self.hashes,
+        ).guardar(self.ruta)
+
+
+def reproducir(grabacion, verificar=True):
+    """
+    Reproduce una grabacion en modo headless, tan rapido como se pueda.
+
+    Returns:
+        dict con frames reproducidos, ticks simulados, segundos, ticks por
+        segundo y el primer frame cuyo hash no coincide (None si ninguno).
+    """
+    from c.game_controller import GameController
+
+    ruta_nivel = grabacion.ruta_nivel_absoluta()
+    if sha1_archivo(ruta_nivel) != grabacion.sha1_nivel:
+        raise ValueError(f"El nivel {grabacion.ruta_nivel} cambio desde la grabacion")
+
+    juego = GameController(grabacion.ancho, grabacion.alto, grabacion.fps, headless=True, ruta_nivel=ruta_nivel)
+    sembrar(grabacion.semilla)
+    juego.reiniciar()
+    estado = juego.play_state
+    entrada = juego.input_handler
+    teclas_izquierda = {entrada.action_keys["izquierda"]}
+    teclas_derecha = {entrada.action_keys["derecha"]}
+    tecla_salto = entrada.action_keys["saltar"]
+    evento_escape = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+    evento_pausa = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)
+    hashes = grabacion.hashes.tolist()
+
+    ticks = 0
+    divergencia = None
+    inicio = time.perf_counter()
+    try:
+        for numero, bandera in enumerate(grabacion.frames.tolist()):
+            if bandera & MANEJO_EVENTOS:
+                teclas = set()
+                if bandera & IZQUIERDA:
+                    teclas = set(teclas_izquierda)
+                elif bandera & DERECHA:
+                    teclas = set(teclas_derecha)
+                if bandera & SALTO:
+                    teclas.add(tecla_salto)
+                entrada.establecer_teclas(teclas)
+                eventos = []
+                if bandera & ESCAPE:
+                    eventos.append(evento_escape)
+                if bandera & PAUSA:
+                    eventos.append(evento_pausa)
+                estado.manejar_eventos(eventos)
+            if bandera & ACTUALIZO:
+                estado.actualizar()
+                ticks += 1
+            if verificar and hash_estado(estado) != hashes[numero]:
+                divergencia = numero
+                break
+    finally:
+        entrada.establecer_teclas(None)
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "frames": numero + 1 if len(grabacion) else 0,
+        "ticks": ticks,
+        "segundos": segundos,
+        "ticks_por_segundo": ticks / segundos if segundos > 0 else float("inf"),
+        "divergencia": divergencia,
+    }
+
+
+def main():
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not argumentos:
+        print("Uso: python -m c.grabacion partida.grab [--sin-hash]")
+        sys.exit(1)
+    verificar = "--sin-hash" not in sys.argv
+    grabacion = Grabacion.cargar(argumentos[0])
+    resultado = reproducir(grabacion, verificar)
+    print(
+        f"Frames: {resultado['frames']}/{len(grabacion)}  Ticks: {resultado['ticks']}  "
+        f"{resultado['segundos'] * 1000:.1f} ms  ({resultado['ticks_por_segundo']:.0f} ticks/s)"
+    )
+    if resultado["divergencia"] is not None:
+        print(f"ERROR: el estado difiere desde el frame {resultado['divergencia']}")
+        sys.exit(1)
+    if verificar:
+        print("Reproduccion identica a la grabacion")
+
+
+if __name__ == "__main__":
+    main()
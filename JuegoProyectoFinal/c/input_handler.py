@@ -8,6 +8,16 @@ from c.commands import (
 )
 
 
+class TeclasSimuladas:
+    """Estado de teclado inyectado (modo headless): se indexa como pygame.key.get_pressed()."""
+
+    def __init__(self, teclas=()):
+        self.teclas = frozenset(teclas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.teclas
+
+
 class InputHandler:
     """Clase encargada de manejar las entradas del usuario usando el patron Command.
 
@@ -41,6 +51,23 @@ class InputHandler:
             "saltar": pygame.K_SPACE,
         }
 
+        # Teclado simulado (None = leer el teclado real)
+        self.teclas_simuladas = None
+
+        # Ultimos comandos ejecutados (los lee el grabador de entradas)
+        self.ultimo_movimiento = None
+        self.ultimo_salto = False
+
+    def establecer_teclas(self, teclas):
+        """Inyecta las teclas presionadas (iterable de codigos); None vuelve al teclado real."""
+        self.teclas_simuladas = None if teclas is None else TeclasSimuladas(teclas)
+
+    def teclas_presionadas(self):
+        """Estado actual del teclado, real o simulado."""
+        if self.teclas_simuladas is not None:
+            return self.teclas_simuladas
+        return pygame.key.get_pressed()
+
     def cambiar_tecla(self, accion, nueva_tecla):
         """Cambia la tecla asignada a una accion (patron Command correcto).
 
@@ -126,7 +153,7 @@ class InputHandler:
 
     def manejar_movimiento(self, jugador):
         """Ejecuta comandos de movimiento segun teclas presionadas (patron Command correcto)."""
-        teclas = pygame.key.get_pressed()
+        teclas = self.teclas_presionadas()
 
         # Verificar cada tecla presionada y ejecutar su comando asociado
         comando_ejecutado = None
@@ -136,6 +163,7 @@ class InputHandler:
                     comando_ejecutado = comando
                     break
 
+        self.ultimo_movimiento = comando_ejecutado
         if comando_ejecutado:
             comando_ejecutado.ejecutar(jugador)
         else:
@@ -143,10 +171,12 @@ class InputHandler:
 
     def manejar_salto(self, jugador):
         """Ejecuta comando de salto si corresponde (patron Command correcto)."""
-        teclas = pygame.key.get_pressed()
+        teclas = self.teclas_presionadas()
 
         # Verificar cada tecla presionada y ejecutar su comando asociado
+        self.ultimo_salto = False
         for tecla, comando in self.key_bindings.items():
             if teclas[tecla] and comando == self.comando_salto:
                 comando.ejecutar(jugador)
+                self.ultimo_salto = True
                 break
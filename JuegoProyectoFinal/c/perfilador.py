@@ -0,0 +1,133 @@
+"""
+Perfilador de tiempos por frame del loop principal.
+
+GameController marca el fin de cada fase del frame (eventos, manejar_eventos,
+actualizar, renderizar, espera del reloj) y, con `instrumentar`, los metodos
+de PlayState, Jugador y Render acumulan su tiempo en subfases
+("actualizar/enemigos", "renderizar/dibujar_plataformas", ...). Cada fase
+guarda una ventana movil de ms por frame para p50/p95/p99 y, si se pide, la
+traza completa se exporta a CSV o JSON al cerrar el juego.
+"""
+import csv
+import functools
+import json
+import time
+from collections import deque
+
+import numpy as np
+
+FRAME = "frame"
+
+
+class Perfilador:
+    """Mide cuanto tarda cada fase del frame (ms) y calcula percentiles moviles."""
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, ventana_frames=300, ruta_traza=None):
+        self.ventana_frames = ventana_frames
+        self.ruta_traza = ruta_traza  # .csv o .json; None = no exportar
+        self.fases = [FRAME]  # en orden de aparicion
+        self.acumulado = {}  # fase -> segundos en el frame en curso
+        self.historial = {FRAME: deque(maxlen=ventana_frames)}  # fase -> ms de los ultimos frames
+        self.traza = []  # un dict fase -> ms por frame (solo si hay ruta_traza)
+        self.frames = 0
+        self._inicio_frame = None
+        self._ultima_marca = None
+
+    def iniciar_frame(self):
+        self.acumulado = {}
+        self._inicio_frame = self._ultima_marca = time.perf_counter()
+
+    def marcar(self, fase):
+        """Asigna a fase el tiempo transcurrido desde la marca anterior."""
+        ahora = time.perf_counter()
+        self.sumar(fase, ahora - self._ultima_marca)
+        self._ultima_marca = ahora
+
+    def sumar(self, fase, segundos):
+        self.acumulado[fase] = self.acumulado.get(fase, 0.0) + segundos
+
+    def cerrar_frame(self):
+        """Pasa los tiempos del frame al historial (y a la traza)."""
+        if self._inicio_frame is None:
+            return
+        self.sumar(FRAME, time.perf_counter() - self._inicio_frame)
+        self._inicio_frame = None
+
+        ms = {fase: segundos * 1000 for fase, segundos in self.acumulado.items()}
+        for fase in ms:
+            if fase not in self.historial:
+                # Fase nueva: cuenta 0 en los frames anteriores de la ventana
+                self.historial[fase] = deque([0.0] * len(self.historial[FRAME]), maxlen=self.ventana_frames)
+                self.fases.append(fase)
+        for fase, historial in self.historial.items():
+            historial.append(ms.get(fase, 0.0))
+        if self.ruta_traza is not None:
+            self.traza.append(ms)
+        self.frames += 1
+
+    def instrumentar(self, objeto, metodo, fase):
+        """
+        Reemplaza objeto.metodo (solo en esa instancia) por una version que suma
+        su duracion a fase. Varios metodos pueden compartir la misma fase.
+        """
+        original = getattr(objeto, metodo)
+        reloj = time.perf_counter
+        sumar = self.sumar
+
+        @functools.wraps(original)
+        def medido(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                sumar(fase, reloj() - inicio)
+
+        setattr(objeto, metodo, medido)
+
+    def percentiles(self, fase):
+        """(p50, p95, p99) en ms de la ventana movil de fase. Los frames sin la fase cuentan 0."""
+        historial = self.historial.get(fase)
+        if not historial:
+            return (0.0, 0.0, 0.0)
+        valores = np.fromiter(historial, dtype=np.float64, count=len(historial))
+        return tuple(float(v) for v in np.percentile(valores, self.PERCENTILES))
+
+    def fases_ordenadas(self):
+        """Fases en orden de aparicion, con cada subfase ("padre/x") debajo de su padre."""
+        principales = [fase for fase in self.fases if "/" not in fase]
+        posicion = {fase: i for i, fase in enumerate(principales)}
+        return sorted(
+            self.fases,
+            key=lambda fase: (posicion.get(fase.split("/", 1)[0], len(principales)), "/" in fase),
+        )
+
+    def resumen(self):
+        """Lista (fase, p50, p95, p99) de todas las fases."""
+        return [(fase,) + self.percentiles(fase) for fase in self.fases_ordenadas()]
+
+    def exportar(self, ruta=None):
+        """Escribe la traza por frame en CSV (una columna por fase) o JSON (traza + resumen)."""
+        ruta = ruta or self.ruta_traza
+        if ruta is None:
+            return
+        fases = self.fases_ordenadas()
+        if ruta.lower().endswith(".json"):
+            datos = {
+                "frames": self.frames,
+                "fases": fases,
+                "resumen_ms": {
+                    fase: dict(zip((f"p{p}" for p in self.PERCENTILES), valores))
+                    for fase, *valores in self.resumen()
+                },
+                "traza_ms": [[round(ms.get(fase, 0.0), 4) for fase in fases] for ms in self.traza],
+            }
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump(datos, archivo)
+        else:
+            with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+                escritor = csv.writer(archivo)
+                escritor.writerow(["numero"] + fases)
+                for numero, ms in enumerate(self.traza):
+                    escritor.writerow([numero] + [f"{ms.get(fase, 0.0):.4f}" for fase in fases])
@@ -0,0 +1,245 @@
+"""
+Simulador por lotes: corre bots por todos los niveles en PlayState headless,
+repartidos en un ProcessPoolExecutor con un proceso por nucleo, y resume por
+nivel la tasa de niveles completados, las muertes por causa (caida, contacto
+con enemigo, proyectil) y los ticks por segundo.
+
+Cada corrida es un nivel + una secuencia de entradas: aleatoria (bot con
+semilla propia, reproducible) o guionada desde un JSON con una lista de
+guiones, cada uno una lista de tramos [ticks, "acciones"]:
+    [[[90, "derecha"], [12, "derecha+saltar"], [30, ""]], ...]
+Acciones: izquierda, derecha, saltar (unidas con +); "" = sin teclas.
+
+Uso (desde JuegoProyectoFinal/):
+    python -m c.simulador_lotes [niveles/ o archivos] [--corridas 32] [--ticks 3600]
+        [--procesos N] [--semilla 1] [--guiones guiones.json] [--json resumen.json]
+"""
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from m.nivel_binario import EXTENSION_NIVEL_BINARIO
+
+CAUSAS = ("caida", "enemigo", "proyectil")
+RESULTADOS = ("victoria",) + CAUSAS + ("tiempo",)
+
+# Bot aleatorio: (acciones, peso, duracion minima, duracion maxima) en ticks
+TRAMOS_BOT = (
+    ("derecha", 55, 10, 60),
+    ("derecha+saltar", 25, 4, 20),
+    ("saltar", 5, 2, 10),
+    ("izquierda", 8, 5, 30),
+    ("", 7, 5, 30),
+)
+
+
+def tramos_aleatorios(semilla, ticks):
+    """Secuencia de tramos [ticks, acciones] del bot aleatorio, que cubre al menos `ticks`."""
+    rng = random.Random(semilla)
+    acciones = [t[0] for t in TRAMOS_BOT]
+    pesos = [t[1] for t in TRAMOS_BOT]
+    duraciones = {t[0]: (t[2], t[3]) for t in TRAMOS_BOT}
+    tramos = []
+    total = 0
+    while total < ticks:
+        accion = rng.choices(acciones, pesos)[0]
+        duracion = rng.randint(*duraciones[accion])
+        tramos.append((duracion, accion))
+        total += duracion
+    return tramos
+
+
+def expandir_tramos(tramos, action_keys, ticks):
+    """Convierte tramos [ticks, acciones] en un frozenset de teclas por tick."""
+    cache = {}
+    entradas = []
+    for duracion, acciones in tramos:
+        teclas = cache.get(acciones)
+        if teclas is None:
+            teclas = cache[acciones] = frozenset(
+                action_keys[accion] for accion in acciones.split("+") if accion
+            )
+        entradas.extend([teclas] * int(duracion))
+        if len(entradas) >= ticks:
+            break
+    return entradas[:ticks]
+
+
+def listar_niveles(rutas):
+    """Archivos de nivel de las rutas dadas (directorios: .json, o .nivb sin su .json)."""
+    niveles = []
+    for ruta in rutas:
+        if not os.path.isdir(ruta):
+            niveles.append(ruta)
+            continue
+        nombres = sorted(os.listdir(ruta))
+        bases_json = {os.path.splitext(n)[0] for n in nombres if n.endswith(".json")}
+        for nombre in nombres:
+            base, extension = os.path.splitext(nombre)
+            if extension == ".json" or (extension == EXTENSION_NIVEL_BINARIO and base not in bases_json):
+                niveles.append(os.path.join(ruta, nombre))
+    return niveles
+
+
+# Estado por proceso: un GameController headless por nivel, reutilizado entre corridas
+_juegos = {}
+
+
+def _juego_para(ruta_nivel):
+    entrada = _juegos.get(ruta_nivel)
+    if entrada is None:
+        from c.game_controller import GameController
+
+        juego = GameController(headless=True, ruta_nivel=ruta_nivel)
+        desenlace = []
+        juego.event_bus.suscribir("game_over", desenlace.append)
+        juego.event_bus.suscribir("victoria", lambda _payload: desenlace.append("victoria"))
+        entrada = _juegos[ruta_nivel] = (juego, desenlace)
+    return entrada
+
+
+def simular_corrida(tarea):
+    """
+    Corre una partida en el proceso actual.
+
+    Args:
+        tarea: (ruta_nivel, semilla, ticks_max, tramos); tramos None = bot aleatorio
+
+    Returns:
+        dict con nivel, semilla, resultado (victoria/caida/enemigo/proyectil/tiempo),
+        ticks simulados y segundos de CPU empleados.
+    """
+    from c.grabacion import sembrar
+
+    ruta_nivel, semilla, ticks_max, tramos = tarea
+    juego, desenlace = _juego_para(ruta_nivel)
+    if tramos is None:
+        tramos = tramos_aleatorios(semilla, ticks_max)
+    entradas = expandir_tramos(tramos, juego.input_handler.action_keys, ticks_max)
+
+    sembrar(semilla)
+    juego.reiniciar()
+    desenlace.clear()
+    inicio = time.perf_counter()
+    ticks = juego.step(ticks_max, entradas)
+    segundos = time.perf_counter() - inicio
+    return {
+        "nivel": ruta_nivel,
+        "semilla": semilla,
+        "resultado": desenlace[0] if desenlace else "tiempo",
+        "ticks": ticks,
+        "segundos": segundos,
+    }
+
+
+def crear_tareas(niveles, corridas, ticks_max, semilla, guiones=None):
+    """Una tarea por (nivel, corrida): los guiones dados primero, el resto bots aleatorios."""
+    guiones = guiones or []
+    tareas = []
+    for nivel in niveles:
+        for i in range(corridas):
+            tramos = guiones[i] if i < len(guiones) else None
+            tareas.append((nivel, semilla + i, ticks_max, tramos))
+    return tareas
+
+
+def ejecutar_lote(tareas, procesos=None):
+    """Corre las tareas en paralelo (procesos=1: en este proceso). Devuelve (resultados, segundos)."""
+    procesos = procesos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+    if procesos == 1:
+        resultados = [simular_corrida(t) for t in tareas]
+    else:
+        # Tareas del mismo nivel juntas: cada proceso carga pocos niveles
+        por_bloque = max(1, len(tareas) // (procesos * 4))
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            resultados = list(pool.map(simular_corrida, tareas, chunksize=por_bloque))
+    return resultados, time.perf_counter() - inicio
+
+
+def resumir(resultados):
+    """Agrupa por nivel: corridas, conteo por resultado, tasa de victoria, ticks y ticks/s de CPU."""
+    resumen = {}
+    for r in resultados:
+        datos = resumen.setdefault(r["nivel"], {
+            "corridas": 0, "ticks": 0, "segundos": 0.0, **{clave: 0 for clave in RESULTADOS},
+        })
+        datos["corridas"] += 1
+        datos[r["resultado"]] += 1
+        datos["ticks"] += r["ticks"]
+        datos["segundos"] += r["segundos"]
+    for datos in resumen.values():
+        datos["tasa_victoria"] = datos["victoria"] / datos["corridas"]
+        datos["ticks_por_segundo"] = datos["ticks"] / datos["segundos"] if datos["segundos"] > 0 else 0.0
+    return resumen
+
+
+def imprimir_resumen(resumen, segundos_totales, procesos):
+    print(f"{'nivel':<28} {'corridas':>8} {'victoria':>9} " + " ".join(f"{c:>9}" for c in CAUSAS)
+          + f" {'tiempo':>7} {'ticks/s':>9}")
+    ticks_totales = 0
+    for nivel, datos in resumen.items():
+        ticks_totales += datos["ticks"]
+        print(
+            f"{os.path.basename(nivel):<28} {datos['corridas']:>8} {datos['tasa_victoria']:>8.0%} "
+            + " ".join(f"{datos[c]:>9}" for c in CAUSAS)
+            + f" {datos['tiempo']:>7} {datos['ticks_por_segundo']:>9.0f}"
+        )
+    print(
+        f"Total: {ticks_totales} ticks en {segundos_totales:.2f} s con {procesos} proceso(s) "
+        f"({ticks_totales / segundos_totales if segundos_totales > 0 else 0:.0f} ticks/s)"
+    )
+
+
+def _opcion(argumentos, nombre, defecto, tipo=str):
+    if nombre in argumentos:
+        return tipo(argumentos[argumentos.index(nombre) + 1])
+    return defecto
+
+
+def main():
+    argumentos = sys.argv[1:]
+    corridas = _opcion(argumentos, "--corridas", 32, int)
+    ticks_max = _opcion(argumentos, "--ticks", 3600, int)
+    procesos = _opcion(argumentos, "--procesos", os.cpu_count() or 1, int)
+    semilla = _opcion(argumentos, "--semilla", 1, int)
+    ruta_guiones = _opcion(argumentos, "--guiones", None)
+    ruta_json = _opcion(argumentos, "--json", None)
+
+    # Rutas = argumentos que no son opciones ni valores de opciones
+    rutas = []
+    saltar = False
+    for argumento in argumentos:
+        if saltar:
+            saltar = False
+        elif argumento.startswith("--"):
+            saltar = True
+        else:
+            rutas.append(argumento)
+    proyecto_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    niveles = listar_niveles(rutas or [os.path.join(proyecto_dir, "niveles")])
+    if not niveles:
+        print("No se encontraron niveles")
+        sys.exit(1)
+
+    guiones = None
+    if ruta_guiones:
+        with open(ruta_guiones, encoding="utf-8") as archivo:
+            guiones = json.load(archivo)
+        corridas = max(corridas, len(guiones))
+
+    tareas = crear_tareas(niveles, corridas, ticks_max, semilla, guiones)
+    resultados, segundos = ejecutar_lote(tareas, procesos)
+    resumen = resumir(resultados)
+    imprimir_resumen(resumen, segundos, procesos)
+
+    if ruta_json:
+        with open(ruta_json, "w", encoding="utf-8") as archivo:
+            json.dump({"resumen": resumen, "corridas": resultados, "segundos": segundos}, archivo, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,14 @@ from c.game_state import MenuState, PlayState, PauseState
 class StateFactory:
     """Factory Method para crear estados del juego."""
 
-    def __init__(self, event_bus, render, sprite_loader, input_handler, jugador, nivel):
+    def __init__(self, event_bus, render, sprite_loader, input_handler, jugador, nivel, fps=60):
         self.event_bus = event_bus
         self.render = render
         self.sprite_loader = sprite_loader
         self.input_handler = input_handler
         self.jugador = jugador
         self.nivel = nivel
+        self.fps = fps
 
     def crear_menu_state(self):
         return MenuState(self.event_bus, self.render)
@@ -23,6 +24,7 @@ class StateFactory:
             self.input_handler,
             self.jugador,
             self.nivel,
+            fps=self.fps,
         )
 
     def crear_pause_state(self, play_state):
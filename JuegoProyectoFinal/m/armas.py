@@ -12,13 +12,23 @@ class Arma:
         self.cooldown_ms = cooldown_ms
         self.velocidad_proj = velocidad_proj
 
-    def crear_proyectil(self, origen_rect, direccion):
-        """Crea un proyectil dirigido segun la arma. direccion: -1 izq, 1 der."""
+    def parametros_disparo(self, origen_rect, direccion):
+        """Posicion y velocidad inicial (x, y, vx, vy) del proyectil. direccion: -1 izq, 1 der."""
         vx = self.velocidad_proj * direccion
         vy = 0
         x = origen_rect.centerx + (origen_rect.width // 2) * direccion
         y = origen_rect.centery
-        return Proyectil(x, y, vx, vy, color=self.color, dano=self.dano)
+        return x, y, vx, vy
+
+    def crear_proyectil(self, origen_rect, direccion, reloj=None):
+        """Crea un proyectil dirigido segun la arma. direccion: -1 izq, 1 der."""
+        x, y, vx, vy = self.parametros_disparo(origen_rect, direccion)
+        return Proyectil(x, y, vx, vy, color=self.color, dano=self.dano, reloj=reloj)
+
+    def disparar(self, pool, origen_rect, direccion):
+        """Emite el proyectil en un PoolProyectiles (sin crear objetos) y devuelve su vista."""
+        x, y, vx, vy = self.parametros_disparo(origen_rect, direccion)
+        return pool.emitir(x, y, vx, vy, color=self.color, dano=self.dano)
 
 
 class Espada(Arma):
@@ -27,7 +37,10 @@ class Espada(Arma):
     def __init__(self):
         super().__init__("Espada", dano=15, alcance=1, color=(200, 80, 80), cooldown_ms=800, velocidad_proj=0)
 
-    def crear_proyectil(self, origen_rect, direccion):
+    def crear_proyectil(self, origen_rect, direccion, reloj=None):
+        return None
+
+    def disparar(self, pool, origen_rect, direccion):
         return None
 
 
@@ -1,20 +1,61 @@
+import heapq
+from collections.abc import Mapping
+
 import pygame
 
 
+class TimersBuffos(Mapping):
+    """
+    Vista de solo lectura tipo -> {"restante": s, "duracion": s} para el HUD.
+    Los valores se calculan al leerlos (con el `ahora` del ultimo aplicar), asi
+    que una simulacion que no dibuja el HUD no paga por construirlos.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.ahora = 0
+
+    def __getitem__(self, tipo):
+        entry = self.manager.activos[tipo]
+        duracion = entry.get("duracion", self.manager.DURACIONES_MS.get(tipo, 5000))
+        return {
+            "restante": max(0.0, (entry["expira"] - self.ahora) / 1000.0),
+            "duracion": max(0.1, duracion / 1000.0),
+        }
+
+    def __iter__(self):
+        return iter(self.manager.activos)
+
+    def __len__(self):
+        return len(self.manager.activos)
+
+
 class BuffManager:
     """
     Administra buffos activos: aplica decoradores al jugador, controla expiracion
     y expone datos para HUD.
+
+    Los vencimientos se guardan en un heap (expira, tipo); activar o acumular un
+    buffo agrega una entrada nueva y las viejas se descartan al salir del heap.
+    Las estadisticas y el aspecto del jugador solo se recalculan cuando un buffo
+    se activa, acumula o vence, no en cada frame.
     """
 
     DURACIONES_MS = {"velocidad": 6000, "salto": 6000, "invencible": 5000}
 
-    def __init__(self, buff_classes):
+    def __init__(self, buff_classes, reloj=None):
         self.buff_classes = buff_classes
+        self.reloj = reloj  # RelojSimulacion; None = tiempo real de pygame
         self.activos = {}  # tipo -> {"decorator": obj, "expira": ms, "inicio": ms, "duracion": ms}
+        self.vencimientos = []  # heap de (expira, tipo); puede tener entradas obsoletas
+        self.timers = TimersBuffos(self)
+        self.sucio = True  # hay que recalcular estadisticas/aspecto del jugador
+        self.jugador_aplicado = None
 
     def reset(self):
         self.activos = {}
+        self.vencimientos = []
+        self.sucio = True
 
     def activar(self, tipo, ahora):
         duracion = self.DURACIONES_MS.get(tipo, 5000)
@@ -35,24 +76,40 @@ class BuffManager:
                 "inicio": ahora,
                 "duracion": duracion,
             }
+        heapq.heappush(self.vencimientos, (ahora + duracion, tipo))
+        self.sucio = True
+
+    def purgar_expirados(self, ahora):
+        """Quita los buffos vencidos (ahora > expira) mirando solo el frente del heap."""
+        vencimientos = self.vencimientos
+        while vencimientos and vencimientos[0][0] < ahora:
+            expira, tipo = heapq.heappop(vencimientos)
+            entry = self.activos.get(tipo)
+            # Entrada obsoleta si el buffo se renovo (otro expira) o ya no esta
+            if entry is not None and entry["expira"] == expira:
+                del self.activos[tipo]
+                self.sucio = True
 
     def aplicar(self, jugador, ahora=None):
-        """Purga expirados, aplica efectos y retorna timers para HUD."""
+        """Purga expirados, aplica efectos si algo cambio y retorna timers para HUD."""
         if ahora is None:
-            ahora = pygame.time.get_ticks()
+            ahora = self.reloj.ahora() if self.reloj is not None else pygame.time.get_ticks()
+
+        self.purgar_expirados(ahora)
+        if self.sucio or jugador is not self.jugador_aplicado:
+            self.recalcular(jugador)
 
-        expirados = [tipo for tipo, data in self.activos.items() if ahora > data["expira"]]
-        for tipo in expirados:
-            del self.activos[tipo]
+        self.timers.ahora = ahora
+        return self.timers
 
+    def recalcular(self, jugador):
+        """Reaplica todos los decoradores sobre estadisticas base y actualiza el aspecto."""
         jugador.reset_estadisticas()
         escala_total = 1.0
         auras = []
-        timers = {}
 
-        for tipo, entry in self.activos.items():
-            decorador = entry["decorator"]
-            visual = decorador.aplicar(jugador)
+        for entry in self.activos.values():
+            visual = entry["decorator"].aplicar(jugador)
             escala_total *= visual.get("escala_extra", 1.0)
 
             size = visual.get("aura_size", 0)
@@ -60,9 +117,6 @@ class BuffManager:
             if color and size > 0:
                 auras.append({"color": color, "size": size})
 
-            restante = max(0.0, (entry["expira"] - ahora) / 1000.0)
-            duracion = max(0.1, entry.get("duracion", self.DURACIONES_MS.get(tipo, 5000)) / 1000.0)
-            timers[tipo] = {"restante": restante, "duracion": duracion}
-
         jugador.set_visual(escala=escala_total, auras=auras)
-        return timers
+        self.sucio = False
+        self.jugador_aplicado = jugador
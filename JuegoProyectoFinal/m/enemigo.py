@@ -1,5 +1,6 @@
 import pygame
 from m.estrategias import MovimientoStrategy, PatrullaAgresivaStrategy, PatrullaPasivaStrategy
+from m.indice_espacial import plataformas_cercanas
 
 
 class Enemigo(pygame.sprite.Sprite):
@@ -36,7 +37,7 @@ class Enemigo(pygame.sprite.Sprite):
 
         self.arma = arma
         self.color = getattr(arma, "color", (200, 60, 60))
-        self.ultimo_disparo = 0
+        self.ultimo_disparo = None  # ms del ultimo disparo (None = aun no disparo)
 
     @classmethod
     def desde_dict(cls, data):
@@ -71,7 +72,7 @@ class Enemigo(pygame.sprite.Sprite):
 
     def resolver_colisiones_vertical(self, plataformas):
         self.en_suelo = False
-        for plataforma in plataformas:
+        for plataforma in plataformas_cercanas(plataformas, self.rect):
             if self.rect.colliderect(plataforma):
                 if self.GRAVEDAD > 0 and self.rect.bottom <= plataforma.bottom:
                     self.rect.bottom = plataforma.top
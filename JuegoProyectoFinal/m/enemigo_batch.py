@@ -0,0 +1,256 @@
+import numpy as np
+from m.indice_espacial import IndiceEspacial
+from m.pool_proyectiles import redondear_como_rect
+
+ESTRATEGIA_PASIVA = 0
+ESTRATEGIA_AGRESIVA = 1
+
+
+class _ColumnasPlataformas:
+    """Plataformas en arreglos + columnas de ancho fijo (formato CSR) para consultas vectorizadas."""
+
+    def __init__(self, plataformas, tamano_celda):
+        # Se conserva el orden del nivel (el recorrido lineal depende de el);
+        # las plataformas vacias nunca colisionan y se omiten.
+        rects = [p for p in plataformas if p.width > 0 and p.height > 0]
+        self.tamano_celda = tamano_celda
+        self.cantidad = len(rects)
+        self.left = np.array([p.left for p in rects], dtype=np.float64)
+        self.top = np.array([p.top for p in rects], dtype=np.float64)
+        self.right = np.array([p.right for p in rects], dtype=np.float64)
+        self.bottom = np.array([p.bottom for p in rects], dtype=np.float64)
+
+        if not rects:
+            self.col_min = 0
+            self.indptr = np.zeros(1, dtype=np.int64)
+            self.indices = np.zeros(0, dtype=np.int64)
+            return
+
+        col_ini = (self.left // tamano_celda).astype(np.int64)
+        col_fin = ((self.right - 1) // tamano_celda).astype(np.int64)
+        self.col_min = int(col_ini.min())
+        self.col_ini = col_ini - self.col_min
+        num_cols = int(col_fin.max()) - self.col_min + 1
+
+        spans = col_fin - col_ini + 1
+        plat = np.repeat(np.arange(len(rects)), spans)
+        cols = np.repeat(col_ini - self.col_min, spans) + _rangos(spans)
+        # Ordenar por columna y, dentro de cada columna, por orden del nivel
+        clave = np.lexsort((plat, cols))
+        self.indices = plat[clave]
+        conteo = np.bincount(cols, minlength=num_cols)
+        self.indptr = np.concatenate(([0], np.cumsum(conteo)))
+
+    @property
+    def num_cols(self):
+        return len(self.indptr) - 1
+
+    def pares(self, enemigos, left, right):
+        """Pares (enemigo, plataforma) sin repetir que comparten al menos una columna."""
+        if enemigos.size == 0 or self.indices.size == 0:
+            vacio = np.zeros(0, dtype=np.int64)
+            return vacio, vacio
+        t = self.tamano_celda
+        col_ini = (left[enemigos] // t).astype(np.int64) - self.col_min
+        col_fin = ((right[enemigos] - 1) // t).astype(np.int64) - self.col_min
+        col_ini = np.clip(col_ini, 0, self.num_cols)
+        col_fin = np.clip(col_fin, -1, self.num_cols - 1)
+
+        partes_e = []
+        partes_p = []
+        max_span = int((col_fin - col_ini).max(initial=-1)) + 1
+        for desplazamiento in range(max_span):
+            col = col_ini + desplazamiento
+            sel = col <= col_fin
+            if not sel.any():
+                continue
+            col = col[sel]
+            inicio = self.indptr[col]
+            cuenta = self.indptr[col + 1] - inicio
+            e = np.repeat(enemigos[sel], cuenta)
+            p = self.indices[np.repeat(inicio, cuenta) + _rangos(cuenta)]
+            if desplazamiento > 0:
+                # Una plataforma que tambien cubre la columna anterior ya se agrego
+                nueva = self.col_ini[p] >= np.repeat(col, cuenta)
+                e, p = e[nueva], p[nueva]
+            partes_e.append(e)
+            partes_p.append(p)
+
+        if not partes_e:
+            vacio = np.zeros(0, dtype=np.int64)
+            return vacio, vacio
+        return np.concatenate(partes_e), np.concatenate(partes_p)
+
+
+def _rangos(cuentas):
+    """Concatena arange(c) para cada c de cuentas."""
+    total = int(cuentas.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    inicios = np.repeat(np.cumsum(cuentas) - cuentas, cuentas)
+    return np.arange(total) - inicios
+
+
+class EnemigoBatch:
+    """
+    Motor vectorizado para poblaciones grandes de enemigos. Guarda posiciones,
+    velocidades, limites de patrulla y estrategia de cada enemigo en arreglos
+    NumPy y avanza a todos en un solo paso: cambio pasivo/agresivo por distancia,
+    patrulla, gravedad y apoyo sobre plataformas. Reproduce exactamente la
+    trayectoria de Enemigo.update (mismo redondeo de pygame.Rect).
+    """
+
+    def __init__(self, enemigos, plataformas, tamano_celda=64):
+        self.enemigos = list(enemigos)
+        if isinstance(plataformas, IndiceEspacial):
+            tamano_celda = plataformas.tamano_celda
+            plataformas = plataformas.en_orden_nivel()
+        self.columnas = _ColumnasPlataformas(plataformas, tamano_celda)
+        self._fila = {id(enemigo): i for i, enemigo in enumerate(self.enemigos)}
+
+        def arreglo(valores, dtype=np.float64):
+            return np.array(list(valores), dtype=dtype)
+
+        lista = self.enemigos
+        self.x = arreglo(e.rect.x for e in lista)
+        self.y = arreglo(e.rect.y for e in lista)
+        self.ancho = arreglo(e.rect.width for e in lista)
+        self.alto = arreglo(e.rect.height for e in lista)
+        self.vx = arreglo(e.velocidad_x for e in lista)
+        self.vy = arreglo(e.velocidad_y for e in lista)
+        self.velocidad_base = arreglo(e.velocidad_base for e in lista)
+        self.limite_izq = arreglo(e.limite_izq for e in lista)
+        self.limite_der = arreglo(e.limite_der for e in lista)
+        self.gravedad = arreglo(e.GRAVEDAD for e in lista)
+        self.distancia_agresion = arreglo(e.distancia_agresion for e in lista)
+        self.factor_pasivo = arreglo(e.estrategia_pasiva.factor_velocidad for e in lista)
+        self.estrategia = arreglo(
+            (ESTRATEGIA_AGRESIVA if e.estrategia.puede_atacar() else ESTRATEGIA_PASIVA for e in lista),
+            dtype=np.int8,
+        )
+        self.en_suelo = arreglo((e.en_suelo for e in lista), dtype=bool)
+        self.activo = np.ones(len(lista), dtype=bool)
+
+    def __len__(self):
+        return int(self.activo.sum())
+
+    def descartar(self, enemigo):
+        """Saca a un enemigo de la simulacion (ej. pisado por el jugador)."""
+        fila = self._fila.get(id(enemigo))
+        if fila is not None:
+            self.activo[fila] = False
+
+    def mascara_de(self, enemigos):
+        """Mascara de filas para un subconjunto de enemigos (ej. los despiertos)."""
+        mascara = np.zeros(len(self.enemigos), dtype=bool)
+        filas = [self._fila[id(e)] for e in enemigos if id(e) in self._fila]
+        mascara[filas] = True
+        return mascara
+
+    def paso(self, jugador_x=None, mascara=None):
+        """Avanza un tick a todos los enemigos activos (o al subconjunto de mascara)."""
+        activos = self.activo if mascara is None else self.activo & mascara
+        filas = np.flatnonzero(activos)
+        if filas.size == 0:
+            return
+        x = self.x[filas]
+        ancho = self.ancho[filas]
+        vx = self.vx[filas]
+        lim_izq = self.limite_izq[filas]
+        lim_der = self.limite_der[filas]
+
+        # Strategy: agresiva si el jugador esta cerca, pasiva si no
+        if jugador_x is not None:
+            centro = x + ancho // 2
+            cerca = np.abs(centro - jugador_x) <= self.distancia_agresion[filas]
+            self.estrategia[filas] = np.where(cerca, ESTRATEGIA_AGRESIVA, ESTRATEGIA_PASIVA)
+        agresivo = self.estrategia[filas] == ESTRATEGIA_AGRESIVA
+
+        # Patrulla
+        paso_pasivo = self.velocidad_base[filas] * self.factor_pasivo[filas] * np.where(vx > 0, 1, -1)
+        x = redondear_como_rect(x + np.where(agresivo, vx, paso_pasivo))
+        tope_izq = x <= lim_izq
+        tope_der = ~tope_izq & (x + ancho >= lim_der)
+        x = np.where(
+            tope_izq,
+            redondear_como_rect(lim_izq),
+            np.where(tope_der, redondear_como_rect(lim_der) - ancho, x),
+        )
+        rebote = tope_izq | tope_der
+        vx = np.where(
+            agresivo,
+            np.where(rebote, -vx, vx),
+            np.where(tope_izq, np.abs(vx), np.where(tope_der, -np.abs(vx), vx)),
+        )
+        self.x[filas] = x
+        self.vx[filas] = vx
+
+        # Gravedad
+        vy = self.vy[filas] + self.gravedad[filas]
+        self.vy[filas] = vy
+        self.y[filas] = redondear_como_rect(self.y[filas] + vy)
+
+        self._apoyar_en_plataformas(filas)
+
+    def _apoyar_en_plataformas(self, filas):
+        """Equivalente vectorizado de Enemigo.resolver_colisiones_vertical."""
+        self.en_suelo[filas] = False
+        cols = self.columnas
+        right = self.x + self.ancho
+        # Rects vacios no colisionan y sin gravedad positiva no hay apoyo
+        validas = (self.ancho[filas] > 0) & (self.alto[filas] > 0) & (self.gravedad[filas] > 0)
+        pe, pp = cols.pares(filas[validas], self.x, right)
+        ultimo = np.full(len(self.x), -1, dtype=np.int64)
+
+        # El recorrido lineal puede apoyar al enemigo en varias plataformas seguidas:
+        # se resuelve la primera por enemigo y se repite con las plataformas posteriores.
+        while pe.size:
+            y = self.y[pe]
+            fondo = y + self.alto[pe]
+            choca = (
+                (self.x[pe] < cols.right[pp])
+                & (right[pe] > cols.left[pp])
+                & (y < cols.bottom[pp])
+                & (fondo > cols.top[pp])
+                & (fondo <= cols.bottom[pp])
+            )
+            idx = np.flatnonzero(choca)
+            if idx.size == 0:
+                break
+            # Primera plataforma (en orden del nivel) que apoya a cada enemigo
+            clave = np.sort(pe[idx] * cols.cantidad + pp[idx])
+            e_sel = clave // cols.cantidad
+            primero = np.concatenate(([True], e_sel[1:] != e_sel[:-1]))
+            e1 = e_sel[primero]
+            p1 = clave[primero] % cols.cantidad
+            self.y[e1] = cols.top[p1] - self.alto[e1]
+            self.vy[e1] = 0
+            self.en_suelo[e1] = True
+            ultimo[e1] = p1
+
+            movido = np.zeros(len(self.x), dtype=bool)
+            movido[e1] = True
+            seguir = movido[pe] & (pp > ultimo[pe])
+            pe, pp = pe[seguir], pp[seguir]
+
+    def sincronizar(self, mascara=None):
+        """Copia el estado de los arreglos a los objetos Enemigo (rect, velocidades, estrategia)."""
+        activos = self.activo if mascara is None else self.activo & mascara
+        filas = np.flatnonzero(activos)
+        # Solo se convierten las filas a copiar (con mascara, el costo no depende del total)
+        xs = self.x[filas].tolist()
+        ys = self.y[filas].tolist()
+        vxs = self.vx[filas].tolist()
+        vys = self.vy[filas].tolist()
+        suelos = self.en_suelo[filas].tolist()
+        estrategias = self.estrategia[filas].tolist()
+        for k, fila in enumerate(filas.tolist()):
+            enemigo = self.enemigos[fila]
+            enemigo.rect.x = xs[k]
+            enemigo.rect.y = ys[k]
+            enemigo.velocidad_x = vxs[k]
+            enemigo.velocidad_y = vys[k]
+            enemigo.en_suelo = suelos[k]
+            enemigo.estrategia = (
+                enemigo.estrategia_agresiva if estrategias[k] == ESTRATEGIA_AGRESIVA else enemigo.estrategia_pasiva
+            )
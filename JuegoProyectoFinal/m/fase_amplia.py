@@ -0,0 +1,41 @@
+def filtrar_por_x(entidades, x_min, x_max):
+    """
+    Entidades (con .rect) cuyo intervalo horizontal se solapa con [x_min, x_max),
+    en su orden original. Un solo recorrido lineal: las listas que llegan aca
+    (entidades despiertas) son cortas y cambian de posicion cada tick, asi que
+    ordenarlas en cada llamada costaria mas que comparar los bordes.
+    """
+    return [e for e in entidades if e.rect.right > x_min and e.rect.left < x_max]
+
+
+class FaseAmplia:
+    """
+    Fase amplia de colisiones (solape en x) contra el jugador.
+    Se calcula una vez por tick y deja, por grupo, solo las entidades cuyo
+    intervalo horizontal se solapa con el del jugador. Los chequeos finos
+    (colliderect) se hacen luego sobre esos candidatos.
+    """
+
+    def __init__(self):
+        self.candidatos = {}  # grupo -> [entidades en orden original]
+
+    def actualizar(self, rect, grupos):
+        """
+        Recalcula los candidatos de cada grupo (dict nombre -> lista) contra rect.
+        Un grupo con metodo candidatos(rect) (ej. PoolProyectiles) resuelve su propio barrido.
+        """
+        self.candidatos = {
+            nombre: entidades.candidatos(rect)
+            if hasattr(entidades, "candidatos")
+            else filtrar_por_x(entidades, rect.left, rect.right)
+            for nombre, entidades in grupos.items()
+        }
+
+    def obtener(self, grupo):
+        return self.candidatos.get(grupo, [])
+
+    def descartar(self, grupo, entidad):
+        """Quita una entidad eliminada durante el tick (ej. enemigo pisado)."""
+        lista = self.candidatos.get(grupo)
+        if lista and entidad in lista:
+            lista.remove(entidad)
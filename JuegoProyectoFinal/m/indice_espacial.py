@@ -0,0 +1,113 @@
+class IndiceEspacial:
+    """
+    Indice de plataformas en una grilla uniforme (celdas de tile_size).
+    Permite consultar solo las plataformas cercanas a un rect en lugar de
+    recorrer todo el nivel. Las consultas respetan el orden del nivel aunque
+    las plataformas se agreguen por trozos y fuera de orden (carga perezosa).
+    """
+
+    def __init__(self, plataformas, tamano_celda=64):
+        self.plataformas = []
+        self.orden = []  # posicion de cada plataforma en el nivel completo
+        self.tamano_celda = max(1, int(tamano_celda))
+        self.celdas = {}  # (col, fila) -> [indices de plataformas]
+        self.columnas = {}  # col -> [indices], para consultas solo en x (camara)
+        self.version = 0  # cambia cada vez que se agregan plataformas
+        self._en_orden = True
+        self.agregar(plataformas)
+
+    def agregar(self, plataformas, ordenes=None):
+        """
+        Agrega plataformas al indice. ordenes indica la posicion de cada una en el
+        nivel completo (por defecto, a continuacion de las ya agregadas).
+        """
+        for k, plataforma in enumerate(plataformas):
+            indice = len(self.plataformas)
+            orden = indice if ordenes is None else ordenes[k]
+            if self.orden and orden < self.orden[-1]:
+                self._en_orden = False
+            self.plataformas.append(plataforma)
+            self.orden.append(orden)
+            for celda in self._celdas_de(plataforma):
+                self.celdas.setdefault(celda, []).append(indice)
+                columna = self.columnas.setdefault(celda[0], [])
+                if not columna or columna[-1] != indice:
+                    columna.append(indice)
+        self.version += 1
+
+    def __len__(self):
+        return len(self.plataformas)
+
+    def __iter__(self):
+        return iter(self.plataformas)
+
+    def _ordenar(self, indices):
+        """Ordena indices segun el orden del nivel."""
+        if self._en_orden:
+            return sorted(indices)
+        return sorted(indices, key=self.orden.__getitem__)
+
+    def en_orden_nivel(self):
+        """Plataformas agregadas, en el orden del nivel completo."""
+        return [self.plataformas[i] for i in self._ordenar(range(len(self.plataformas)))]
+
+    def _celdas_de(self, rect):
+        """Celdas que cubre un rect (los bordes derecho/inferior son exclusivos)."""
+        t = self.tamano_celda
+        col_ini = rect.left // t
+        col_fin = (rect.right - 1) // t
+        fila_ini = rect.top // t
+        fila_fin = (rect.bottom - 1) // t
+        for col in range(col_ini, col_fin + 1):
+            for fila in range(fila_ini, fila_fin + 1):
+                yield (col, fila)
+
+    def consultar(self, rect):
+        """Indices (en orden del nivel) de las plataformas que comparten celda con rect."""
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        encontrados = set()
+        for celda in self._celdas_de(rect):
+            indices = self.celdas.get(celda)
+            if indices:
+                encontrados.update(indices)
+        return self._ordenar(encontrados)
+
+    def en_rango_x(self, x_min, x_max):
+        """Plataformas (en orden original) en las columnas de la grilla que cubren [x_min, x_max)."""
+        if x_max <= x_min:
+            return []
+        t = self.tamano_celda
+        encontrados = set()
+        for col in range(int(x_min) // t, (int(x_max) - 1) // t + 1):
+            indices = self.columnas.get(col)
+            if indices:
+                encontrados.update(indices)
+        return [self.plataformas[i] for i in self._ordenar(encontrados)]
+
+    def candidatas(self, rect):
+        """
+        Itera, en el orden original del nivel, las plataformas que pueden colisionar
+        con rect. Si quien itera mueve el rect (resolucion de colision), se vuelve a
+        consultar la grilla para las plataformas restantes, de modo que el resultado
+        es identico al recorrido lineal de toda la lista.
+        """
+        pendientes = self.consultar(rect)
+        pos = 0
+        while pos < len(pendientes):
+            indice = pendientes[pos]
+            antes = (rect.x, rect.y, rect.width, rect.height)
+            yield self.plataformas[indice]
+            if (rect.x, rect.y, rect.width, rect.height) != antes:
+                orden = self.orden[indice]
+                pendientes = [i for i in self.consultar(rect) if self.orden[i] > orden]
+                pos = 0
+            else:
+                pos += 1
+
+
+def plataformas_cercanas(plataformas, rect):
+    """Devuelve las candidatas del indice, o la lista completa si no hay indice."""
+    if isinstance(plataformas, IndiceEspacial):
+        return plataformas.candidatas(rect)
+    return plataformas
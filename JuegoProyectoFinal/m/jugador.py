@@ -1,4 +1,5 @@
 import pygame
+from m.indice_espacial import plataformas_cercanas
 
 
 class Jugador(pygame.sprite.Sprite):
@@ -86,8 +87,8 @@ class Jugador(pygame.sprite.Sprite):
             self.frame_actual = 0
 
     def resolver_colisiones_horizontal(self, plataformas):
-        """Resuelve colisiones horizontales contra las plataformas"""
-        for plataforma in plataformas:
+        """Resuelve colisiones horizontales contra las plataformas (lista o IndiceEspacial)"""
+        for plataforma in plataformas_cercanas(plataformas, self.rect):
             if self.rect.colliderect(plataforma):
                 if self.velocidad_x > 0:
                     self.rect.right = plataforma.left
@@ -97,7 +98,7 @@ class Jugador(pygame.sprite.Sprite):
 
     def resolver_colisiones_vertical(self, plataformas):
         """Resuelve colisiones verticales y determina si esta en el suelo"""
-        for plataforma in plataformas:
+        for plataforma in plataformas_cercanas(plataformas, self.rect):
             if self.rect.colliderect(plataforma):
                 if self.velocidad_y > 0:
                     self.rect.bottom = plataforma.top
@@ -1,6 +1,8 @@
 import json
 import os
 import pygame
+from m.indice_espacial import IndiceEspacial
+from m.nivel_binario import EXTENSION_NIVEL_BINARIO, NivelBinario
 
 
 class Nivel:
@@ -18,9 +20,9 @@ class Nivel:
         enemigos=None,
         buffos=None,
         meta_x=None,
+        cargador=None,
     ):
         self.nombre = nombre
-        self.plataformas = plataformas
         self.spawn = spawn
         self.altura_suelo = altura_suelo
         self.fondo = fondo
@@ -29,13 +31,55 @@ class Nivel:
         self.enemigos = enemigos or []
         self.buffos = buffos or []
         self.meta_x = meta_x or ancho_mundo
+        # Indice espacial para colisiones (se construye al cargar; crece con la carga perezosa)
+        self.indice_plataformas = IndiceEspacial(plataformas, tile_size)
+        self.plataformas = self.indice_plataformas.plataformas
+        # NivelBinario para materializar por trozos; None = todo el nivel en memoria
+        self.cargador = cargador
+        self.chunks_cargados = set()
+        self._ordenes_cargados = set()
+
+    @property
+    def perezoso(self):
+        return self.cargador is not None
+
+    def chunks_en_rango(self, x_min, x_max):
+        """Trozos del nivel compilado que se solapan con [x_min, x_max)."""
+        if self.cargador is None:
+            return range(0)
+        return self.cargador.chunks_en_rango(x_min, x_max)
+
+    def cargar_plataformas(self, x_min, x_max):
+        """Materializa las plataformas de los trozos en [x_min, x_max). True si se agregaron nuevas."""
+        ordenes = []
+        rects = []
+        for numero in self.chunks_en_rango(x_min, x_max):
+            if numero in self.chunks_cargados:
+                continue
+            self.chunks_cargados.add(numero)
+            for orden, rect in zip(*self.cargador.plataformas_de_chunk(numero)):
+                # Una plataforma ancha figura en cada trozo que cubre
+                if orden not in self._ordenes_cargados:
+                    self._ordenes_cargados.add(orden)
+                    ordenes.append(orden)
+                    rects.append(rect)
+        if rects:
+            self.indice_plataformas.agregar(rects, ordenes)
+        return bool(rects)
+
+    def entidades_de_chunk(self, numero):
+        """Datos (dicts como en el JSON) de los enemigos y buffos de un trozo."""
+        return self.cargador.enemigos_de_chunk(numero), self.cargador.buffos_de_chunk(numero)
 
     @classmethod
     def desde_archivo(cls, ruta, ancho_ventana=800, alto_ventana=600):
         """
-        Carga un nivel desde un archivo JSON.
+        Carga un nivel desde un archivo JSON (o uno compilado .nivb).
         Si no hay plataformas definidas, genera un suelo por defecto.
         """
+        if ruta.endswith(EXTENSION_NIVEL_BINARIO):
+            return cls.desde_binario(ruta)
+
         with open(ruta, "r", encoding="utf-8") as archivo:
             data = json.load(archivo)
 
@@ -76,6 +120,25 @@ class Nivel:
             meta_x=meta_x,
         )
 
+    @classmethod
+    def desde_binario(cls, ruta):
+        """
+        Abre un nivel compilado (ver m/nivel_binario.py). Solo se lee la cabecera:
+        plataformas, enemigos y buffos se materializan por trozos a pedido.
+        """
+        cargador = NivelBinario(ruta)
+        return cls(
+            nombre=cargador.nombre,
+            plataformas=[],
+            spawn=cargador.spawn,
+            altura_suelo=cargador.altura_suelo,
+            fondo=cargador.fondo,
+            tile_size=cargador.tile_size,
+            ancho_mundo=cargador.ancho_mundo,
+            meta_x=cargador.meta_x,
+            cargador=cargador,
+        )
+
     @staticmethod
     def _crear_plataformas(plataformas_data):
         """Convierte estructuras simples en pygame.Rect"""
@@ -0,0 +1,289 @@
+"""
+Formato binario compilado de niveles (.nivb) con carga perezosa por trozos.
+
+Disposicion del archivo (little-endian, secciones alineadas a 8 bytes):
+    cabecera      struct CABECERA (magic, version, dimensiones, spawn, cantidades)
+    meta          JSON utf-8 con textos: nombre, fondo y tablas de tipos
+    plataformas   num_plataformas x (x, y, w, h) int32, en el orden del nivel
+    plat_indptr   (num_trozos + 1) int64  -> indice CSR de plataformas por trozo
+    plat_indices  int32, posiciones de plataformas (una plataforma ancha aparece en cada trozo que cubre)
+    ene_indptr    (num_trozos + 1) int64  -> enemigos agrupados por trozo (segun su x)
+    enemigos      DTYPE_ENEMIGO, ordenados por trozo y luego por orden del nivel
+    buf_indptr    (num_trozos + 1) int64
+    buffos        DTYPE_BUFFO, ordenados igual que los enemigos
+
+El archivo se abre con mmap y las secciones son vistas NumPy sobre el mapa:
+abrir un nivel solo lee la cabecera, sin importar su ancho. Cada trozo se
+convierte a pygame.Rect / dicts recien cuando se pide.
+
+Conversion desde JSON (desde JuegoProyectoFinal/):
+    python -m m.nivel_binario niveles/nivel1.json
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+import pygame
+
+EXTENSION_NIVEL_BINARIO = ".nivb"
+MAGIC = b"NIVB"
+VERSION = 1
+
+# magic, version, reservado, tile_size, ancho_trozo, num_trozos,
+# num_plataformas, num_refs, num_enemigos, num_buffos, largo_meta,
+# altura_suelo, ancho_mundo, meta_x, spawn_x, spawn_y
+CABECERA = struct.Struct("<4sHHiiiiiiiiddddd")
+
+DTYPE_PLATAFORMA = np.dtype([("x", "<i4"), ("y", "<i4"), ("w", "<i4"), ("h", "<i4")])
+DTYPE_ENEMIGO = np.dtype([
+    ("tipo", "<u2"),
+    ("x", "<f8"),
+    ("y", "<f8"),
+    ("ancho", "<f8"),
+    ("alto", "<f8"),
+    ("velocidad", "<f8"),
+    ("limite_izq", "<f8"),
+    ("limite_der", "<f8"),
+])
+DTYPE_BUFFO = np.dtype([("tipo", "<u2"), ("x", "<f8"), ("y", "<f8"), ("w", "<f8"), ("h", "<f8")])
+
+# Valores por defecto de EnemigoFactory / Buff.desde_dict para campos ausentes en el JSON
+DEFECTO_ENEMIGO = {"tipo": "guerrero", "x": 0, "y": 0, "ancho": 48, "alto": 48,
+                   "velocidad": 2, "limite_izq": 0, "limite_der": 200}
+DEFECTO_BUFFO = {"tipo": "velocidad", "x": 0, "y": 0, "w": 32, "h": 32}
+
+
+def _alinear(n):
+    return (n + 7) & ~7
+
+
+def _numero(valor):
+    """Devuelve int si el valor es entero (como en el JSON original), si no float."""
+    valor = float(valor)
+    return int(valor) if valor.is_integer() else valor
+
+
+def _disposicion(num_trozos, num_plataformas, num_refs, num_enemigos, num_buffos, largo_meta):
+    """Offsets de cada seccion; los usan tanto el compilador como el lector."""
+    offsets = {}
+    pos = _alinear(CABECERA.size)
+    for nombre, tamano in (
+        ("meta", largo_meta),
+        ("plataformas", num_plataformas * DTYPE_PLATAFORMA.itemsize),
+        ("plat_indptr", (num_trozos + 1) * 8),
+        ("plat_indices", num_refs * 4),
+        ("ene_indptr", (num_trozos + 1) * 8),
+        ("enemigos", num_enemigos * DTYPE_ENEMIGO.itemsize),
+        ("buf_indptr", (num_trozos + 1) * 8),
+        ("buffos", num_buffos * DTYPE_BUFFO.itemsize),
+    ):
+        offsets[nombre] = pos
+        pos = _alinear(pos + tamano)
+    return offsets, pos
+
+
+def _trozo_de(x, ancho_trozo, num_trozos):
+    return np.clip(np.floor_divide(x, ancho_trozo).astype(np.int64), 0, num_trozos - 1)
+
+
+def _agrupar(registros, trozos, num_trozos):
+    """Ordena registros por trozo (estable) y devuelve (registros, indptr)."""
+    orden = np.argsort(trozos, kind="stable")
+    conteo = np.bincount(trozos, minlength=num_trozos)
+    indptr = np.concatenate(([0], np.cumsum(conteo))).astype(np.int64)
+    return registros[orden], indptr
+
+
+def compilar_nivel(nivel, ruta_salida, ancho_trozo=None):
+    """
+    Escribe el nivel (ya cargado con Nivel.desde_archivo) en formato binario.
+    ancho_trozo por defecto: 8 tiles.
+    """
+    ancho_trozo = int(ancho_trozo or 8 * nivel.tile_size)
+    plataformas = list(nivel.plataformas)
+    enemigos = [dict(DEFECTO_ENEMIGO, **data) for data in nivel.enemigos]
+    buffos = [dict(DEFECTO_BUFFO, **data) for data in nivel.buffos]
+
+    extension = max(
+        [nivel.ancho_mundo]
+        + [p.right for p in plataformas]
+        + [data["x"] + 1 for data in enemigos + buffos]
+    )
+    num_trozos = max(1, -(-int(np.ceil(extension)) // ancho_trozo))
+
+    tipos_enemigo = sorted({str(data["tipo"]) for data in enemigos})
+    tipos_buffo = sorted({str(data["tipo"]) for data in buffos})
+    meta = json.dumps({
+        "nombre": nivel.nombre,
+        "fondo": nivel.fondo,
+        "tipos_enemigo": tipos_enemigo,
+        "tipos_buffo": tipos_buffo,
+    }).encode("utf-8")
+
+    # Plataformas en orden del nivel + indice CSR de las que cubre cada trozo
+    regs_plat = np.array([(p.x, p.y, p.w, p.h) for p in plataformas], dtype=DTYPE_PLATAFORMA)
+    if plataformas:
+        primero = _trozo_de(regs_plat["x"], ancho_trozo, num_trozos)
+        ultimo = _trozo_de(regs_plat["x"] + np.maximum(regs_plat["w"], 1) - 1, ancho_trozo, num_trozos)
+        spans = ultimo - primero + 1
+        plat = np.repeat(np.arange(len(plataformas)), spans)
+        inicios = np.repeat(np.cumsum(spans) - spans, spans)
+        trozos = np.repeat(primero, spans) + (np.arange(len(plat)) - inicios)
+        plat_indices, plat_indptr = _agrupar(plat.astype(np.int32), trozos, num_trozos)
+    else:
+        plat_indices = np.zeros(0, dtype=np.int32)
+        plat_indptr = np.zeros(num_trozos + 1, dtype=np.int64)
+
+    codigo_enemigo = {tipo: i for i, tipo in enumerate(tipos_enemigo)}
+    regs_ene = np.array(
+        [(codigo_enemigo[str(d["tipo"])], d["x"], d["y"], d["ancho"], d["alto"],
+          d["velocidad"], d["limite_izq"], d["limite_der"]) for d in enemigos],
+        dtype=DTYPE_ENEMIGO,
+    )
+    regs_ene, ene_indptr = _agrupar(regs_ene, _trozo_de(regs_ene["x"], ancho_trozo, num_trozos), num_trozos)
+
+    codigo_buffo = {tipo: i for i, tipo in enumerate(tipos_buffo)}
+    regs_buf = np.array(
+        [(codigo_buffo[str(d["tipo"])], d["x"], d["y"], d["w"], d["h"]) for d in buffos],
+        dtype=DTYPE_BUFFO,
+    )
+    regs_buf, buf_indptr = _agrupar(regs_buf, _trozo_de(regs_buf["x"], ancho_trozo, num_trozos), num_trozos)
+
+    offsets, total = _disposicion(
+        num_trozos, len(regs_plat), len(plat_indices), len(regs_ene), len(regs_buf), len(meta)
+    )
+    contenido = bytearray(total)
+    CABECERA.pack_into(
+        contenido, 0, MAGIC, VERSION, 0,
+        nivel.tile_size, ancho_trozo, num_trozos,
+        len(regs_plat), len(plat_indices), len(regs_ene), len(regs_buf), len(meta),
+        nivel.altura_suelo, nivel.ancho_mundo, nivel.meta_x, nivel.spawn[0], nivel.spawn[1],
+    )
+    for nombre, datos in (
+        ("meta", meta),
+        ("plataformas", regs_plat.tobytes()),
+        ("plat_indptr", plat_indptr.astype("<i8").tobytes()),
+        ("plat_indices", plat_indices.astype("<i4").tobytes()),
+        ("ene_indptr", ene_indptr.astype("<i8").tobytes()),
+        ("enemigos", regs_ene.tobytes()),
+        ("buf_indptr", buf_indptr.astype("<i8").tobytes()),
+        ("buffos", regs_buf.tobytes()),
+    ):
+        contenido[offsets[nombre]:offsets[nombre] + len(datos)] = datos
+
+    with open(ruta_salida, "wb") as archivo:
+        archivo.write(contenido)
+    return ruta_salida
+
+
+class NivelBinario:
+    """
+    Lector de un nivel .nivb mapeado en memoria. Solo la cabecera se lee al
+    abrir; plataformas, enemigos y buffos se decodifican por trozo.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._archivo = open(ruta, "rb")
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, _, self.tile_size, self.ancho_trozo, self.num_trozos,
+         num_plataformas, num_refs, num_enemigos, num_buffos, largo_meta,
+         altura_suelo, ancho_mundo, meta_x, spawn_x, spawn_y) = CABECERA.unpack_from(self._mapa, 0)
+        if magic != MAGIC or version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es un nivel compilado compatible")
+
+        self.altura_suelo = _numero(altura_suelo)
+        self.ancho_mundo = _numero(ancho_mundo)
+        self.meta_x = _numero(meta_x)
+        self.spawn = (_numero(spawn_x), _numero(spawn_y))
+
+        offsets, _ = _disposicion(
+            self.num_trozos, num_plataformas, num_refs, num_enemigos, num_buffos, largo_meta
+        )
+        meta = json.loads(bytes(self._mapa[offsets["meta"]:offsets["meta"] + largo_meta]).decode("utf-8"))
+        self.nombre = meta["nombre"]
+        self.fondo = meta["fondo"]
+        self.tipos_enemigo = meta["tipos_enemigo"]
+        self.tipos_buffo = meta["tipos_buffo"]
+
+        def vista(nombre, dtype, cantidad):
+            return np.frombuffer(self._mapa, dtype=dtype, count=cantidad, offset=offsets[nombre])
+
+        trozos = self.num_trozos + 1
+        self.plataformas = vista("plataformas", DTYPE_PLATAFORMA, num_plataformas)
+        self.plat_indptr = vista("plat_indptr", "<i8", trozos)
+        self.plat_indices = vista("plat_indices", "<i4", num_refs)
+        self.ene_indptr = vista("ene_indptr", "<i8", trozos)
+        self.enemigos = vista("enemigos", DTYPE_ENEMIGO, num_enemigos)
+        self.buf_indptr = vista("buf_indptr", "<i8", trozos)
+        self.buffos = vista("buffos", DTYPE_BUFFO, num_buffos)
+
+    def chunks_en_rango(self, x_min, x_max):
+        """Numeros de trozo que se solapan con [x_min, x_max)."""
+        primero = max(0, int(x_min) // self.ancho_trozo)
+        ultimo = min(self.num_trozos - 1, (int(np.ceil(x_max)) - 1) // self.ancho_trozo)
+        return range(primero, ultimo + 1)
+
+    def plataformas_de_chunk(self, numero):
+        """(ordenes, rects): posicion en el nivel y pygame.Rect de las plataformas del trozo."""
+        inicio, fin = self.plat_indptr[numero], self.plat_indptr[numero + 1]
+        ordenes = self.plat_indices[inicio:fin].tolist()
+        registros = self.plataformas[ordenes].tolist()
+        return ordenes, [pygame.Rect(x, y, w, h) for x, y, w, h in registros]
+
+    def enemigos_de_chunk(self, numero):
+        """Datos de enemigos del trozo, con las mismas claves que el JSON."""
+        registros = self.enemigos[self.ene_indptr[numero]:self.ene_indptr[numero + 1]].tolist()
+        return [
+            {
+                "tipo": self.tipos_enemigo[tipo],
+                "x": _numero(x),
+                "y": _numero(y),
+                "ancho": _numero(ancho),
+                "alto": _numero(alto),
+                "velocidad": _numero(velocidad),
+                "limite_izq": _numero(limite_izq),
+                "limite_der": _numero(limite_der),
+            }
+            for tipo, x, y, ancho, alto, velocidad, limite_izq, limite_der in registros
+        ]
+
+    def buffos_de_chunk(self, numero):
+        """Datos de buffos del trozo, con las mismas claves que el JSON."""
+        registros = self.buffos[self.buf_indptr[numero]:self.buf_indptr[numero + 1]].tolist()
+        return [
+            {"tipo": self.tipos_buffo[tipo], "x": _numero(x), "y": _numero(y), "w": _numero(w), "h": _numero(h)}
+            for tipo, x, y, w, h in registros
+        ]
+
+    def cerrar(self):
+        """Libera el mapa de memoria (las vistas NumPy dejan de ser validas)."""
+        self.plataformas = self.plat_indptr = self.plat_indices = None
+        self.ene_indptr = self.enemigos = self.buf_indptr = self.buffos = None
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._archivo.close()
+
+
+def main():
+    """Compila cada nivel JSON recibido a .nivb (junto al original)."""
+    from m.nivel import Nivel
+
+    rutas = sys.argv[1:]
+    if not rutas:
+        print("Uso: python -m m.nivel_binario niveles/nivel.json [...]")
+        sys.exit(1)
+    for ruta in rutas:
+        nivel = Nivel.desde_archivo(ruta)
+        salida = compilar_nivel(nivel, os.path.splitext(ruta)[0] + EXTENSION_NIVEL_BINARIO)
+        print(f"{ruta} -> {salida} ({os.path.getsize(salida)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
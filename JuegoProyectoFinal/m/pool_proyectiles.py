@@ -0,0 +1,153 @@
+import numpy as np
+import pygame
+
+
+def redondear_como_rect(valores):
+    """Redondeo de pygame.Rect al asignar floats (mitades se alejan del cero)."""
+    return np.where(valores >= 0, np.floor(valores + 0.5), np.ceil(valores - 0.5))
+
+
+class VistaProyectil:
+    """
+    Vista liviana de un slot del pool. Expone la misma interfaz que Proyectil
+    (rect, vx, vy, color, dano, vivo) para Render y los chequeos de colision.
+    """
+
+    __slots__ = ("pool", "indice")
+
+    def __init__(self, pool, indice):
+        self.pool = pool
+        self.indice = indice
+
+    @property
+    def rect(self):
+        p, i = self.pool, self.indice
+        return pygame.Rect(int(p.x[i]), int(p.y[i]), int(p.ancho[i]), int(p.alto[i]))
+
+    @property
+    def vx(self):
+        return float(self.pool.vx[self.indice])
+
+    @property
+    def vy(self):
+        return float(self.pool.vy[self.indice])
+
+    @property
+    def color(self):
+        return self.pool.colores[self.indice]
+
+    @property
+    def dano(self):
+        return int(self.pool.dano[self.indice])
+
+    @property
+    def vivo(self):
+        return bool(self.pool.vivo[self.indice])
+
+
+class PoolProyectiles:
+    """
+    Pool de proyectiles en estructura de arreglos (NumPy). Los slots se reutilizan,
+    asi que disparar no crea objetos nuevos; movimiento, expiracion por TTL y
+    descarte fuera del mundo se calculan vectorizados para todo el pool.
+    """
+
+    def __init__(self, capacidad=256, reloj=None):
+        self.reloj = reloj  # RelojSimulacion; None = tiempo real de pygame
+        self.capacidad = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.vx = np.zeros(0)
+        self.vy = np.zeros(0)
+        self.ancho = np.zeros(0, dtype=np.int32)
+        self.alto = np.zeros(0, dtype=np.int32)
+        self.dano = np.zeros(0, dtype=np.int32)
+        self.creado = np.zeros(0)
+        self.ttl = np.zeros(0)
+        self.vivo = np.zeros(0, dtype=bool)
+        self.colores = []
+        self._vistas = []
+        self._libres = []
+        self.num_vivos = 0
+        self._crecer(max(1, capacidad))
+
+    def _ahora(self):
+        if self.reloj is not None:
+            return self.reloj.ahora()
+        return pygame.time.get_ticks()
+
+    def _crecer(self, nueva_capacidad):
+        extra = nueva_capacidad - self.capacidad
+        self.x = np.concatenate((self.x, np.zeros(extra)))
+        self.y = np.concatenate((self.y, np.zeros(extra)))
+        self.vx = np.concatenate((self.vx, np.zeros(extra)))
+        self.vy = np.concatenate((self.vy, np.zeros(extra)))
+        self.ancho = np.concatenate((self.ancho, np.zeros(extra, dtype=np.int32)))
+        self.alto = np.concatenate((self.alto, np.zeros(extra, dtype=np.int32)))
+        self.dano = np.concatenate((self.dano, np.zeros(extra, dtype=np.int32)))
+        self.creado = np.concatenate((self.creado, np.zeros(extra)))
+        self.ttl = np.concatenate((self.ttl, np.zeros(extra)))
+        self.vivo = np.concatenate((self.vivo, np.zeros(extra, dtype=bool)))
+        self.colores.extend([None] * extra)
+        self._vistas.extend(VistaProyectil(self, i) for i in range(self.capacidad, nueva_capacidad))
+        # Los slots bajos se entregan primero (se sacan del final de la pila)
+        self._libres[:0] = range(nueva_capacidad - 1, self.capacidad - 1, -1)
+        self.capacidad = nueva_capacidad
+
+    def __len__(self):
+        return self.num_vivos
+
+    def __iter__(self):
+        vistas = self._vistas
+        return (vistas[i] for i in np.flatnonzero(self.vivo).tolist())
+
+    def emitir(self, x, y, vx, vy, ancho=12, alto=6, color=(255, 200, 50), dano=10, ttl_ms=3000):
+        """Ocupa un slot libre con un proyectil nuevo y devuelve su vista."""
+        if not self._libres:
+            self._crecer(self.capacidad * 2)
+        i = self._libres.pop()
+        # Mismo redondeo que pygame.Rect(x, y, ...)
+        self.x[i] = redondear_como_rect(np.float64(x))
+        self.y[i] = redondear_como_rect(np.float64(y))
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.ancho[i] = ancho
+        self.alto[i] = alto
+        self.dano[i] = dano
+        self.creado[i] = self._ahora()
+        self.ttl[i] = ttl_ms
+        self.vivo[i] = True
+        self.colores[i] = color
+        self.num_vivos += 1
+        return self._vistas[i]
+
+    def actualizar(self, x_min, x_max):
+        """Mueve los proyectiles vivos, expira por TTL y libera los que salen de [x_min, x_max]."""
+        if self.num_vivos == 0:
+            return
+        vivos = self.vivo
+        self.x[vivos] = redondear_como_rect(self.x[vivos] + self.vx[vivos])
+        self.y[vivos] = redondear_como_rect(self.y[vivos] + self.vy[vivos])
+
+        ahora = self._ahora()
+        muertos = vivos & ((ahora - self.creado > self.ttl) | (self.x < x_min) | (self.x > x_max))
+        liberados = np.flatnonzero(muertos)
+        if liberados.size:
+            self.vivo[liberados] = False
+            self._libres.extend(liberados.tolist())
+            self.num_vivos -= liberados.size
+
+    def candidatos(self, rect):
+        """Vistas de proyectiles vivos cuyo intervalo en x se solapa con rect."""
+        if self.num_vivos == 0:
+            return []
+        mascara = self.vivo & (self.x < rect.right) & (self.x + self.ancho > rect.left)
+        vistas = self._vistas
+        return [vistas[i] for i in np.flatnonzero(mascara).tolist()]
+
+    def limpiar(self):
+        """Libera todos los slots (conserva la capacidad reservada)."""
+        self.vivo[:] = False
+        self.colores = [None] * self.capacidad
+        self._libres = list(range(self.capacidad - 1, -1, -1))
+        self.num_vivos = 0
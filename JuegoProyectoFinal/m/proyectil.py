@@ -4,14 +4,15 @@ import pygame
 class Proyectil:
     """Proyectil simple disparado por enemigos."""
 
-    def __init__(self, x, y, vx, vy, ancho=12, alto=6, color=(255, 200, 50), dano=10, ttl_ms=3000):
+    def __init__(self, x, y, vx, vy, ancho=12, alto=6, color=(255, 200, 50), dano=10, ttl_ms=3000, reloj=None):
         self.rect = pygame.Rect(x, y, ancho, alto)
         self.vx = vx
         self.vy = vy
         self.color = color
         self.dano = dano
         self.ttl_ms = ttl_ms
-        self.creado_ms = pygame.time.get_ticks()
+        self.reloj = reloj  # RelojSimulacion; None = tiempo real de pygame
+        self.creado_ms = self._ahora()
         self.vivo = True
 
     def update(self):
@@ -21,6 +22,11 @@ class Proyectil:
         self.rect.x += self.vx
         self.rect.y += self.vy
 
-        ahora = pygame.time.get_ticks()
+        ahora = self._ahora()
         if ahora - self.creado_ms > self.ttl_ms:
             self.vivo = False
+
+    def _ahora(self):
+        if self.reloj is not None:
+            return self.reloj.ahora()
+        return pygame.time.get_ticks()
@@ -0,0 +1,20 @@
+class RelojSimulacion:
+    """
+    Reloj de simulacion: avanza un paso fijo por tick en lugar de leer
+    pygame.time.get_ticks(). Cooldowns, TTL de proyectiles y expiracion de
+    buffos dependen de los ticks simulados, no del tiempo real.
+    """
+
+    def __init__(self, fps=60):
+        self.paso_ms = 1000.0 / fps
+        self.ticks = 0
+
+    def avanzar(self, n_ticks=1):
+        self.ticks += n_ticks
+
+    def ahora(self):
+        """Milisegundos simulados desde el ultimo reset."""
+        return self.ticks * self.paso_ms
+
+    def reset(self):
+        self.ticks = 0
@@ -0,0 +1,91 @@
+from bisect import bisect_left, insort
+
+from m.fase_amplia import filtrar_por_x
+
+
+class VentanaActivacion:
+    """
+    Separa un grupo de entidades (con .rect) en despiertas y dormidas segun una
+    ventana horizontal alrededor de la camara. Las dormidas no se simulan ni se
+    revisan: quedan en una lista ordenada por x con su estado intacto y se
+    despiertan con busqueda binaria cuando la ventana las alcanza, asi que el
+    costo por tick depende de las entidades cercanas y no del largo del nivel.
+    """
+
+    def __init__(self, entidades, histeresis=128):
+        # Px extra que una entidad despierta puede alejarse antes de dormirse
+        # (evita que despierte y duerma en cada tick al borde de la ventana)
+        self.histeresis = histeresis
+        self.orden = {}  # id(entidad) -> posicion en el grupo (orden original)
+        self._siguiente = 0
+        self.dormidas = []  # (rect.left, orden, entidad) ordenadas
+        self.activas = []  # en orden original
+        self.ancho_max = 0
+        self.version = 0  # cambia cada vez que alguien despierta o se duerme
+        self.agregar(entidades)
+
+    def __len__(self):
+        return len(self.dormidas) + len(self.activas)
+
+    def agregar(self, entidades):
+        """Agrega entidades nuevas (dormidas hasta el proximo actualizar)."""
+        nuevas = []
+        for entidad in entidades:
+            orden = self._siguiente
+            self._siguiente += 1
+            self.orden[id(entidad)] = orden
+            self.ancho_max = max(self.ancho_max, entidad.rect.width)
+            nuevas.append((entidad.rect.left, orden, entidad))
+        if nuevas:
+            self.dormidas.extend(nuevas)
+            self.dormidas.sort()
+
+    def actualizar(self, x_min, x_max):
+        """Duerme las activas que salieron de [x_min, x_max) y despierta las que entraron."""
+        cambio = False
+
+        limite_izq = x_min - self.histeresis
+        limite_der = x_max + self.histeresis
+        salen = [e for e in self.activas if e.rect.right <= limite_izq or e.rect.left >= limite_der]
+        if salen:
+            cambio = True
+            for entidad in salen:
+                insort(self.dormidas, (entidad.rect.left, self.orden[id(entidad)], entidad))
+            fuera = set(map(id, salen))
+            self.activas = [e for e in self.activas if id(e) not in fuera]
+
+        inicio = bisect_left(self.dormidas, (x_min - self.ancho_max,))
+        fin = bisect_left(self.dormidas, (x_max,))
+        if inicio < fin:
+            tramo = self.dormidas[inicio:fin]
+            entran = [t for t in tramo if t[2].rect.right > x_min]
+            if entran:
+                cambio = True
+                self.dormidas[inicio:fin] = [t for t in tramo if t[2].rect.right <= x_min]
+                self.activas.extend(t[2] for t in entran)
+                self.activas.sort(key=lambda e: self.orden[id(e)])
+
+        if cambio:
+            self.version += 1
+        return cambio
+
+    def en_rango_x(self, x_min, x_max):
+        """
+        Despiertas (en orden original) que se solapan con [x_min, x_max). Las
+        dormidas estan fuera de la ventana, asi que un rango dentro de ella
+        (p.ej. la camara) se resuelve recorriendo solo las despiertas.
+        """
+        return filtrar_por_x(self.activas, x_min, x_max)
+
+    def descartar(self, entidad):
+        """Quita una entidad eliminada (pisada, recogida), este despierta o dormida."""
+        orden = self.orden.pop(id(entidad), None)
+        if orden is None:
+            return
+        if entidad in self.activas:
+            self.activas.remove(entidad)
+        else:
+            i = bisect_left(self.dormidas, (entidad.rect.left, orden))
+            if i < len(self.dormidas) and self.dormidas[i][2] is entidad:
+                del self.dormidas[i]
+        self.version += 1
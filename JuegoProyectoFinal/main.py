@@ -8,14 +8,39 @@ Controles:
 - Flechas IZQUIERDA/DERECHA o A/D: Mover el personaje
 - ESPACIO, W o FLECHA ARRIBA: Saltar
 - ESC: Salir del juego
+
+Grabar una partida para reproducirla luego (python -m c.grabacion partida.grab):
+    python main.py --grabar partida.grab
+
+Medir cuanto tarda cada fase del frame (overlay con F3; traza opcional .csv o .json):
+    python main.py --perfilar [traza.csv]
 """
+import sys
 
 from c.game_controller import GameController
+from c.grabacion import GrabadorEntradas
+from c.perfilador import Perfilador
 
 def main():
     """Función principal del juego"""
+    grabador = None
+    if "--grabar" in sys.argv:
+        indice = sys.argv.index("--grabar")
+        if indice + 1 >= len(sys.argv):
+            print("Uso: python main.py [--grabar partida.grab] [--perfilar [traza.csv|traza.json]]")
+            sys.exit(1)
+        grabador = GrabadorEntradas(sys.argv[indice + 1])
+
+    perfilador = None
+    if "--perfilar" in sys.argv:
+        indice = sys.argv.index("--perfilar")
+        ruta_traza = None
+        if indice + 1 < len(sys.argv) and not sys.argv[indice + 1].startswith("--"):
+            ruta_traza = sys.argv[indice + 1]
+        perfilador = Perfilador(ruta_traza=ruta_traza)
+
     # Crear y ejecutar el juego
-    juego = GameController(ancho=800, alto=600, fps=60)
+    juego = GameController(ancho=800, alto=600, fps=60, grabador=grabador, perfilador=perfilador)
     juego.ejecutar()
 
 if __name__ == "__main__":
@@ -0,0 +1,232 @@
+"""
+Atlas de sprites: todas las variantes que usa el juego (ya escaladas y
+volteadas) empaquetadas en una sola superficie. El atlas se guarda en disco
+(PNG + manifiesto JSON con el rect de cada sprite y la fecha/tamano de cada
+PNG fuente); mientras las fuentes no cambien, arrancar es cargar una imagen.
+Al cargar, cada region se copia a una superficie propia: en pygame (blit por
+software) blitear una subsuperficie es ~10-15% mas lento que una suelta.
+
+Generar el cache por adelantado (desde JuegoProyectoFinal/):
+    python -m v.atlas_sprites [graficos/Sprites]
+"""
+import json
+import os
+import sys
+import tempfile
+
+import pygame
+
+
+def _respaldo_circulo(tamano, color):
+    superficie = pygame.Surface(tamano, pygame.SRCALPHA)
+    pygame.draw.circle(superficie, color, (tamano[0] // 2, tamano[1] // 2), tamano[0] // 2)
+    return superficie
+
+
+def _respaldo_rect(tamano, color, radio):
+    superficie = pygame.Surface(tamano, pygame.SRCALPHA)
+    pygame.draw.rect(superficie, color, (0, 0, tamano[0], tamano[1]), border_radius=radio)
+    return superficie
+
+
+def _escribir_atomico(ruta, escribir):
+    """
+    escribir(ruta_temporal) y luego os.replace sobre ruta: quien lee en paralelo
+    (p.ej. los procesos del simulador) ve el archivo viejo o el nuevo, nunca uno a medias.
+    """
+    carpeta, nombre = os.path.split(ruta)
+    base, extension = os.path.splitext(nombre)
+    # La extension se conserva: pygame.image.save elige el formato por ella
+    descriptor, temporal = tempfile.mkstemp(prefix=f".{base}-", suffix=extension, dir=carpeta)
+    os.close(descriptor)
+    try:
+        escribir(temporal)
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except OSError:
+            pass
+        raise
+
+
+# nombre, archivo fuente, tamano, volteado horizontal, respaldo si falta el archivo
+VARIANTES = (
+    ("jugador", "Jugador.png", (64, 64), False, lambda: _respaldo_circulo((64, 64), (255, 255, 255))),
+    ("jugador_izq", "Jugador.png", (64, 64), True, lambda: _respaldo_circulo((64, 64), (255, 255, 255))),
+    ("enemigo_guerrero", "Enemigo_1_.png", (48, 48), False, lambda: _respaldo_rect((48, 48), (200, 60, 60), 8)),
+    ("enemigo_arquero", "Enemigo_2_.png", (48, 48), False, lambda: _respaldo_rect((48, 48), (200, 60, 60), 8)),
+    ("enemigo_mago", "Enemigo_3_.png", (48, 48), False, lambda: _respaldo_rect((48, 48), (200, 60, 60), 8)),
+    ("enemigo_extra", "Enemigo_4_.png", (48, 48), False, lambda: _respaldo_rect((48, 48), (200, 60, 60), 8)),
+    ("proyectil", "Proyectil.png", (24, 16), False, lambda: _respaldo_rect((12, 6), (255, 200, 50), 3)),
+    ("proyectil_izq", "Proyectil.png", (24, 16), True, lambda: _respaldo_rect((12, 6), (255, 200, 50), 3)),
+    ("buff_velocidad", "Bufo_1_.png", (32, 32), False, lambda: _respaldo_circulo((32, 32), (255, 215, 0))),
+    ("buff_salto", "Bufo_2_.png", (32, 32), False, lambda: _respaldo_circulo((32, 32), (70, 130, 180))),
+    ("buff_invencible", "Bufo_3_.png", (32, 32), False, lambda: _respaldo_circulo((32, 32), (60, 179, 113))),
+)
+
+
+class AtlasSprites:
+    """Sprites del juego en una unica textura, con cache en disco."""
+
+    VERSION = 1
+    ANCHO = 256  # ancho del atlas en px
+    SEPARACION = 1  # px libres entre sprites
+    ARCHIVO_IMAGEN = "atlas.png"
+    ARCHIVO_MANIFIESTO = "manifiesto.json"
+
+    def __init__(self, dir_sprites="graficos/Sprites", dir_cache=None):
+        self.dir_sprites = dir_sprites
+        self.dir_cache = dir_cache or os.path.join(dir_sprites, ".atlas")
+        self.superficie = None
+        self.rects = {}  # nombre -> Rect dentro del atlas
+        self.sprites = {}  # nombre -> superficie copiada de su region
+        self.desde_cache = False
+
+    def fuentes(self):
+        """Huella de cada PNG fuente: [mtime_ns, bytes], o None si no existe."""
+        huella = {}
+        for _, archivo, _, _, _ in VARIANTES:
+            path = os.path.join(self.dir_sprites, archivo)
+            if os.path.exists(path):
+                datos = os.stat(path)
+                huella[archivo] = [datos.st_mtime_ns, datos.st_size]
+            else:
+                huella[archivo] = None
+        return huella
+
+    def cargar(self):
+        """Usa el atlas en cache si sigue al dia; si no, lo construye y lo guarda."""
+        if not self._cargar_cache():
+            self.construir()
+            self.guardar()
+        self._convertir()
+        self.sprites = {nombre: self.superficie.subsurface(rect).copy() for nombre, rect in self.rects.items()}
+        return self
+
+    def _cargar_cache(self):
+        ruta_manifiesto = os.path.join(self.dir_cache, self.ARCHIVO_MANIFIESTO)
+        ruta_imagen = os.path.join(self.dir_cache, self.ARCHIVO_IMAGEN)
+        if not (os.path.exists(ruta_manifiesto) and os.path.exists(ruta_imagen)):
+            return False
+        try:
+            with open(ruta_manifiesto, encoding="utf-8") as archivo:
+                manifiesto = json.load(archivo)
+        except (OSError, ValueError):
+            return False
+        nombres = [v[0] for v in VARIANTES]
+        if (
+            manifiesto.get("version") != self.VERSION
+            or manifiesto.get("fuentes") != self.fuentes()
+            or sorted(manifiesto.get("sprites", {})) != sorted(nombres)
+        ):
+            return False
+        try:
+            self.superficie = pygame.image.load(ruta_imagen)
+        except pygame.error:
+            # PNG truncado o corrupto: se trata como cache vencida y se reconstruye
+            return False
+        self.rects = {nombre: pygame.Rect(rect) for nombre, rect in manifiesto["sprites"].items()}
+        self.desde_cache = True
+        return True
+
+    def construir(self):
+        """Escala/voltea cada variante y las empaqueta por estantes (alto descendente)."""
+        originales = {}
+        variantes = []
+        for nombre, archivo, tamano, volteado, respaldo in VARIANTES:
+            path = os.path.join(self.dir_sprites, archivo)
+            if os.path.exists(path):
+                if archivo not in originales:
+                    originales[archivo] = pygame.image.load(path)
+                sprite = pygame.transform.scale(originales[archivo], tamano)
+                if volteado:
+                    sprite = pygame.transform.flip(sprite, True, False)
+            else:
+                sprite = respaldo()
+            variantes.append((nombre, sprite))
+
+        # Empaquetado por estantes: ordenadas por alto, se llenan filas de ANCHO px
+        orden = sorted(variantes, key=lambda v: (-v[1].get_height(), v[0]))
+        rects = {}
+        x = y = alto_estante = 0
+        for nombre, sprite in orden:
+            ancho, alto = sprite.get_size()
+            if x + ancho > self.ANCHO:
+                x = 0
+                y += alto_estante + self.SEPARACION
+                alto_estante = 0
+            rects[nombre] = pygame.Rect(x, y, ancho, alto)
+            x += ancho + self.SEPARACION
+            alto_estante = max(alto_estante, alto)
+
+        superficie = pygame.Surface((self.ANCHO, y + alto_estante), pygame.SRCALPHA)
+        superficie.fill((0, 0, 0, 0))
+        for nombre, sprite in variantes:
+            superficie.blit(sprite, rects[nombre], special_flags=pygame.BLEND_RGBA_MAX)
+        self.superficie = superficie
+        self.rects = rects
+        self.desde_cache = False
+
+    def guardar(self):
+        """
+        Escribe atlas y manifiesto (cada uno reemplazado de forma atomica, la imagen
+        primero); si la carpeta no se puede escribir, el atlas queda solo en memoria.
+        """
+        manifiesto = {
+            "version": self.VERSION,
+            "fuentes": self.fuentes(),
+            "sprites": {nombre: list(rect) for nombre, rect in self.rects.items()},
+        }
+
+        def escribir_manifiesto(ruta):
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump(manifiesto, archivo, indent=2, sort_keys=True)
+
+        try:
+            os.makedirs(self.dir_cache, exist_ok=True)
+            _escribir_atomico(
+                os.path.join(self.dir_cache, self.ARCHIVO_IMAGEN),
+                lambda ruta: pygame.image.save(self.superficie, ruta),
+            )
+            _escribir_atomico(os.path.join(self.dir_cache, self.ARCHIVO_MANIFIESTO), escribir_manifiesto)
+        except (OSError, pygame.error):
+            pass
+
+    def _convertir(self):
+        # Con ventana abierta, el formato de pixel de la pantalla acelera los blits
+        if pygame.display.get_surface() is not None:
+            self.superficie = self.superficie.convert_alpha()
+
+    def get(self, nombre):
+        return self.sprites.get(nombre)
+
+    def nombres(self):
+        return list(self.sprites)
+
+
+_atlas = {}
+
+
+def atlas_compartido(dir_sprites="graficos/Sprites"):
+    """Un AtlasSprites cargado por carpeta de sprites, compartido por SpriteManager y SpriteLoader."""
+    clave = os.path.abspath(dir_sprites)
+    atlas = _atlas.get(clave)
+    if atlas is None:
+        atlas = _atlas[clave] = AtlasSprites(dir_sprites).cargar()
+    return atlas
+
+
+def main():
+    dir_sprites = sys.argv[1] if len(sys.argv) > 1 else "graficos/Sprites"
+    atlas = AtlasSprites(dir_sprites)
+    atlas.construir()
+    atlas.guardar()
+    print(
+        f"Atlas {atlas.superficie.get_width()}x{atlas.superficie.get_height()} con {len(atlas.rects)} sprites "
+        f"en {atlas.dir_cache}"
+    )
+
+
+if __name__ == "__main__":
+    main()
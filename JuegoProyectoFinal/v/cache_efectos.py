@@ -0,0 +1,73 @@
+from collections import OrderedDict
+import pygame
+
+
+class CacheEfectosJugador:
+    """
+    Cache de los efectos visuales de buffos del jugador: sprites ya escalados y
+    anillos de aura pre-compuestos en una sola superficie. Con los buffos
+    estables cada frame cuesta un blit por superficie en lugar de reescalar el
+    sprite y redibujar cada circulo.
+    """
+
+    # Entradas guardadas por tipo (frames de animacion x combinaciones de buffos)
+    MAX_ENTRADAS = 64
+    # Color transparente de los anillos (no debe coincidir con el de ninguna aura)
+    COLOR_CLAVE = (255, 0, 255)
+
+    def __init__(self, max_entradas=MAX_ENTRADAS):
+        self.max_entradas = max_entradas
+        self.escalados = OrderedDict()  # (sprite, ancho, alto) -> Surface
+        self.anillos = OrderedDict()  # (auras, ancho, alto) -> (Surface, desplazamiento)
+
+    def _guardar(self, cache, clave, valor):
+        cache[clave] = valor
+        if len(cache) > self.max_entradas:
+            cache.popitem(last=False)
+        return valor
+
+    def sprite_escalado(self, sprite, factor):
+        """Sprite escalado por factor; la clave es el tamano en pixeles resultante (escala cuantizada)."""
+        ancho = max(1, int(sprite.get_width() * factor))
+        alto = max(1, int(sprite.get_height() * factor))
+        clave = (sprite, ancho, alto)
+        escalado = self.escalados.get(clave)
+        if escalado is not None:
+            self.escalados.move_to_end(clave)
+            return escalado
+        return self._guardar(self.escalados, clave, pygame.transform.scale(sprite, (ancho, alto)))
+
+    def anillo_auras(self, auras, ancho, alto):
+        """
+        Superficie transparente con todas las auras dibujadas (de mayor a menor) y el
+        desplazamiento desde el centro del sprite hasta su esquina. None si no hay auras.
+        """
+        clave = (
+            tuple((aura.get("color"), aura.get("size", 0)) for aura in auras if aura.get("color")),
+            ancho,
+            alto,
+        )
+        if not clave[0]:
+            return None
+        anillo = self.anillos.get(clave)
+        if anillo is not None:
+            self.anillos.move_to_end(clave)
+            return anillo
+
+        base_radio = max(ancho, alto) // 2
+        capas = sorted(clave[0], key=lambda capa: capa[1], reverse=True)
+        radio_max = max(base_radio + max(4, size) // 2 for _, size in capas)
+        # Margen de un pixel para que el borde del circulo no quede recortado
+        centro = radio_max + 1
+        # Colorkey + RLE: el interior vacio del anillo casi no cuesta al blitear
+        superficie = pygame.Surface((2 * centro + 1, 2 * centro + 1)).convert()
+        superficie.fill(self.COLOR_CLAVE)
+        for color, size in capas:
+            size = max(4, size)
+            pygame.draw.circle(superficie, color, (centro, centro), base_radio + size // 2, width=max(2, size // 3))
+        superficie.set_colorkey(self.COLOR_CLAVE, pygame.RLEACCEL)
+        return self._guardar(self.anillos, clave, (superficie, (-centro, -centro)))
+
+    def limpiar(self):
+        self.escalados.clear()
+        self.anillos.clear()
@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+
+class CacheTextos:
+    """
+    Cache LRU de superficies de texto renderizadas, con clave
+    (fuente, texto, color, antialias). Los textos que se repiten entre frames
+    (HUD, menus, etiquetas) se renderizan una sola vez. Se limita por cantidad
+    de entradas y por bytes de pixeles; cuenta aciertos y fallos.
+    """
+
+    def __init__(self, max_entradas=512, max_bytes=8 * 1024 * 1024):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.superficies = OrderedDict()  # clave -> Surface
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self.superficies)
+
+    @staticmethod
+    def _bytes_de(superficie):
+        return superficie.get_pitch() * superficie.get_height()
+
+    def render(self, fuente, texto, color, antialias=True):
+        """Equivalente a fuente.render(texto, antialias, color), usando la cache."""
+        clave = (fuente, texto, tuple(color), antialias)
+        superficie = self.superficies.get(clave)
+        if superficie is not None:
+            self.superficies.move_to_end(clave)
+            self.aciertos += 1
+            return superficie
+
+        self.fallos += 1
+        superficie = fuente.render(texto, antialias, color)
+        self.superficies[clave] = superficie
+        self.bytes_usados += self._bytes_de(superficie)
+        # Se descartan las menos usadas recientemente (siempre queda la nueva)
+        while len(self.superficies) > 1 and (
+            len(self.superficies) > self.max_entradas or self.bytes_usados > self.max_bytes
+        ):
+            _, vieja = self.superficies.popitem(last=False)
+            self.bytes_usados -= self._bytes_de(vieja)
+        return superficie
+
+    def estadisticas(self):
+        """Contadores de uso (para depurar o ajustar los limites)."""
+        total = self.aciertos + self.fallos
+        return {
+            "entradas": len(self.superficies),
+            "bytes": self.bytes_usados,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+        }
+
+    def limpiar(self):
+        self.superficies.clear()
+        self.bytes_usados = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+
+# Cache compartida por Render y los estados (menu, pausa)
+cache_textos = CacheTextos()
+
+
+def render_texto(fuente, texto, color, antialias=True):
+    """Renderiza texto con la cache compartida."""
+    return cache_textos.render(fuente, texto, color, antialias)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+import pygame
+
+
+class CapaEstatica:
+    """
+    Cache de la geometria estatica del nivel (plataformas) pre-dibujada en trozos
+    del ancho de la ventana. Cada frame solo se blitean los uno o dos trozos que
+    ve la camara, en lugar de redibujar cada rectangulo redondeado.
+    """
+
+    # Trozos guardados a la vez (cada uno ocupa ancho x alto x 4 bytes)
+    MAX_TROZOS = 16
+    # Color transparente de los trozos (no debe coincidir con el de las plataformas)
+    COLOR_CLAVE = (255, 0, 255)
+
+    def __init__(self, indice, ancho_trozo, alto, color, border_radius=8):
+        self.indice = indice  # IndiceEspacial de plataformas
+        self.ancho_trozo = ancho_trozo
+        self.alto = alto
+        self.color = color
+        self.border_radius = border_radius
+        self.trozos = OrderedDict()  # numero de trozo -> Surface
+        self.version = indice.version  # si el indice crece (carga perezosa) se redibuja
+
+    def precargar(self, ancho_mundo):
+        """Dibuja por adelantado los primeros trozos del nivel (al cargar)."""
+        total = -(-ancho_mundo // self.ancho_trozo)
+        for numero in range(min(total, self.MAX_TROZOS)):
+            self._obtener_trozo(numero)
+
+    def _obtener_trozo(self, numero):
+        trozo = self.trozos.get(numero)
+        if trozo is not None:
+            self.trozos.move_to_end(numero)
+            return trozo
+
+        # Colorkey + RLE: las zonas vacias (la mayoria) casi no cuestan al blitear
+        trozo = pygame.Surface((self.ancho_trozo, self.alto)).convert()
+        trozo.fill(self.COLOR_CLAVE)
+        origen_x = numero * self.ancho_trozo
+        for plataforma in self.indice.en_rango_x(origen_x, origen_x + self.ancho_trozo):
+            pygame.draw.rect(trozo, self.color, plataforma.move(-origen_x, 0), border_radius=self.border_radius)
+        trozo.set_colorkey(self.COLOR_CLAVE, pygame.RLEACCEL)
+
+        self.trozos[numero] = trozo
+        if len(self.trozos) > self.MAX_TROZOS:
+            self.trozos.popitem(last=False)
+        return trozo
+
+    def dibujar(self, ventana, camara_x, ancho_vista):
+        """Blitea los trozos que se solapan con la camara."""
+        if self.indice.version != self.version:
+            self.trozos.clear()
+            self.version = self.indice.version
+        camara_x = int(camara_x)
+        primero = camara_x // self.ancho_trozo
+        ultimo = (camara_x + ancho_vista - 1) // self.ancho_trozo
+        for numero in range(primero, ultimo + 1):
+            ventana.blit(self._obtener_trozo(numero), (numero * self.ancho_trozo - camara_x, 0))
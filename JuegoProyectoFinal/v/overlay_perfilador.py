@@ -0,0 +1,53 @@
+import pygame
+
+
+class OverlayPerfilador:
+    """
+    Panel con p50/p95/p99 de cada fase del Perfilador. El panel se compone en
+    una superficie cada `cada_frames` frames y en los demas solo se blitea, asi
+    el overlay casi no altera lo que mide.
+    """
+
+    COLOR_FONDO = (0, 0, 0)
+    COLOR_TEXTO = (230, 230, 230)
+    COLOR_EXCEDIDO = (255, 90, 90)
+
+    def __init__(self, perfilador, fps=60, cada_frames=30, posicion=(10, 10)):
+        self.perfilador = perfilador
+        self.presupuesto_ms = 1000.0 / fps
+        self.cada_frames = cada_frames
+        self.posicion = posicion
+        self.fuente = pygame.font.SysFont("monospace", 13)
+        self.visible = True
+        self.panel = None
+        self.frame_panel = None
+
+    def alternar(self):
+        self.visible = not self.visible
+
+    def componer(self):
+        # Los numeros cambian en cada refresco: se renderizan directo, sin pasar
+        # por la cache de textos compartida (solo la llenarian de entradas unicas)
+        lineas = [(f"{'fase':<30}{'p50':>7}{'p95':>7}{'p99':>7}  ms", self.COLOR_TEXTO)]
+        for fase, p50, p95, p99 in self.perfilador.resumen():
+            nombre = "  " + fase.split("/", 1)[1] if "/" in fase else fase
+            color = self.COLOR_EXCEDIDO if fase == "frame" and p95 > self.presupuesto_ms else self.COLOR_TEXTO
+            lineas.append((f"{nombre[:30]:<30}{p50:7.2f}{p95:7.2f}{p99:7.2f}", color))
+        superficies = [self.fuente.render(texto, True, color) for texto, color in lineas]
+
+        alto_linea = self.fuente.get_linesize()
+        ancho = max(s.get_width() for s in superficies) + 12
+        panel = pygame.Surface((ancho, alto_linea * len(superficies) + 12))
+        panel.fill(self.COLOR_FONDO)
+        for i, superficie in enumerate(superficies):
+            panel.blit(superficie, (6, 6 + i * alto_linea))
+        self.panel = panel
+        self.frame_panel = self.perfilador.frames
+
+    def dibujar(self, ventana):
+        """Dibuja el panel y devuelve el rect que ocupa (None si esta oculto)."""
+        if not self.visible:
+            return None
+        if self.panel is None or self.perfilador.frames - self.frame_panel >= self.cada_frames:
+            self.componer()
+        return ventana.blit(self.panel, self.posicion)
@@ -1,11 +1,19 @@
 import os
 import pygame
+from m.fase_amplia import filtrar_por_x
+from m.indice_espacial import IndiceEspacial
+from v.cache_efectos import CacheEfectosJugador
+from v.cache_textos import render_texto
+from v.capa_estatica import CapaEstatica
 from v.sprite_manager import SpriteManager
 
 
 class Render:
     """Clase encargada de renderizar los elementos del juego"""
 
+    # Pixeles extra a cada lado de la camara (sprites mas grandes que su rect)
+    MARGEN_CULLING = 64
+
     def __init__(self, ventana, ancho, alto, altura_suelo=50, fondo=None):
         self.ventana = ventana
         self.ancho = ancho
@@ -39,6 +47,16 @@ class Render:
         # Camara
         self.camara_x = 0
 
+        # Cache de plataformas pre-dibujadas (se reconstruye si cambia el nivel)
+        self.capa_estatica = None
+
+        # Sprites escalados y auras pre-compuestas del jugador con buffos
+        self.cache_efectos = CacheEfectosJugador()
+
+        # Capa opcional dibujada encima de todo antes de mostrar el frame
+        # (objeto con dibujar(ventana) -> Rect o None, p.ej. OverlayPerfilador)
+        self.superposicion = None
+
         # HUD
         self.hud_font = pygame.font.SysFont("arial", 18)
 
@@ -92,15 +110,49 @@ class Render:
             3,
         )
 
+    def rango_visible(self):
+        """Intervalo horizontal del mundo [x_min, x_max) que cubre la camara."""
+        x_min = int(self.camara_x) - self.MARGEN_CULLING
+        return x_min, int(self.camara_x) + self.ancho + self.MARGEN_CULLING
+
+    def visibles(self, entidades):
+        """
+        Filtra por camara: indice en x (IndiceEspacial, VentanaActivacion),
+        pool (candidatos) o lista de entidades con rect.
+        """
+        x_min, x_max = self.rango_visible()
+        if hasattr(entidades, "en_rango_x"):
+            return entidades.en_rango_x(x_min, x_max)
+        if hasattr(entidades, "candidatos"):
+            return entidades.candidatos(pygame.Rect(x_min, 0, x_max - x_min, 1))
+        return filtrar_por_x(entidades, x_min, x_max)
+
+    def preparar_nivel(self, nivel):
+        """Pre-dibuja la geometria estatica del nivel al cargarlo."""
+        self.capa_estatica = CapaEstatica(nivel.indice_plataformas, self.ancho, self.alto, self.TIERRA)
+        self.capa_estatica.precargar(nivel.ancho_mundo)
+
+    def invalidar_capa_estatica(self):
+        """Descarta la cache de plataformas (ej. si se editan en el lugar)."""
+        self.capa_estatica = None
+
     def dibujar_plataformas(self, plataformas):
-        """Dibuja plataformas rectangulares del nivel"""
-        for plataforma in plataformas:
+        """Dibuja plataformas rectangulares del nivel (lista de Rect o IndiceEspacial)"""
+        if isinstance(plataformas, IndiceEspacial):
+            # Plataformas estaticas: blit de la capa cacheada
+            if self.capa_estatica is None or self.capa_estatica.indice is not plataformas:
+                self.capa_estatica = CapaEstatica(plataformas, self.ancho, self.alto, self.TIERRA)
+            self.capa_estatica.dibujar(self.ventana, self.camara_x, self.ancho)
+            return
+
+        x_min, x_max = self.rango_visible()
+        for plataforma in (p for p in plataformas if p.right > x_min and p.left < x_max):
             desplazado = plataforma.move(-self.camara_x, 0)
             pygame.draw.rect(self.ventana, self.TIERRA, desplazado, border_radius=8)
 
     def dibujar_enemigos(self, enemigos):
         """Dibuja enemigos usando sus sprites"""
-        for enemigo in enemigos:
+        for enemigo in self.visibles(enemigos):
             desplazado = enemigo.rect.move(-self.camara_x, 0)
 
             # Obtener sprite según tipo de arma
@@ -120,7 +172,7 @@ class Render:
 
     def dibujar_buffos(self, buffos):
         """Dibuja buffos coleccionables usando sprites"""
-        for buffo in buffos:
+        for buffo in self.visibles(buffos):
             desplazado = buffo.rect.move(-self.camara_x, 0)
 
             # Obtener sprite según tipo de buff
@@ -151,7 +203,7 @@ class Render:
 
     def dibujar_proyectiles(self, proyectiles):
         """Dibuja proyectiles usando sprites"""
-        for proyectil in proyectiles:
+        for proyectil in self.visibles(proyectiles):
             if not proyectil.vivo:
                 continue
             desplazado = proyectil.rect.move(-self.camara_x, 0)
@@ -170,9 +222,10 @@ class Render:
                 pygame.draw.rect(self.ventana, self.BARRA_BORDE, desplazado, width=1, border_radius=4)
 
     def dibujar_buff_timers(self, buff_timers):
-        """HUD de temporizadores de buffos con barra y texto."""
+        """HUD de temporizadores de buffos con barra y texto. Devuelve los rects dibujados."""
+        areas = []
         if not buff_timers:
-            return
+            return areas
         x = 10
         y = 10
         barra_ancho = 120
@@ -195,12 +248,13 @@ class Render:
             pygame.draw.rect(self.ventana, self.VERDE, fill_rect, border_radius=6)
 
             # Texto a la derecha
-            texto = f"{tipo}: {restante:0.1f}s"
-            superficie = self.hud_font.render(texto, True, self.TEXT_COLOR)
+            # El texto solo cambia cada 0.1s: la cache evita re-renderizarlo cada frame
+            superficie = render_texto(self.hud_font, f"{tipo}: {restante:0.1f}s", self.TEXT_COLOR)
             texto_pos = (barra_rect.right + padding, barra_rect.top - 4)
-            self.ventana.blit(superficie, texto_pos)
+            areas.append(barra_rect.union(self.ventana.blit(superficie, texto_pos)))
 
             y += line_height
+        return areas
 
     def dibujar_jugador(self, jugador, sprite):
         """Dibuja el sprite del jugador en su posicion con efectos de buffo"""
@@ -210,32 +264,32 @@ class Render:
         sprite_dibujar = sprite
         dibujar_rect = desplazado
         if jugador.escala_visual != 1.0:
-            factor = jugador.escala_visual
-            nuevo_ancho = max(1, int(sprite.get_width() * factor))
-            nuevo_alto = max(1, int(sprite.get_height() * factor))
-            sprite_dibujar = pygame.transform.scale(sprite, (nuevo_ancho, nuevo_alto))
+            sprite_dibujar = self.cache_efectos.sprite_escalado(sprite, jugador.escala_visual)
             dibujar_rect = sprite_dibujar.get_rect(center=desplazado.center)
 
-        # Auras (varias capas de color)
-        for aura in sorted(jugador.auras, key=lambda a: a.get("size", 0), reverse=True):
-            color = aura.get("color")
-            size = max(4, aura.get("size", 0))
-            if color:
-                base_radio = max(dibujar_rect.width, dibujar_rect.height) // 2
-                radio = base_radio + size // 2
-                pygame.draw.circle(
-                    self.ventana,
-                    color,
-                    dibujar_rect.center,
-                    radio,
-                    width=max(2, size // 3),
-                )
+        # Auras (varias capas de color, pre-compuestas en un solo anillo)
+        if jugador.auras:
+            anillo = self.cache_efectos.anillo_auras(jugador.auras, dibujar_rect.width, dibujar_rect.height)
+            if anillo is not None:
+                superficie, (dx, dy) = anillo
+                self.ventana.blit(superficie, (dibujar_rect.centerx + dx, dibujar_rect.centery + dy))
 
         self.ventana.blit(sprite_dibujar, dibujar_rect)
 
-    def actualizar_pantalla(self):
-        """Actualiza la pantalla para mostrar los cambios"""
-        pygame.display.flip()
+    def actualizar_pantalla(self, areas=None):
+        """Actualiza la pantalla para mostrar los cambios.
+
+        Args:
+            areas: lista de Rect modificados (dirty rects); None actualiza toda la pantalla
+        """
+        if self.superposicion is not None:
+            area = self.superposicion.dibujar(self.ventana)
+            if area is not None and areas is not None:
+                areas = list(areas) + [area]
+        if areas is None:
+            pygame.display.flip()
+        elif areas:
+            pygame.display.update(areas)
 
     def get_altura_suelo(self):
         """Retorna la altura del suelo"""
@@ -1,5 +1,5 @@
 import pygame
-import os
+from v.atlas_sprites import atlas_compartido
 
 
 class SpriteLoader:
@@ -12,26 +12,13 @@ class SpriteLoader:
         self.tamano_sprite = (64, 64)
 
     def cargar_sprites(self):
-        """Carga el sprite del jugador"""
-        sprite_path = os.path.join(self.base_path, "Jugador.png")
-
-        if os.path.exists(sprite_path):
-            # Cargar sprite del jugador
-            sprite = pygame.image.load(sprite_path).convert_alpha()
-            sprite = pygame.transform.scale(sprite, self.tamano_sprite)
-            self.sprite_derecha = sprite
-            self.sprite_izquierda = pygame.transform.flip(sprite, True, False)
-        else:
-            # Fallback: círculo blanco
-            circle = pygame.Surface(self.tamano_sprite, pygame.SRCALPHA)
-            pygame.draw.circle(
-                circle,
-                (255, 255, 255),
-                (self.tamano_sprite[0] // 2, self.tamano_sprite[1] // 2),
-                self.tamano_sprite[0] // 2,
-            )
-            self.sprite_derecha = circle
-            self.sprite_izquierda = pygame.transform.flip(circle, True, False)
+        """Toma el sprite del jugador del atlas compartido con SpriteManager"""
+        atlas = atlas_compartido(self.base_path)
+        self.sprite_derecha = atlas.get("jugador")
+        self.sprite_izquierda = atlas.get("jugador_izq")
+        if self.sprite_derecha.get_size() != self.tamano_sprite:
+            self.sprite_derecha = pygame.transform.scale(self.sprite_derecha, self.tamano_sprite)
+            self.sprite_izquierda = pygame.transform.flip(self.sprite_derecha, True, False)
 
     def get_sprite(self, mirando_derecha, moviendo, frame):
         """Obtiene el sprite apropiado según la dirección del jugador"""
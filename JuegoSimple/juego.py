@@ -3,6 +3,7 @@ import sys
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from enum import Enum
+from collections import OrderedDict
 
 # ============================================
 # PATRÓN COMMAND - Cada acción es un comando
@@ -190,6 +191,58 @@ class GameController:
         return last_command.undo()
 
 
+# ============================================
+# CACHE DE TEXTOS - Evita re-renderizar textos repetidos cada frame
+# ============================================
+
+class TextCache:
+    """Cache LRU de superficies de texto con clave (fuente, texto, color, antialias)"""
+    
+    def __init__(self, max_entries: int = 128, max_bytes: int = 2 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.surfaces = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+    
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Equivalente a font.render(text, antialias, color), usando la cache"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        self.used_bytes += self._size_of(surface)
+        # Descarta las menos usadas recientemente (siempre queda la nueva)
+        while len(self.surfaces) > 1 and (
+            len(self.surfaces) > self.max_entries or self.used_bytes > self.max_bytes
+        ):
+            _, old = self.surfaces.popitem(last=False)
+            self.used_bytes -= self._size_of(old)
+        return surface
+    
+    def stats(self) -> dict:
+        """Contadores de uso de la cache"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.surfaces),
+            "bytes": self.used_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
 # ============================================
 # VISTA - Interfaz gráfica con Pygame
 # Principio SOLID: Single Responsibility - solo maneja UI
@@ -207,6 +260,7 @@ class GameView:
         
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self.text_cache = TextCache()
         self.clock = pygame.time.Clock()
     
     def draw_character(self, character: Character, is_player: bool):
@@ -215,7 +269,7 @@ class GameView:
         pygame.draw.circle(self.screen, character.color, (character.x, character.y), 40)
         
         # Nombre
-        name_text = self.small_font.render(character.name, True, (255, 255, 255))
+        name_text = self.text_cache.render(self.small_font, character.name, (255, 255, 255))
         self.screen.blit(name_text, (character.x - 40, character.y - 80))
         
         # Barra de HP
@@ -231,17 +285,17 @@ class GameView:
                         (character.x - 40, character.y + 50, int(hp_bar_width * hp_percentage), hp_bar_height))
         
         # Texto HP
-        hp_text = self.small_font.render(f"HP: {character.hp}/{character.max_hp}", True, (255, 255, 255))
+        hp_text = self.text_cache.render(self.small_font, f"HP: {character.hp}/{character.max_hp}", (255, 255, 255))
         self.screen.blit(hp_text, (character.x - 40, character.y + 65))
         
         # Defensa si está activa
         if character.defense > 0:
-            def_text = self.small_font.render(f"DEF: {character.defense}", True, (100, 150, 255))
+            def_text = self.text_cache.render(self.small_font, f"DEF: {character.defense}", (100, 150, 255))
             self.screen.blit(def_text, (character.x - 40, character.y + 85))
         
         # Pociones si es jugador
         if is_player:
-            pot_text = self.small_font.render(f"Pociones: {character.potions}", True, (255, 200, 0))
+            pot_text = self.text_cache.render(self.small_font, f"Pociones: {character.potions}", (255, 200, 0))
             self.screen.blit(pot_text, (character.x - 40, character.y + 105))
     
     def draw_buttons(self):
@@ -254,14 +308,14 @@ class GameView:
         ]
         
         for text, x, y in buttons:
-            button_text = self.small_font.render(text, True, (255, 255, 255))
+            button_text = self.text_cache.render(self.small_font, text, (255, 255, 255))
             pygame.draw.rect(self.screen, (50, 50, 50), (x, y, 120, 40))
             self.screen.blit(button_text, (x + 10, y + 10))
     
     def draw_message(self, message: str):
         """Dibuja el mensaje de acción"""
         if message:
-            msg_text = self.small_font.render(message, True, (255, 255, 0))
+            msg_text = self.text_cache.render(self.small_font, message, (255, 255, 0))
             pygame.draw.rect(self.screen, (0, 0, 0), (50, 400, 700, 50))
             self.screen.blit(msg_text, (60, 410))
     
@@ -270,7 +324,7 @@ class GameView:
         self.screen.fill((20, 20, 40))
         
         # Título
-        title = self.font.render("RPG - Patrones de Diseño", True, (255, 255, 255))
+        title = self.text_cache.render(self.font, "RPG - Patrones de Diseño", (255, 255, 255))
         self.screen.blit(title, (200, 20))
         
         self.draw_character(player, True)